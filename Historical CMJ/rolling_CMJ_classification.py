@@ -1,8 +1,14 @@
 import os
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from jump_pipeline.test_engine import run_tests
+from jump_pipeline.class_codes import AVG, base_codes
+from jump_pipeline.cell_format import format_frame, value_spec
+from jump_pipeline.process_pool import map_in_pool
+from jump_pipeline.pdf_tables import table_pdf, add_table, table_digest, document_renderer
+from jump_pipeline.site_manifest import page_fingerprint, load_manifest, save_manifest, page_is_current, template_version
+from jump_pipeline.vald_schema import MissingColumnsError
 
 # -------------------------------------------------------------
 # FILE PATHS
@@ -14,424 +20,72 @@ OUTPUT_ABS_CSV   = os.path.join(ROOT, "Absorption_Daily_Classes.csv")
 OUTPUT_TEAM_CSV  = os.path.join(ROOT, "Team_CMJ_Snapshot.csv")
 PDF_OUTPUT_DIR   = os.path.join(ROOT, "Player_PDFs")
 TEAM_PDF_PATH    = os.path.join(ROOT, "CMJ_Team_Overview.pdf")
+CACHE_DIR        = os.path.join(ROOT, "_export_cache")
+BASELINE_FILE    = os.path.join(ROOT, "CMJ_Baseline_State.json")
+PDF_MANIFEST_FILE = os.path.join(ROOT, "CMJ_PDF_Manifest.json")
 
 PLAYER_COL = "Name"
 DATE_COL   = "Date"
+TEST_TYPE  = "CMJ"
+
+OUTPUTS = {
+    "CMJ": {
+        "Generation": OUTPUT_GEN_CSV,
+        "Absorption": OUTPUT_ABS_CSV,
+        "Team":       OUTPUT_TEAM_CSV,
+    },
+}
 
-# -------------------------------------------------------------
-# 1. LOAD & CLEAN HEADERS
-# -------------------------------------------------------------
-df = pd.read_csv(INPUT_FILE)
-
-df.columns = (
-    df.columns.astype(str)
-      .str.replace('\ufeff', '', regex=False)   # BOM
-      .str.replace('\xa0', ' ', regex=False)    # non-breaking space
-      .str.strip()
-)
-
-# -------------------------------------------------------------
-# 2. PREP DATE + SORT
-# -------------------------------------------------------------
-if PLAYER_COL not in df.columns or DATE_COL not in df.columns:
-    raise SystemExit(
-        f"'{PLAYER_COL}' or '{DATE_COL}' column missing.\n"
-        f"Columns: {df.columns.tolist()}"
-    )
-
-df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="coerce")
-df = df.dropna(subset=[PLAYER_COL, DATE_COL]).sort_values([PLAYER_COL, DATE_COL])
-
-# -------------------------------------------------------------
-# 3. DEFINE PARAMETER SETS
-#   NOTE: DEPTH INCLUDED IN GENERATION OUTPUT (per your request)
-# -------------------------------------------------------------
-GENERATION_PARAMS = [
-    "Concentric Duration [ms]",              # PD
-    "Countermovement Depth [cm]",            # DEP (now included)
-    "Concentric Mean Force / BM [N/kg]",     # PF
-]
-
-ABSORPTION_PARAMS = [
-    "Braking Phase Duration [ms]",           # BD
-    "Countermovement Depth [cm]",            # DEP
-    "Eccentric Mean Force / BM [N/kg]",      # BF (created below)
-]
-
-OTHER_PARAMS = [
-    "BW [KG]",
-    "Jump Height (Imp-Mom) [cm]",
-]
-
-# -------------------------------------------------------------
-# 4. COERCE BASE NUMERICS
-# -------------------------------------------------------------
-if "BW [KG]" not in df.columns:
-    raise SystemExit("Required column 'BW [KG]' not found.")
-df["BW [KG]"] = pd.to_numeric(df["BW [KG]"], errors="coerce")
-
-# Coerce any existing fields to numeric
-for c in (GENERATION_PARAMS + OTHER_PARAMS + ["Eccentric Deceleration Mean Force [N]"]):
-    if c in df.columns:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-
-# -------------------------------------------------------------
-# 5. CREATE Eccentric Mean Force / BM [N/kg] (ROUNDED 1 DECIMAL)
-#    = Eccentric Deceleration Mean Force [N] / BW [KG]
-# -------------------------------------------------------------
-needed = ["Eccentric Deceleration Mean Force [N]", "BW [KG]"]
-for col in needed:
-    if col not in df.columns:
-        raise SystemExit(
-            f"Required column {col!r} not found.\n"
-            f"Available columns: {df.columns.tolist()}"
-        )
-
-df["Eccentric Mean Force / BM [N/kg]"] = (
-    df["Eccentric Deceleration Mean Force [N]"] / df["BW [KG]"]
-).round(1)
-
-# -------------------------------------------------------------
-# 6. FINALIZE PARAM LISTS (include created column)
-# -------------------------------------------------------------
-ALL_PARAMS = list(dict.fromkeys(GENERATION_PARAMS + ABSORPTION_PARAMS + OTHER_PARAMS))
-ALL_PARAMS = [p for p in ALL_PARAMS if p in df.columns]
-
-GENERATION_PARAMS = [p for p in GENERATION_PARAMS if p in ALL_PARAMS]
-ABSORPTION_PARAMS = [p for p in ABSORPTION_PARAMS if p in ALL_PARAMS]
-OTHER_PARAMS      = [p for p in OTHER_PARAMS      if p in ALL_PARAMS]
-
-print("Generation parameters:", GENERATION_PARAMS)
-print("Absorption parameters:", ABSORPTION_PARAMS)
-print("Standalone classified params:", OTHER_PARAMS)
-
-# -------------------------------------------------------------
-# 7. TREAT 0 AS MISSING FOR CMJ METRICS
-# -------------------------------------------------------------
-for c in ALL_PARAMS:
-    if c in df.columns:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-        df.loc[df[c] == 0, c] = np.nan
-
-# -------------------------------------------------------------
-# 8. PARAMETER-LEVEL ROLLING CLASSIFICATION
-#    - ignore missing days
-#    - first 2 valid trials per player+param => z=0 => class Avg
-#    - add "{param}_avg_prev" rounded 1 decimal
-#
-# IMPORTANT: Depth is now POSITIVE in your dataset:
-#   High depth = deeper = bigger value => z>=1 => High
-#   Low  depth = shallower = smaller value => z<=-1 => Low
-# -------------------------------------------------------------
-def classify_z(z):
-    if pd.isna(z):
-        return "Avg"
-    if z >= 1:
-        return "High"
-    if z <= -1:
-        return "Low"
-    return "Avg"
-
-for param in ALL_PARAMS:
-    if param not in df.columns:
-        continue
-
-    g = df.groupby(PLAYER_COL)[param]
-
-    count_prev = (
-        g.apply(lambda s: s.expanding(min_periods=1).count().shift(1))
-         .reset_index(level=0, drop=True)
-    )
-
-    mean_prev = (
-        g.apply(lambda s: s.expanding(min_periods=1).mean().shift(1))
-         .reset_index(level=0, drop=True)
-    )
-
-    sd_prev = (
-        g.apply(lambda s: s.expanding(min_periods=2).std(ddof=1).shift(1))
-         .reset_index(level=0, drop=True)
-    )
-
-    # prior average column, rounded
-    df[f"{param}_avg_prev"] = mean_prev.round(1)
-
-    z_raw = (df[param] - mean_prev) / sd_prev
-    z = pd.Series(np.nan, index=df.index, dtype="float64")
-
-    has_current = df[param].notna()
-    enough_history = count_prev.ge(2)
-    sd_ok = sd_prev.notna() & (sd_prev != 0)
-
-    mask_normal = has_current & enough_history & sd_ok
-    z.loc[mask_normal] = z_raw.loc[mask_normal]
-
-    # first two valid trials OR sd missing/0 => Avg
-    mask_force_avg = has_current & (~enough_history | ~sd_ok)
-    z.loc[mask_force_avg] = 0.0
-
-    df[f"{param}_z"] = z
-    df[f"{param}_class"] = df[f"{param}_z"].apply(classify_z)
-
-# -------------------------------------------------------------
-# 9. DAY-LEVEL GENERATION & ABSORPTION CLASSIFICATION
-#    - if required RAW inputs missing => overall class blank
-#    - NEW: Generation overall now uses PD + DEP + PF with your updated logic
-#    - NEW: Absorption overall uses BD + DEP + BF with your updated logic
-# -------------------------------------------------------------
-def classify_generation(pd_class, dep_class, pf_class):
-    if pd.isna(pd_class) or pd.isna(dep_class) or pd.isna(pf_class):
-        return ""
-    PD, DEP, PF = str(pd_class), str(dep_class), str(pf_class)
-
-    # If PD & DEP both HIGH:
-    if PD == "High" and DEP == "High":
-        if PF == "High":
-            return "Avg"
-        if PF in ("Low", "Avg"):
-            return "Low"
-
-    # If PD & DEP both LOW:
-    if PD == "Low" and DEP == "Low":
-        if PF == "Low":
-            return "Avg"
-        if PF in ("High", "Avg"):
-            return "High"
-
-    # If exactly one of PD / DEP is HIGH:
-    if (PD == "High" and DEP == "Avg") or (PD == "Avg" and DEP == "High"):
-        if PD == "High" and DEP == "Avg":
-            # PD High + DEP Avg
-            if PF in ("Avg", "Low"):
-                return "Low"
-            if PF == "High":
-                return "High"
-        else:
-            # DEP High + PD Avg
-            if PF in ("Avg", "High"):
-                return "High"
-            if PF == "Low":
-                return "Low"
-
-    # If exactly one of PD / DEP is LOW:
-    if (PD == "Low" and DEP == "Avg") or (PD == "Avg" and DEP == "Low"):
-        if PD == "Low" and DEP == "Avg":
-            if PF == "Low":
-                return "Low"
-            # PF Avg or High
-            return "High"
-        else:
-            # DEP Low + PD Avg
-            if PF in ("Avg", "Low"):
-                return "Low"
-            if PF == "High":
-                return "High"
-
-    # PD & DEP both NORMAL:
-    if PD == "Avg" and DEP == "Avg":
-        if PF == "High":
-            return "High"
-        if PF == "Low":
-            return "Low"
-        return "Avg"
-
-    # If one HIGH, one LOW (PD vs DEP):
-    if PD == "Low" and DEP == "High":
-        return "High"
-    if PD == "High" and DEP == "Low":
-        return "Low"
-
-    return "Avg"
-
-def classify_absorption(bd_class, dep_class, bf_class):
-    if pd.isna(bd_class) or pd.isna(dep_class) or pd.isna(bf_class):
-        return ""
-    BD, DEP, BF = str(bd_class), str(dep_class), str(bf_class)
-
-    # If BD & DEP both HIGH:
-    if BD == "High" and DEP == "High":
-        if BF == "High":
-            return "Avg"
-        # BF Avg or Low
-        return "High"
-
-    # If BD & DEP both LOW:
-    if BD == "Low" and DEP == "Low":
-        if BF == "Low":
-            return "Avg"
-        # BF Avg or High
-        return "Low"
-
-    # If exactly one of BD/DEP is HIGH:
-    if (BD == "High" and DEP == "Avg") or (BD == "Avg" and DEP == "High"):
-        if BD == "High" and DEP == "Avg":
-            if BF in ("Avg", "Low"):
-                return "Low"
-            if BF == "High":
-                return "High"
-        else:
-            # DEP High + BD Avg
-            if BF in ("Avg", "High"):
-                return "High"
-            if BF == "Low":
-                return "Low"
-
-    # If exactly one of BD/DEP is LOW:
-    if (BD == "Low" and DEP == "Avg") or (BD == "Avg" and DEP == "Low"):
-        if BD == "Low" and DEP == "Avg":
-            if BF == "Low":
-                return "Low"
-            # BF Avg or High
-            return "High"
-        else:
-            # DEP Low + BD Avg
-            if BF in ("Avg", "Low"):
-                return "Low"
-            if BF == "High":
-                return "High"
-
-    # BD & DEP both NORMAL:
-    if BD == "Avg" and DEP == "Avg":
-        if BF == "High":
-            return "High"
-        if BF == "Low":
-            return "Low"
-        return "Avg"
-
-    # If one HIGH, one LOW (BD vs DEP):
-    if BD == "Low" and DEP == "High":
-        return "High"
-    if BD == "High" and DEP == "Low":
-        return "Low"
-
-    return "Avg"
-
-# Column handles
-pd_col    = "Concentric Duration [ms]"
-pf_col    = "Concentric Mean Force / BM [N/kg]"
-bd_col    = "Braking Phase Duration [ms]"
-dep_col   = "Countermovement Depth [cm]"
-bf_col    = "Eccentric Mean Force / BM [N/kg]"
-
-pd_class_col = f"{pd_col}_class"
-pf_class_col = f"{pf_col}_class"
-bd_class_col = f"{bd_col}_class"
-dep_class_col = f"{dep_col}_class"
-bf_class_col = f"{bf_col}_class"
-
-df["Generation_Class"] = ""
-df["Absorption_Class"] = ""
-
-required_gen_raw = [c for c in [pd_col, dep_col, pf_col] if c in df.columns]
-required_abs_raw = [c for c in [bd_col, dep_col, bf_col] if c in df.columns]
-
-if required_gen_raw:
-    mask_gen = df[required_gen_raw].notna().all(axis=1)
-    df.loc[mask_gen, "Generation_Class"] = df.loc[mask_gen].apply(
-        lambda r: classify_generation(r.get(pd_class_col), r.get(dep_class_col), r.get(pf_class_col)),
-        axis=1
-    )
-
-if required_abs_raw:
-    mask_abs = df[required_abs_raw].notna().all(axis=1)
-    df.loc[mask_abs, "Absorption_Class"] = df.loc[mask_abs].apply(
-        lambda r: classify_absorption(r.get(bd_class_col), r.get(dep_class_col), r.get(bf_class_col)),
-        axis=1
-    )
-
-# -------------------------------------------------------------
-# 10. DROP ROWS WITH NO CMJ DATA
-# -------------------------------------------------------------
-DATA_GATE_COLS = []
-for c in (["Jump Height (Imp-Mom) [cm]"] + GENERATION_PARAMS + ABSORPTION_PARAMS):
-    if c in df.columns and c != "BW [KG]":
-        DATA_GATE_COLS.append(c)
-DATA_GATE_COLS = list(dict.fromkeys(DATA_GATE_COLS))
-
-if DATA_GATE_COLS:
-    CMJ_DATA_MASK = df[DATA_GATE_COLS].notna().any(axis=1)
-else:
-    CMJ_DATA_MASK = pd.Series(True, index=df.index)
-
-df = df.loc[CMJ_DATA_MASK].copy()
-
-# -------------------------------------------------------------
-# 11. BUILD GENERATION & ABSORPTION DATAFRAMES
-#     - Generation now includes Depth (same values/classes as absorption)
-# -------------------------------------------------------------
-base_cols = [PLAYER_COL, DATE_COL]
-
-gen_value_params = GENERATION_PARAMS + OTHER_PARAMS
-abs_value_params = ABSORPTION_PARAMS + OTHER_PARAMS
-
-gen_cols = (
-    base_cols
-    + gen_value_params
-    + [f"{p}_avg_prev" for p in gen_value_params if f"{p}_avg_prev" in df.columns]
-    + [f"{p}_z" for p in gen_value_params if f"{p}_z" in df.columns]
-    + [f"{p}_class" for p in gen_value_params if f"{p}_class" in df.columns]
-    + ["Generation_Class"]
-)
-
-abs_cols = (
-    base_cols
-    + abs_value_params
-    + [f"{p}_avg_prev" for p in abs_value_params if f"{p}_avg_prev" in df.columns]
-    + [f"{p}_z" for p in abs_value_params if f"{p}_z" in df.columns]
-    + [f"{p}_class" for p in abs_value_params if f"{p}_class" in df.columns]
-    + ["Absorption_Class"]
-)
-
-gen_cols = [c for c in gen_cols if c in df.columns]
-abs_cols = [c for c in abs_cols if c in df.columns]
-
-df_gen = df[gen_cols].copy()
-df_abs = df[abs_cols].copy()
-
-# -------------------------------------------------------------
-# 12. TEAM-LEVEL SNAPSHOT (TTD, LTD, BW, JH, ABS, GEN)
-# -------------------------------------------------------------
-agg = (
-    df.groupby(PLAYER_COL)[DATE_COL]
-      .agg(TTD="count", LTD="max")
-      .reset_index()
-)
-
-last_idx = df.groupby(PLAYER_COL)[DATE_COL].idxmax()
-
-cols_last = [
-    PLAYER_COL,
-    DATE_COL,
-    "BW [KG]",
-    "BW [KG]_class",
-    "Jump Height (Imp-Mom) [cm]",
-    "Jump Height (Imp-Mom) [cm]_class",
-    "Absorption_Class",
-    "Generation_Class",
-]
-cols_last = [c for c in cols_last if c in df.columns]
-
-df_last = df.loc[last_idx, cols_last].rename(columns={DATE_COL: "LTD"})
-
-team_df = agg.merge(df_last, on=[PLAYER_COL, "LTD"], how="left")
-team_df = team_df.sort_values("LTD", ascending=False)
-
-team_out_cols = [PLAYER_COL, "TTD", "LTD", "BW [KG]", "Jump Height (Imp-Mom) [cm]", "Absorption_Class", "Generation_Class"]
-team_out_cols = [c for c in team_out_cols if c in team_df.columns]
+# "full"        -> rebuild every class from the whole export (and reseed the baseline state)
+# "incremental" -> classify only tests newer than the stored baseline watermark and
+#                  append them to the daily CSVs (falls back to "full" on the first run)
+# "streaming"   -> same result as "full", but the export is read in chunks and
+#                  classified in buckets of whole players, so memory stays flat
+#                  for very large multi-season exports
+RUN_MODE = "full"
+
+# Player PDFs: 1 -> drawn one after another in this process;
+# N > 1 -> spread over N worker processes (None -> one per CPU)
+PDF_WORKERS = 1
+
+# Table PDFs: "native"     -> vector pages written directly (small files, fast);
+#                             a PDF with text outside cp1252 uses matplotlib
+#             "matplotlib" -> one matplotlib figure per table page
+PDF_RENDERER = "native"
+
+# Rows per PDF page; longer histories continue on further pages with the
+# header repeated (None -> one page per table, as tall as the history)
+PDF_ROWS_PER_PAGE = 30
+
+# False -> only redraw the PDFs whose table rows, drawing code or PDF
+# settings changed since the last run (see PDF_MANIFEST_FILE);
+# True -> redraw every player PDF and the team overview
+REBUILD_ALL_PDFS = False
+
+# -------------------------------------------------------------
+# 1. LOAD, CLASSIFY, SAVE CSVs + BASELINE STATE + TEAM SNAPSHOT
+#    The steps live in jump_pipeline/test_engine.py and are driven by
+#    the "CMJ" entry of jump_pipeline/test_specs.py (parameter sets,
+#    derived Eccentric Mean Force / BM, Generation / Absorption rules).
+#    Required columns are checked against the export header first.
+#    (Sections 1 and 3 only run in the main process: PDF pool workers
+#    that re-import this script just need the drawing code.)
+# -------------------------------------------------------------
+if __name__ == "__main__":
+    try:
+        run = run_tests({TEST_TYPE: INPUT_FILE}, ["CMJ"], OUTPUTS, {TEST_TYPE: BASELINE_FILE}, RUN_MODE, cache_dir=CACHE_DIR)
+    except MissingColumnsError as e:
+        raise SystemExit(str(e))
 
-team_df[team_out_cols].to_csv(OUTPUT_TEAM_CSV, index=False)
-print("Saved Team snapshot CSV to:", OUTPUT_TEAM_CSV)
+    if run is None:
+        raise SystemExit(0)
 
-# -------------------------------------------------------------
-# 13. SAVE CSVs
-# -------------------------------------------------------------
-df_gen.to_csv(OUTPUT_GEN_CSV, index=False)
-df_abs.to_csv(OUTPUT_ABS_CSV, index=False)
-print("Saved Generation CSV to:", OUTPUT_GEN_CSV)
-print("Saved Absorption CSV to:", OUTPUT_ABS_CSV)
+    team_df = run["team"]["CMJ"]
+    GENERATION_PARAMS = run["params"]["CMJ"]["Generation"]
+    ABSORPTION_PARAMS = run["params"]["CMJ"]["Absorption"]
 
 # -------------------------------------------------------------
-# 14. PDF SETTINGS (COLORS, LABELS)
+# 2. PDF SETTINGS (COLORS, LABELS)
 # -------------------------------------------------------------
 os.makedirs(PDF_OUTPUT_DIR, exist_ok=True)
 
@@ -464,93 +118,55 @@ def display_name(col):
         return f"{DISPLAY_LABELS.get(base, base)}\nAvg(prev)"
     return DISPLAY_LABELS.get(col, col)
 
-def format_value(col, val):
-    if pd.isna(val) or val == "":
-        return ""
-    if col in (DATE_COL, "LTD"):
-        return pd.to_datetime(val).strftime("%Y-%m-%d")
-    if col == "TTD":
-        return f"{int(val)}"
-    if col in ["Concentric Duration [ms]", "Braking Phase Duration [ms]"]:
-        try:
-            return f"{int(round(float(val)))}"
-        except Exception:
-            return str(val)
-    try:
-        return f"{float(val):.1f}"
-    except Exception:
-        return str(val)
-
-def class_to_arrow(text):
-    if text == "High":
-        return "↑"
-    if text == "Low":
-        return "↓"
-    if text == "Avg":
-        return "→"
-    return ""
-
-def add_table_page(pdf, player_name, title, df_player, value_cols, class_map):
+# phase class columns show as arrows
+ARROW_COLS = ("Generation_Class", "Absorption_Class")
+
+# (face, text) by Low/Avg/High code; last entry: blank class (code -1)
+COLORS_BY_CODE = [(COLOR_MAP[c]["face"], COLOR_MAP[c]["text"]) for c in ["Low", "Avg", "High", ""]]
+
+def cell_specs(cols):
+    # column -> cell format (see jump_pipeline/cell_format.py)
+    specs = {}
+    for c in cols:
+        if c in (DATE_COL, "LTD"):
+            specs[c] = "date"
+        elif c == PLAYER_COL:
+            specs[c] = "text"
+        elif c in ARROW_COLS:
+            specs[c] = "arrow"
+        else:
+            specs[c] = value_spec(c)
+    return specs
+
+def class_colors(df, class_source):
+    # (face, text) per row; columns without a class source show as Avg
+    if class_source not in df.columns:
+        return [COLORS_BY_CODE[AVG]] * len(df)
+    return [COLORS_BY_CODE[c] for c in base_codes(df[class_source])]
+
+def player_table(player_name, title, df_player, value_cols, class_map):
     if df_player.empty:
-        return
+        return None
 
     df_player = df_player.sort_values(DATE_COL, ascending=False)
 
     cols = [DATE_COL] + value_cols
     header_labels = [display_name(c) for c in cols]
 
-    data_rows = []
-    for _, row in df_player.iterrows():
-        row_vals = [format_value(DATE_COL, row[DATE_COL])]
-        for col in value_cols:
-            raw_val = row.get(col, "")
-            disp = format_value(col, raw_val)
-            if col in ("Generation_Class", "Absorption_Class"):
-                disp = class_to_arrow(disp)
-            row_vals.append(disp)
-        data_rows.append(row_vals)
-
-    n_rows = len(data_rows)
-    n_cols = len(cols)
-
-    fig_width  = max(8, n_cols * 1.3)
-    fig_height = max(4, n_rows * 0.4 + 2)
-
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-    ax.axis("off")
-
-    table = ax.table(cellText=data_rows, colLabels=header_labels, loc="center")
-    table.auto_set_font_size(False)
-    table.set_fontsize(8)
-    table.scale(1.1, 1.3)
-
-    for (r, c), cell in table.get_celld().items():
-        if r == 0:
-            cell.set_facecolor("black")
-            cell.get_text().set_color("white")
-            cell.get_text().set_fontweight("bold")
-
-    for r_idx, (_, row) in enumerate(df_player.iterrows(), start=1):
-        for c_idx, col in enumerate(cols):
-            if col == DATE_COL:
-                continue
-            cell = table[r_idx, c_idx]
-            class_source = class_map.get(col)
-            cls = row.get(class_source, "Avg") if class_source else "Avg"
-            if cls not in COLOR_MAP:
-                cls = "Avg"
-            colors = COLOR_MAP[cls]
-            cell.set_facecolor(colors["face"])
-            cell.get_text().set_color(colors["text"])
-
-    ax.set_title(f"{player_name} - {title} Classification", fontsize=12, pad=12)
-    plt.tight_layout()
-    pdf.savefig(fig)
-    plt.close(fig)
-
-def add_team_overview(pdf, team_df_in):
+    cells = format_frame(df_player, cell_specs(cols))[cols]
+    col_colors = [[None] * len(df_player)] + [class_colors(df_player, class_map.get(c)) for c in value_cols]
+
+    return {
+        "title": f"{player_name} - {title} Classification",
+        "header": header_labels,
+        "rows": cells.to_numpy().tolist(),
+        "colors": [list(colors) for colors in zip(*col_colors)],
+        "fit_columns": False,
+    }
+
+def team_table(team_df_in):
     if team_df_in.empty:
-        return
+        return None
 
     df_team = team_df_in.sort_values("LTD", ascending=False)
 
@@ -566,42 +182,6 @@ def add_team_overview(pdf, team_df_in):
     cols = [c for c in cols if c in df_team.columns]
     header_labels = [display_name(c) for c in cols]
 
-    data_rows = []
-    for _, row in df_team.iterrows():
-        row_vals = []
-        for col in cols:
-            raw_val = row.get(col, "")
-            disp = format_value(col, raw_val)
-            if col in ("Absorption_Class", "Generation_Class"):
-                disp = class_to_arrow(disp)
-            row_vals.append(disp)
-        data_rows.append(row_vals)
-
-    n_rows = len(data_rows)
-    n_cols = len(cols)
-
-    fig_width  = max(8, n_cols * 1.3)
-    fig_height = max(4, n_rows * 0.4 + 2)
-
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-    ax.axis("off")
-
-    table = ax.table(cellText=data_rows, colLabels=header_labels, loc="center")
-    table.auto_set_font_size(False)
-    table.set_fontsize(8)
-    table.scale(1.1, 1.3)
-
-    try:
-        table.auto_set_column_width(col=list(range(n_cols)))
-    except Exception:
-        pass
-
-    for (r, c), cell in table.get_celld().items():
-        if r == 0:
-            cell.set_facecolor("black")
-            cell.get_text().set_color("white")
-            cell.get_text().set_fontweight("bold")
-
     class_map_team = {
         "BW [KG]": "BW [KG]_class",
         "Jump Height (Imp-Mom) [cm]": "Jump Height (Imp-Mom) [cm]_class",
@@ -609,64 +189,126 @@ def add_team_overview(pdf, team_df_in):
         "Generation_Class": "Generation_Class",
     }
 
-    for r_idx, (_, row) in enumerate(df_team.iterrows(), start=1):
-        for c_idx, col in enumerate(cols):
-            if col in [PLAYER_COL, "TTD", "LTD"]:
-                continue
-            cell = table[r_idx, c_idx]
-            source = class_map_team.get(col)
-            cls = row.get(source, "Avg") if source else "Avg"
-            if cls not in COLOR_MAP:
-                cls = "Avg"
-            colors = COLOR_MAP[cls]
-            cell.set_facecolor(colors["face"])
-            cell.get_text().set_color(colors["text"])
-
-    ax.set_title("CMJ Team Overview (Latest Test Per Player)", fontsize=12, pad=12)
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
-    pdf.savefig(fig)
-    plt.close(fig)
-
-# -------------------------------------------------------------
-# 15. BUILD PER-PLAYER & TEAM PDFs
-# -------------------------------------------------------------
-unique_players = df[PLAYER_COL].dropna().unique()
-
-for player in unique_players:
-    safe_name = str(player).replace("/", "_").replace("\\", "_")
-    pdf_path = os.path.join(PDF_OUTPUT_DIR, f"{safe_name}_CMJ_Classification.pdf")
-
-    df_gen_p = df_gen[df_gen[PLAYER_COL] == player]
-    df_abs_p = df_abs[df_abs[PLAYER_COL] == player]
-
-    gen_value_cols = ["Generation_Class", "BW [KG]", "Jump Height (Imp-Mom) [cm]"] + GENERATION_PARAMS
-    abs_value_cols = ["Absorption_Class", "BW [KG]", "Jump Height (Imp-Mom) [cm]"] + ABSORPTION_PARAMS
-
-    gen_class_map = {
-        "Generation_Class": "Generation_Class",
-        "BW [KG]": "BW [KG]_class",
-        "Jump Height (Imp-Mom) [cm]": "Jump Height (Imp-Mom) [cm]_class",
-        "Concentric Duration [ms]": "Concentric Duration [ms]_class",
-        "Countermovement Depth [cm]": "Countermovement Depth [cm]_class",
-        "Concentric Mean Force / BM [N/kg]": "Concentric Mean Force / BM [N/kg]_class",
-    }
+    cells = format_frame(df_team, cell_specs(cols))[cols]
+    col_colors = [
+        [None] * len(df_team) if col in [PLAYER_COL, "TTD", "LTD"] else class_colors(df_team, class_map_team.get(col))
+        for col in cols
+    ]
 
-    abs_class_map = {
-        "Absorption_Class": "Absorption_Class",
-        "BW [KG]": "BW [KG]_class",
-        "Jump Height (Imp-Mom) [cm]": "Jump Height (Imp-Mom) [cm]_class",
-        "Braking Phase Duration [ms]": "Braking Phase Duration [ms]_class",
-        "Countermovement Depth [cm]": "Countermovement Depth [cm]_class",
-        "Eccentric Mean Force / BM [N/kg]": "Eccentric Mean Force / BM [N/kg]_class",
+    return {
+        "title": "CMJ Team Overview (Latest Test Per Player)",
+        "header": header_labels,
+        "rows": cells.to_numpy().tolist(),
+        "colors": [list(colors) for colors in zip(*col_colors)],
+        "fit_columns": True,
     }
 
-    with PdfPages(pdf_path) as pdf:
-        add_table_page(pdf, player, "Generation", df_gen_p, gen_value_cols, gen_class_map)
-        add_table_page(pdf, player, "Absorption", df_abs_p, abs_value_cols, abs_class_map)
+def write_tables_pdf(path, tables):
+    with table_pdf(path, document_renderer(path, tables, PDF_RENDERER), PDF_ROWS_PER_PAGE) as pdf:
+        for table in tables:
+            add_table(pdf, table)
 
-    print(f"Saved player PDF: {pdf_path}")
+def write_player_pdf(job):
+    # job = (player, pdf path, [table, ...]); errors come back to the
+    # caller instead of stopping the run
+    player, pdf_path, tables = job
+    try:
+        write_tables_pdf(pdf_path, tables)
+    except Exception as e:
+        return player, pdf_path, f"{type(e).__name__}: {e}"
+    return player, pdf_path, None
+
+# -------------------------------------------------------------
+# PDF FINGERPRINTS (incremental PDFs)
+#   the tables a PDF shows as drawn (cell text and colours), plus the
+#   jump_pipeline modules (pdf_tables.py draws them, cell_format.py /
+#   class_codes.py feed them) and renderer settings. The tables already
+#   carry everything this script decides, so editing a setting here
+#   (RUN_MODE, ...) does not redraw anything, and full, incremental and
+#   streaming runs agree on unchanged players. Kept per PDF file name
+#   in PDF_MANIFEST_FILE, the same way the overview site tracks its pages
+# -------------------------------------------------------------
+PDF_TEMPLATE_VERSION = template_version(settings=(PDF_RENDERER, PDF_ROWS_PER_PAGE))
+
+def pdf_fingerprint(name, tables):
+    return page_fingerprint(PDF_TEMPLATE_VERSION, name, table_digest(tables))
+
+# -------------------------------------------------------------
+# 3. BUILD PER-PLAYER & TEAM PDFs
+#    (only players whose tables changed are redrawn; incremental runs
+#    only list players with new tests to begin with. File names
+#    depend only on the player, so a pool run writes the same files)
+# -------------------------------------------------------------
+def player_pdf_jobs():
+    for player, frames in run["players"]:
+        df_gen_p = frames["CMJ"]["Generation"]
+        df_abs_p = frames["CMJ"]["Absorption"]
+
+        safe_name = str(player).replace("/", "_").replace("\\", "_")
+        pdf_path = os.path.join(PDF_OUTPUT_DIR, f"{safe_name}_CMJ_Classification.pdf")
+
+        gen_value_cols = ["Generation_Class", "BW [KG]", "Jump Height (Imp-Mom) [cm]"] + GENERATION_PARAMS
+        abs_value_cols = ["Absorption_Class", "BW [KG]", "Jump Height (Imp-Mom) [cm]"] + ABSORPTION_PARAMS
+
+        gen_class_map = {
+            "Generation_Class": "Generation_Class",
+            "BW [KG]": "BW [KG]_class",
+            "Jump Height (Imp-Mom) [cm]": "Jump Height (Imp-Mom) [cm]_class",
+            "Concentric Duration [ms]": "Concentric Duration [ms]_class",
+            "Countermovement Depth [cm]": "Countermovement Depth [cm]_class",
+            "Concentric Mean Force / BM [N/kg]": "Concentric Mean Force / BM [N/kg]_class",
+        }
+
+        abs_class_map = {
+            "Absorption_Class": "Absorption_Class",
+            "BW [KG]": "BW [KG]_class",
+            "Jump Height (Imp-Mom) [cm]": "Jump Height (Imp-Mom) [cm]_class",
+            "Braking Phase Duration [ms]": "Braking Phase Duration [ms]_class",
+            "Countermovement Depth [cm]": "Countermovement Depth [cm]_class",
+            "Eccentric Mean Force / BM [N/kg]": "Eccentric Mean Force / BM [N/kg]_class",
+        }
+
+        pages = [
+            ("Generation", df_gen_p, gen_value_cols, gen_class_map),
+            ("Absorption", df_abs_p, abs_value_cols, abs_class_map),
+        ]
+        tables = [player_table(player, *page) for page in pages]
+        yield player, pdf_path, [t for t in tables if t is not None]
+
+def stale_pdf_jobs(old_pdfs, pdfs, unchanged):
+    # records every listed player's fingerprint in pdfs, yields the jobs to redraw
+    for job in player_pdf_jobs():
+        name = os.path.basename(job[1])
+        pdfs[name] = pdf_fingerprint(job[0], job[2])
+        if page_is_current(old_pdfs, job[1], pdfs[name]):
+            unchanged.append(job[0])
+        else:
+            yield job
 
-with PdfPages(TEAM_PDF_PATH) as pdf:
-    add_team_overview(pdf, team_df)
+if __name__ == "__main__":
+    old_pdfs = {} if REBUILD_ALL_PDFS else load_manifest(PDF_MANIFEST_FILE)
+    pdfs = dict(old_pdfs)  # players an incremental run does not list keep their entry
+    unchanged = []
 
-print(f"Saved team overview PDF: {TEAM_PDF_PATH}")
+    failed = []
+    for player, pdf_path, error in map_in_pool(write_player_pdf, stale_pdf_jobs(old_pdfs, pdfs, unchanged), PDF_WORKERS):
+        if error is None:
+            print(f"Saved player PDF: {pdf_path}")
+        else:
+            print(f"FAILED player PDF for {player}: {error}")
+            failed.append(player)
+            pdfs.pop(os.path.basename(pdf_path))  # retried on the next run
+    print(f"Player PDFs: {len(unchanged)} unchanged.")
+
+    tables = [t for t in [team_table(team_df)] if t is not None]
+    key = pdf_fingerprint(os.path.basename(TEAM_PDF_PATH), tables)
+    if page_is_current(old_pdfs, TEAM_PDF_PATH, key):
+        print(f"Unchanged team overview PDF: {TEAM_PDF_PATH}")
+    else:
+        write_tables_pdf(TEAM_PDF_PATH, tables)
+        print(f"Saved team overview PDF: {TEAM_PDF_PATH}")
+    pdfs[os.path.basename(TEAM_PDF_PATH)] = key
+    save_manifest(PDF_MANIFEST_FILE, pdfs)
+
+    if failed:
+        raise SystemExit(f"{len(failed)} player PDF(s) failed: {', '.join(map(str, failed))}")
@@ -1,8 +1,14 @@
 import os
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from jump_pipeline.test_engine import run_tests
+from jump_pipeline.class_codes import AVG, base_codes
+from jump_pipeline.cell_format import format_frame, value_spec
+from jump_pipeline.process_pool import map_in_pool
+from jump_pipeline.pdf_tables import table_pdf, add_table, table_digest, document_renderer
+from jump_pipeline.site_manifest import page_fingerprint, load_manifest, save_manifest, page_is_current, template_version
+from jump_pipeline.vald_schema import MissingColumnsError
 
 # -------------------------------------------------------------
 # FILE PATHS (SINGLE-LEG JUMP)
@@ -20,450 +26,73 @@ OUTPUT_TEAM_CSV_R = os.path.join(ROOT, "Team_RSLJ_Snapshot.csv")
 
 PDF_OUTPUT_DIR    = os.path.join(ROOT, "Player_PDFs")
 TEAM_PDF_PATH     = os.path.join(ROOT, "SLJ_Team_Overview.pdf")
+CACHE_DIR         = os.path.join(ROOT, "_export_cache")
+BASELINE_FILE     = os.path.join(ROOT, "SLJ_Baseline_State.json")
+PDF_MANIFEST_FILE = os.path.join(ROOT, "SLJ_PDF_Manifest.json")
 
 PLAYER_COL = "Name"
 DATE_COL   = "Date"
+TEST_TYPE  = "SLJ"
+
+OUTPUTS = {
+    "SLJ_L": {
+        "Generation": OUTPUT_GEN_CSV_L,
+        "Absorption": OUTPUT_ABS_CSV_L,
+        "Team":       OUTPUT_TEAM_CSV_L,
+    },
+    "SLJ_R": {
+        "Generation": OUTPUT_GEN_CSV_R,
+        "Absorption": OUTPUT_ABS_CSV_R,
+        "Team":       OUTPUT_TEAM_CSV_R,
+    },
+}
 
-# -------------------------------------------------------------
-# 1. LOAD & CLEAN HEADERS
-# -------------------------------------------------------------
-df = pd.read_csv(INPUT_FILE)
-
-df.columns = (
-    df.columns.astype(str)
-      .str.replace('\ufeff', '', regex=False)   # BOM
-      .str.replace('\xa0', ' ', regex=False)    # non-breaking space
-      .str.strip()
-)
-
-# -------------------------------------------------------------
-# 2. PREP DATE + SORT
-# -------------------------------------------------------------
-if PLAYER_COL not in df.columns or DATE_COL not in df.columns:
-    raise SystemExit(
-        f"'{PLAYER_COL}' or '{DATE_COL}' column missing.\n"
-        f"Columns: {df.columns.tolist()}"
-    )
-
-df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="coerce")
-df = df.dropna(subset=[PLAYER_COL, DATE_COL]).sort_values([PLAYER_COL, DATE_COL])
-
-# -------------------------------------------------------------
-# 3. DEFINE PARAMETER SETS FOR L & R
-#    NOTE: DEPTH INCLUDED IN GENERATION OUTPUT PER LEG
-# -------------------------------------------------------------
-GENERATION_PARAMS = {}
-ABSORPTION_PARAMS = {}
-OTHER_PARAMS = {}
-ALL_PARAMS = []
-
-for leg in ["L", "R"]:
-    gen_params = [
-        f"Concentric Duration [ms] ({leg})",           # PD
-        f"Countermovement Depth [cm] ({leg})",         # DEP (now included)
-        f"Concentric Mean Force / BM [N/kg] ({leg})",  # PF
-    ]
-    abs_params = [
-        f"Braking Phase Duration [ms] ({leg})",        # BD
-        f"Countermovement Depth [cm] ({leg})",         # DEP
-        f"Eccentric Mean Force / BM [N/kg] ({leg})",   # BF (created below)
-    ]
-    other_params = [
-        "BW [KG]",
-        f"Jump Height (Imp-Mom) [cm] ({leg})",
-    ]
-
-    gen_params   = [p for p in gen_params   if p in df.columns]
-    abs_params   = [p for p in abs_params   if (p in df.columns) or ("Eccentric Mean Force / BM" in p)]
-    other_params = [p for p in other_params if p in df.columns]
-
-    GENERATION_PARAMS[leg] = gen_params
-    ABSORPTION_PARAMS[leg] = abs_params
-    OTHER_PARAMS[leg] = other_params
-
-    ALL_PARAMS.extend(gen_params + abs_params + other_params)
-
-ALL_PARAMS = list(dict.fromkeys(ALL_PARAMS))
-
-# -------------------------------------------------------------
-# 4. COERCE BASE NUMERICS (INCLUDING BW) BEFORE DERIVED METRICS
-# -------------------------------------------------------------
-if "BW [KG]" not in df.columns:
-    raise SystemExit("Required column 'BW [KG]' not found.")
-df["BW [KG]"] = pd.to_numeric(df["BW [KG]"], errors="coerce")
-
-for c in list(set(ALL_PARAMS + ["BW [KG]"])):  # ensure BW in coercion
-    if c in df.columns:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-
-# -------------------------------------------------------------
-# 5. CREATE ECCENTRIC MEAN FORCE / BM FOR L & R (ROUNDED 1 DECIMAL)
-# -------------------------------------------------------------
-for leg in ["L", "R"]:
-    edf_col = f"Eccentric Deceleration Mean Force [N] ({leg})"
-    emf_col = f"Eccentric Mean Force / BM [N/kg] ({leg})"
-
-    if edf_col not in df.columns:
-        raise SystemExit(
-            f"Required column {edf_col!r} not found.\n"
-            f"Available columns: {df.columns.tolist()}"
-        )
-
-    df[edf_col] = pd.to_numeric(df[edf_col], errors="coerce")
-    df[emf_col] = (df[edf_col] / df["BW [KG]"]).round(1)
+# "full" / "incremental" / "streaming": see rolling_CMJ_classification.py
+RUN_MODE = "full"
 
-    if emf_col not in ALL_PARAMS:
-        ALL_PARAMS.append(emf_col)
-    if emf_col not in ABSORPTION_PARAMS[leg]:
-        ABSORPTION_PARAMS[leg].append(emf_col)
+# Player PDFs: 1 -> drawn one after another in this process;
+# N > 1 -> spread over N worker processes (None -> one per CPU)
+PDF_WORKERS = 1
 
-print("Generation parameters:", GENERATION_PARAMS)
-print("Absorption parameters:", ABSORPTION_PARAMS)
-print("Standalone classified params:", OTHER_PARAMS)
+# Table PDFs: "native"     -> vector pages written directly (small files, fast);
+#                             a PDF with text outside cp1252 uses matplotlib
+#             "matplotlib" -> one matplotlib figure per table page
+PDF_RENDERER = "native"
 
-# -------------------------------------------------------------
-# 6. TREAT 0 AS MISSING FOR SLJ METRICS
-# -------------------------------------------------------------
-for c in ALL_PARAMS:
-    if c in df.columns:
-        df.loc[df[c] == 0, c] = np.nan
+# Rows per PDF page; longer histories continue on further pages with the
+# header repeated (None -> one page per table, as tall as the history)
+PDF_ROWS_PER_PAGE = 30
 
-# -------------------------------------------------------------
-# 7. PARAMETER-LEVEL ROLLING CLASSIFICATION
-#    Depth is POSITIVE in your dataset:
-#       High depth = deeper = bigger value => z>=1 => High
-#       Low  depth = shallower = smaller value => z<=-1 => Low
-# -------------------------------------------------------------
-def classify_z(z):
-    if pd.isna(z):
-        return "Avg"
-    if z >= 1:
-        return "High"
-    if z <= -1:
-        return "Low"
-    return "Avg"
-
-for param in ALL_PARAMS:
-    if param not in df.columns:
-        continue
-
-    g = df.groupby(PLAYER_COL)[param]
-
-    count_prev = (
-        g.apply(lambda s: s.expanding(min_periods=1).count().shift(1))
-         .reset_index(level=0, drop=True)
-    )
-    mean_prev = (
-        g.apply(lambda s: s.expanding(min_periods=1).mean().shift(1))
-         .reset_index(level=0, drop=True)
-    )
-    sd_prev = (
-        g.apply(lambda s: s.expanding(min_periods=2).std(ddof=1).shift(1))
-         .reset_index(level=0, drop=True)
-    )
-
-    df[f"{param}_avg_prev"] = mean_prev.round(1)
-
-    z_raw = (df[param] - mean_prev) / sd_prev
-    z = pd.Series(np.nan, index=df.index, dtype="float64")
-
-    has_current = df[param].notna()
-    enough_history = count_prev.ge(2)
-    sd_ok = sd_prev.notna() & (sd_prev != 0)
-
-    mask_normal = has_current & enough_history & sd_ok
-    z.loc[mask_normal] = z_raw.loc[mask_normal]
-
-    mask_force_avg = has_current & (~enough_history | ~sd_ok)
-    z.loc[mask_force_avg] = 0.0
-
-    df[f"{param}_z"] = z
-    df[f"{param}_class"] = df[f"{param}_z"].apply(classify_z)
+# False -> only redraw the PDFs whose table rows, drawing code or PDF
+# settings changed since the last run (see PDF_MANIFEST_FILE);
+# True -> redraw every player PDF and the team overview
+REBUILD_ALL_PDFS = False
 
 # -------------------------------------------------------------
-# 8. DAY-LEVEL GENERATION & ABSORPTION CLASSIFICATION PER LEG
-#    NEW: Generation overall uses PD + DEP + PF (your updated logic)
-#    Absorption overall uses BD + DEP + BF (your updated logic)
+# 1. LOAD, CLASSIFY BOTH LEGS, SAVE CSVs + BASELINE STATE + TEAM SNAPSHOTS
+#    The steps live in jump_pipeline/test_engine.py and are driven by
+#    the "SLJ_L" / "SLJ_R" entries of jump_pipeline/test_specs.py.
+#    The export is loaded once and both legs share one rolling-stats
+#    pass. Required columns are checked against the header first.
+#    (Sections 1 and 3 only run in the main process, see the CMJ script.)
 # -------------------------------------------------------------
-def classify_generation(pd_class, dep_class, pf_class):
-    if pd.isna(pd_class) or pd.isna(dep_class) or pd.isna(pf_class):
-        return ""
-    PD, DEP, PF = str(pd_class), str(dep_class), str(pf_class)
-
-    # If PD & DEP both HIGH:
-    if PD == "High" and DEP == "High":
-        if PF == "High":
-            return "Avg"
-        if PF in ("Low", "Avg"):
-            return "Low"
-
-    # If PD & DEP both LOW:
-    if PD == "Low" and DEP == "Low":
-        if PF == "Low":
-            return "Avg"
-        if PF in ("High", "Avg"):
-            return "High"
-
-    # If exactly one of PD / DEP is HIGH:
-    if (PD == "High" and DEP == "Avg") or (PD == "Avg" and DEP == "High"):
-        if PD == "High" and DEP == "Avg":
-            if PF in ("Avg", "Low"):
-                return "Low"
-            if PF == "High":
-                return "High"
-        else:
-            if PF in ("Avg", "High"):
-                return "High"
-            if PF == "Low":
-                return "Low"
-
-    # If exactly one of PD / DEP is LOW:
-    if (PD == "Low" and DEP == "Avg") or (PD == "Avg" and DEP == "Low"):
-        if PD == "Low" and DEP == "Avg":
-            if PF == "Low":
-                return "Low"
-            return "High"  # PF Avg/High
-        else:
-            if PF in ("Avg", "Low"):
-                return "Low"
-            if PF == "High":
-                return "High"
-
-    # PD & DEP both NORMAL:
-    if PD == "Avg" and DEP == "Avg":
-        if PF == "High":
-            return "High"
-        if PF == "Low":
-            return "Low"
-        return "Avg"
-
-    # If one HIGH, one LOW (PD vs DEP):
-    if PD == "Low" and DEP == "High":
-        return "High"
-    if PD == "High" and DEP == "Low":
-        return "Low"
-
-    return "Avg"
-
-def classify_absorption(bd_class, dep_class, bf_class):
-    if pd.isna(bd_class) or pd.isna(dep_class) or pd.isna(bf_class):
-        return ""
-    BD, DEP, BF = str(bd_class), str(dep_class), str(bf_class)
-
-    # If BD & DEP both HIGH:
-    if BD == "High" and DEP == "High":
-        if BF == "High":
-            return "Avg"
-        return "High"  # BF Avg/Low
-
-    # If BD & DEP both LOW:
-    if BD == "Low" and DEP == "Low":
-        if BF == "Low":
-            return "Avg"
-        return "Low"   # BF Avg/High
-
-    # If exactly one of BD/DEP is HIGH:
-    if (BD == "High" and DEP == "Avg") or (BD == "Avg" and DEP == "High"):
-        if BD == "High" and DEP == "Avg":
-            if BF in ("Avg", "Low"):
-                return "Low"
-            if BF == "High":
-                return "High"
-        else:
-            if BF in ("Avg", "High"):
-                return "High"
-            if BF == "Low":
-                return "Low"
-
-    # If exactly one of BD/DEP is LOW:
-    if (BD == "Low" and DEP == "Avg") or (BD == "Avg" and DEP == "Low"):
-        if BD == "Low" and DEP == "Avg":
-            if BF == "Low":
-                return "Low"
-            return "High"  # BF Avg/High
-        else:
-            if BF in ("Avg", "Low"):
-                return "Low"
-            if BF == "High":
-                return "High"
-
-    # BD & DEP both NORMAL:
-    if BD == "Avg" and DEP == "Avg":
-        if BF == "High":
-            return "High"
-        if BF == "Low":
-            return "Low"
-        return "Avg"
-
-    # If one HIGH, one LOW (BD vs DEP):
-    if BD == "Low" and DEP == "High":
-        return "High"
-    if BD == "High" and DEP == "Low":
-        return "Low"
-
-    return "Avg"
-
-for leg in ["L", "R"]:
-    pd_col   = f"Concentric Duration [ms] ({leg})"
-    pf_col   = f"Concentric Mean Force / BM [N/kg] ({leg})"
-    bd_col   = f"Braking Phase Duration [ms] ({leg})"
-    dep_col  = f"Countermovement Depth [cm] ({leg})"
-    bf_col   = f"Eccentric Mean Force / BM [N/kg] ({leg})"
-
-    pd_class_col = f"{pd_col}_class"
-    pf_class_col = f"{pf_col}_class"
-    bd_class_col = f"{bd_col}_class"
-    dep_class_col = f"{dep_col}_class"
-    bf_class_col = f"{bf_col}_class"
-
-    gen_col = f"Generation_Class_{leg}"
-    abs_col = f"Absorption_Class_{leg}"
-
-    required_gen_raw = [c for c in [pd_col, dep_col, pf_col] if c in df.columns]
-    required_abs_raw = [c for c in [bd_col, dep_col, bf_col] if c in df.columns]
-
-    df[gen_col] = ""
-    df[abs_col] = ""
-
-    if required_gen_raw:
-        mask_gen = df[required_gen_raw].notna().all(axis=1)
-        df.loc[mask_gen, gen_col] = df.loc[mask_gen].apply(
-            lambda r: classify_generation(r.get(pd_class_col), r.get(dep_class_col), r.get(pf_class_col)),
-            axis=1
-        )
-
-    if required_abs_raw:
-        mask_abs = df[required_abs_raw].notna().all(axis=1)
-        df.loc[mask_abs, abs_col] = df.loc[mask_abs].apply(
-            lambda r: classify_absorption(r.get(bd_class_col), r.get(dep_class_col), r.get(bf_class_col)),
-            axis=1
+if __name__ == "__main__":
+    try:
+        run = run_tests(
+            {TEST_TYPE: INPUT_FILE}, ["SLJ_L", "SLJ_R"], OUTPUTS, {TEST_TYPE: BASELINE_FILE}, RUN_MODE, cache_dir=CACHE_DIR
         )
+    except MissingColumnsError as e:
+        raise SystemExit(str(e))
 
-# -------------------------------------------------------------
-# 9. BUILD LEG-SPECIFIC FILTERS (DROP ROWS WITH NO LEG DATA)
-# -------------------------------------------------------------
-LEG_DATA_MASK = {}
-for leg in ["L", "R"]:
-    leg_cols = []
-
-    jh_col = f"Jump Height (Imp-Mom) [cm] ({leg})"
-    if jh_col in df.columns:
-        leg_cols.append(jh_col)
-
-    leg_cols += [c for c in GENERATION_PARAMS[leg] if c in df.columns and c != "BW [KG]"]
-    leg_cols += [c for c in ABSORPTION_PARAMS[leg] if c in df.columns and c != "BW [KG]"]
-
-    leg_cols = list(dict.fromkeys([c for c in leg_cols if c in df.columns]))
-
-    if not leg_cols:
-        LEG_DATA_MASK[leg] = pd.Series(True, index=df.index)
-    else:
-        LEG_DATA_MASK[leg] = df[leg_cols].notna().any(axis=1)
-
-# -------------------------------------------------------------
-# 10. BUILD PER-LEG OUTPUT DATAFRAMES
-#    Generation outputs now include DEP (same values/classes)
-# -------------------------------------------------------------
-base_cols = [PLAYER_COL, DATE_COL]
-df_gen_leg = {}
-df_abs_leg = {}
-
-for leg in ["L", "R"]:
-    gen_params   = GENERATION_PARAMS[leg]
-    abs_params   = ABSORPTION_PARAMS[leg]
-    other_params = OTHER_PARAMS[leg]
-
-    gen_value_params = gen_params + other_params
-    abs_value_params = abs_params + other_params
-
-    gen_cols = (
-        base_cols
-        + gen_value_params
-        + [f"{p}_avg_prev" for p in gen_value_params if f"{p}_avg_prev" in df.columns]
-        + [f"{p}_z" for p in gen_value_params if f"{p}_z" in df.columns]
-        + [f"{p}_class" for p in gen_value_params if f"{p}_class" in df.columns]
-        + [f"Generation_Class_{leg}"]
-    )
-    abs_cols = (
-        base_cols
-        + abs_value_params
-        + [f"{p}_avg_prev" for p in abs_value_params if f"{p}_avg_prev" in df.columns]
-        + [f"{p}_z" for p in abs_value_params if f"{p}_z" in df.columns]
-        + [f"{p}_class" for p in abs_value_params if f"{p}_class" in df.columns]
-        + [f"Absorption_Class_{leg}"]
-    )
-
-    gen_cols = [c for c in gen_cols if c in df.columns]
-    abs_cols = [c for c in abs_cols if c in df.columns]
-
-    mask_leg = LEG_DATA_MASK[leg]
-    df_gen_leg[leg] = df.loc[mask_leg, gen_cols].copy()
-    df_abs_leg[leg] = df.loc[mask_leg, abs_cols].copy()
-
-# -------------------------------------------------------------
-# 11. TEAM-LEVEL SNAPSHOT PER LEG
-# -------------------------------------------------------------
-agg = (
-    df.groupby(PLAYER_COL)[DATE_COL]
-      .agg(TTD="count", LTD="max")
-      .reset_index()
-)
-
-team_df_leg = {}
-
-for leg in ["L", "R"]:
-    jh_col       = f"Jump Height (Imp-Mom) [cm] ({leg})"
-    jh_class_col = f"{jh_col}_class"
-    gen_col      = f"Generation_Class_{leg}"
-    abs_col      = f"Absorption_Class_{leg}"
-
-    df_leg = df.loc[LEG_DATA_MASK[leg]].copy()
-    if df_leg.empty:
-        last_idx = df.groupby(PLAYER_COL)[DATE_COL].idxmax()
-        df_last_leg_source = df.loc[last_idx].copy()
-    else:
-        last_idx_leg = df_leg.groupby(PLAYER_COL)[DATE_COL].idxmax()
-        df_last_leg_source = df.loc[last_idx_leg].copy()
-
-    cols_needed = [
-        PLAYER_COL, DATE_COL,
-        "BW [KG]", "BW [KG]_class",
-        jh_col, jh_class_col,
-        gen_col, abs_col,
-    ]
-    cols_needed = [c for c in cols_needed if c in df_last_leg_source.columns]
-
-    df_last_leg = df_last_leg_source[cols_needed].rename(columns={DATE_COL: "LTD"})
-
-    team_df = agg.merge(df_last_leg, on=[PLAYER_COL, "LTD"], how="left")
-    team_df = team_df.sort_values("LTD", ascending=False)
-    team_df_leg[leg] = team_df
-
-    out_cols = [PLAYER_COL, "TTD", "LTD", "BW [KG]", jh_col, abs_col, gen_col]
-    out_cols = [c for c in out_cols if c in team_df.columns]
-
-    if leg == "L":
-        team_df[out_cols].to_csv(OUTPUT_TEAM_CSV_L, index=False)
-        print("Saved Left Team snapshot CSV to:", OUTPUT_TEAM_CSV_L)
-    else:
-        team_df[out_cols].to_csv(OUTPUT_TEAM_CSV_R, index=False)
-        print("Saved Right Team snapshot CSV to:", OUTPUT_TEAM_CSV_R)
-
-# -------------------------------------------------------------
-# 12. SAVE PER-LEG CSVs
-# -------------------------------------------------------------
-df_gen_leg["L"].to_csv(OUTPUT_GEN_CSV_L, index=False)
-df_abs_leg["L"].to_csv(OUTPUT_ABS_CSV_L, index=False)
-print("Saved Left Generation CSV to:", OUTPUT_GEN_CSV_L)
-print("Saved Left Absorption CSV to:", OUTPUT_ABS_CSV_L)
+    if run is None:
+        raise SystemExit(0)
 
-df_gen_leg["R"].to_csv(OUTPUT_GEN_CSV_R, index=False)
-df_abs_leg["R"].to_csv(OUTPUT_ABS_CSV_R, index=False)
-print("Saved Right Generation CSV to:", OUTPUT_GEN_CSV_R)
-print("Saved Right Absorption CSV to:", OUTPUT_ABS_CSV_R)
+    team_df_leg = {leg: run["team"][f"SLJ_{leg}"] for leg in ["L", "R"]}
+    GENERATION_PARAMS = {leg: run["params"][f"SLJ_{leg}"]["Generation"] for leg in ["L", "R"]}
+    ABSORPTION_PARAMS = {leg: run["params"][f"SLJ_{leg}"]["Absorption"] for leg in ["L", "R"]}
 
 # -------------------------------------------------------------
-# 13. PDF SETTINGS (COLORS, LABELS)
+# 2. PDF SETTINGS (COLORS, LABELS)
 # -------------------------------------------------------------
 os.makedirs(PDF_OUTPUT_DIR, exist_ok=True)
 
@@ -504,94 +133,56 @@ def display_name(col):
         return f"{DISPLAY_LABELS.get(base, base)}\nAvg(prev)"
     return DISPLAY_LABELS.get(col, col)
 
-def format_value(col, val):
-    if pd.isna(val) or val == "":
-        return ""
-    if col in (DATE_COL, "LTD"):
-        return pd.to_datetime(val).strftime("%Y-%m-%d")
-    if col == "TTD":
-        return f"{int(val)}"
-    if "Concentric Duration [ms]" in col or "Braking Phase Duration [ms]" in col:
-        try:
-            return f"{int(round(float(val)))}"
-        except Exception:
-            return str(val)
-    try:
-        return f"{float(val):.1f}"
-    except Exception:
-        return str(val)
-
-def class_to_arrow(text):
-    if text == "High":
-        return "↑"
-    if text == "Low":
-        return "↓"
-    if text == "Avg":
-        return "→"
-    return ""
-
-def add_table_page(pdf, player_name, title, df_player, value_cols, class_map):
+# phase class columns show as arrows
+ARROW_COLS = ("Generation_Class_L", "Absorption_Class_L",
+              "Generation_Class_R", "Absorption_Class_R")
+
+# (face, text) by Low/Avg/High code; last entry: blank class (code -1)
+COLORS_BY_CODE = [(COLOR_MAP[c]["face"], COLOR_MAP[c]["text"]) for c in ["Low", "Avg", "High", ""]]
+
+def cell_specs(cols):
+    # column -> cell format (see jump_pipeline/cell_format.py)
+    specs = {}
+    for c in cols:
+        if c in (DATE_COL, "LTD"):
+            specs[c] = "date"
+        elif c == PLAYER_COL:
+            specs[c] = "text"
+        elif c in ARROW_COLS:
+            specs[c] = "arrow"
+        else:
+            specs[c] = value_spec(c)
+    return specs
+
+def class_colors(df, class_source):
+    # (face, text) per row; columns without a class source show as Avg
+    if class_source not in df.columns:
+        return [COLORS_BY_CODE[AVG]] * len(df)
+    return [COLORS_BY_CODE[c] for c in base_codes(df[class_source])]
+
+def player_table(player_name, title, df_player, value_cols, class_map):
     if df_player.empty:
-        return
+        return None
 
     df_player = df_player.sort_values(DATE_COL, ascending=False)
 
     cols = [DATE_COL] + value_cols
     header_labels = [display_name(c) for c in cols]
 
-    data_rows = []
-    for _, row in df_player.iterrows():
-        row_vals = [format_value(DATE_COL, row[DATE_COL])]
-        for col in value_cols:
-            raw_val = row.get(col, "")
-            disp = format_value(col, raw_val)
-            if col in ("Generation_Class_L", "Absorption_Class_L",
-                       "Generation_Class_R", "Absorption_Class_R"):
-                disp = class_to_arrow(disp)
-            row_vals.append(disp)
-        data_rows.append(row_vals)
-
-    n_rows = len(data_rows)
-    n_cols = len(cols)
-
-    fig_width  = max(8, n_cols * 1.3)
-    fig_height = max(4, n_rows * 0.4 + 2)
-
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-    ax.axis("off")
-
-    table = ax.table(cellText=data_rows, colLabels=header_labels, loc="center")
-    table.auto_set_font_size(False)
-    table.set_fontsize(8)
-    table.scale(1.1, 1.3)
-
-    for (r, c), cell in table.get_celld().items():
-        if r == 0:
-            cell.set_facecolor("black")
-            cell.get_text().set_color("white")
-            cell.get_text().set_fontweight("bold")
-
-    for r_idx, (_, row) in enumerate(df_player.iterrows(), start=1):
-        for c_idx, col in enumerate(cols):
-            if col == DATE_COL:
-                continue
-            cell = table[r_idx, c_idx]
-            class_source = class_map.get(col)
-            cls = row.get(class_source, "Avg") if class_source else "Avg"
-            if cls not in COLOR_MAP:
-                cls = "Avg"
-            colors = COLOR_MAP[cls]
-            cell.set_facecolor(colors["face"])
-            cell.get_text().set_color(colors["text"])
-
-    ax.set_title(f"{player_name} - {title}", fontsize=12, pad=12)
-    plt.tight_layout()
-    pdf.savefig(fig)
-    plt.close(fig)
-
-def add_team_overview_leg(pdf, team_df_in, leg_label, leg):
+    cells = format_frame(df_player, cell_specs(cols))[cols]
+    col_colors = [[None] * len(df_player)] + [class_colors(df_player, class_map.get(c)) for c in value_cols]
+
+    return {
+        "title": f"{player_name} - {title}",
+        "header": header_labels,
+        "rows": cells.to_numpy().tolist(),
+        "colors": [list(colors) for colors in zip(*col_colors)],
+        "fit_columns": False,
+    }
+
+def team_table_leg(team_df_in, leg_label, leg):
     if team_df_in.empty:
-        return
+        return None
 
     df_team = team_df_in.sort_values("LTD", ascending=False)
 
@@ -603,42 +194,6 @@ def add_team_overview_leg(pdf, team_df_in, leg_label, leg):
     cols = [c for c in cols if c in df_team.columns]
     header_labels = [display_name(c) for c in cols]
 
-    data_rows = []
-    for _, row in df_team.iterrows():
-        row_vals = []
-        for col in cols:
-            raw_val = row.get(col, "")
-            disp = format_value(col, raw_val)
-            if col in (abs_col, gen_col):
-                disp = class_to_arrow(disp)
-            row_vals.append(disp)
-        data_rows.append(row_vals)
-
-    n_rows = len(data_rows)
-    n_cols = len(cols)
-
-    fig_width  = max(8, n_cols * 1.3)
-    fig_height = max(4, n_rows * 0.4 + 2)
-
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-    ax.axis("off")
-
-    table = ax.table(cellText=data_rows, colLabels=header_labels, loc="center")
-    table.auto_set_font_size(False)
-    table.set_fontsize(8)
-    table.scale(1.1, 1.3)
-
-    try:
-        table.auto_set_column_width(col=list(range(n_cols)))
-    except Exception:
-        pass
-
-    for (r, c), cell in table.get_celld().items():
-        if r == 0:
-            cell.set_facecolor("black")
-            cell.get_text().set_color("white")
-            cell.get_text().set_fontweight("bold")
-
     class_map_team = {
         "BW [KG]": "BW [KG]_class",
         jh_col: f"{jh_col}_class",
@@ -646,86 +201,148 @@ def add_team_overview_leg(pdf, team_df_in, leg_label, leg):
         gen_col: gen_col,
     }
 
-    for r_idx, (_, row) in enumerate(df_team.iterrows(), start=1):
-        for c_idx, col in enumerate(cols):
-            if col in [PLAYER_COL, "TTD", "LTD"]:
-                continue
-            cell = table[r_idx, c_idx]
-            source = class_map_team.get(col)
-            cls = row.get(source, "Avg") if source else "Avg"
-            if cls not in COLOR_MAP:
-                cls = "Avg"
-            colors = COLOR_MAP[cls]
-            cell.set_facecolor(colors["face"])
-            cell.get_text().set_color(colors["text"])
-
-    ax.set_title(f"SLJ Team Overview - {leg_label}", fontsize=12, pad=12)
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
-    pdf.savefig(fig)
-    plt.close(fig)
+    cells = format_frame(df_team, cell_specs(cols))[cols]
+    col_colors = [
+        [None] * len(df_team) if col in [PLAYER_COL, "TTD", "LTD"] else class_colors(df_team, class_map_team.get(col))
+        for col in cols
+    ]
 
-# -------------------------------------------------------------
-# 14. BUILD PER-PLAYER & TEAM PDFs
-# -------------------------------------------------------------
-unique_players = df[PLAYER_COL].dropna().unique()
+    return {
+        "title": f"SLJ Team Overview - {leg_label}",
+        "header": header_labels,
+        "rows": cells.to_numpy().tolist(),
+        "colors": [list(colors) for colors in zip(*col_colors)],
+        "fit_columns": True,
+    }
 
-for player in unique_players:
-    safe_name = str(player).replace("/", "_").replace("\\", "_")
-    pdf_path = os.path.join(PDF_OUTPUT_DIR, f"{safe_name}_SLJ_Classification.pdf")
+def write_tables_pdf(path, tables):
+    with table_pdf(path, document_renderer(path, tables, PDF_RENDERER), PDF_ROWS_PER_PAGE) as pdf:
+        for table in tables:
+            add_table(pdf, table)
 
-    df_gen_L_p = df_gen_leg["L"][df_gen_leg["L"][PLAYER_COL] == player]
-    df_abs_L_p = df_abs_leg["L"][df_abs_leg["L"][PLAYER_COL] == player]
-    df_gen_R_p = df_gen_leg["R"][df_gen_leg["R"][PLAYER_COL] == player]
-    df_abs_R_p = df_abs_leg["R"][df_abs_leg["R"][PLAYER_COL] == player]
+def write_player_pdf(job):
+    # job = (player, pdf path, [table, ...]); errors come back to the
+    # caller instead of stopping the run
+    player, pdf_path, tables = job
+    try:
+        write_tables_pdf(pdf_path, tables)
+    except Exception as e:
+        return player, pdf_path, f"{type(e).__name__}: {e}"
+    return player, pdf_path, None
 
-    gen_value_cols_L = ["Generation_Class_L", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (L)"] + GENERATION_PARAMS["L"]
-    abs_value_cols_L = ["Absorption_Class_L", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (L)"] + ABSORPTION_PARAMS["L"]
-    gen_value_cols_R = ["Generation_Class_R", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (R)"] + GENERATION_PARAMS["R"]
-    abs_value_cols_R = ["Absorption_Class_R", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (R)"] + ABSORPTION_PARAMS["R"]
+# -------------------------------------------------------------
+# PDF FINGERPRINTS (incremental PDFs)
+#   the tables a PDF shows as drawn (cell text and colours), plus the
+#   jump_pipeline modules (pdf_tables.py draws them, cell_format.py /
+#   class_codes.py feed them) and renderer settings. The tables already
+#   carry everything this script decides, so editing a setting here
+#   (RUN_MODE, ...) does not redraw anything, and full, incremental and
+#   streaming runs agree on unchanged players. Kept per PDF file name
+#   in PDF_MANIFEST_FILE, the same way the overview site tracks its pages
+# -------------------------------------------------------------
+PDF_TEMPLATE_VERSION = template_version(settings=(PDF_RENDERER, PDF_ROWS_PER_PAGE))
 
-    gen_class_map_L = {
-        "Generation_Class_L": "Generation_Class_L",
-        "BW [KG]": "BW [KG]_class",
-        "Jump Height (Imp-Mom) [cm] (L)": "Jump Height (Imp-Mom) [cm] (L)_class",
-        f"Concentric Duration [ms] (L)": f"Concentric Duration [ms] (L)_class",
-        f"Countermovement Depth [cm] (L)": f"Countermovement Depth [cm] (L)_class",
-        f"Concentric Mean Force / BM [N/kg] (L)": f"Concentric Mean Force / BM [N/kg] (L)_class",
-    }
-    abs_class_map_L = {
-        "Absorption_Class_L": "Absorption_Class_L",
-        "BW [KG]": "BW [KG]_class",
-        "Jump Height (Imp-Mom) [cm] (L)": "Jump Height (Imp-Mom) [cm] (L)_class",
-        f"Braking Phase Duration [ms] (L)": f"Braking Phase Duration [ms] (L)_class",
-        f"Countermovement Depth [cm] (L)": f"Countermovement Depth [cm] (L)_class",
-        f"Eccentric Mean Force / BM [N/kg] (L)": f"Eccentric Mean Force / BM [N/kg] (L)_class",
-    }
-    gen_class_map_R = {
-        "Generation_Class_R": "Generation_Class_R",
-        "BW [KG]": "BW [KG]_class",
-        "Jump Height (Imp-Mom) [cm] (R)": "Jump Height (Imp-Mom) [cm] (R)_class",
-        f"Concentric Duration [ms] (R)": f"Concentric Duration [ms] (R)_class",
-        f"Countermovement Depth [cm] (R)": f"Countermovement Depth [cm] (R)_class",
-        f"Concentric Mean Force / BM [N/kg] (R)": f"Concentric Mean Force / BM [N/kg] (R)_class",
-    }
-    abs_class_map_R = {
-        "Absorption_Class_R": "Absorption_Class_R",
-        "BW [KG]": "BW [KG]_class",
-        "Jump Height (Imp-Mom) [cm] (R)": "Jump Height (Imp-Mom) [cm] (R)_class",
-        f"Braking Phase Duration [ms] (R)": f"Braking Phase Duration [ms] (R)_class",
-        f"Countermovement Depth [cm] (R)": f"Countermovement Depth [cm] (R)_class",
-        f"Eccentric Mean Force / BM [N/kg] (R)": f"Eccentric Mean Force / BM [N/kg] (R)_class",
-    }
+def pdf_fingerprint(name, tables):
+    return page_fingerprint(PDF_TEMPLATE_VERSION, name, table_digest(tables))
 
-    with PdfPages(pdf_path) as pdf:
-        add_table_page(pdf, player, "SLJ Left - Generation", df_gen_L_p, gen_value_cols_L, gen_class_map_L)
-        add_table_page(pdf, player, "SLJ Left - Absorption", df_abs_L_p, abs_value_cols_L, abs_class_map_L)
-        add_table_page(pdf, player, "SLJ Right - Generation", df_gen_R_p, gen_value_cols_R, gen_class_map_R)
-        add_table_page(pdf, player, "SLJ Right - Absorption", df_abs_R_p, abs_value_cols_R, abs_class_map_R)
+# -------------------------------------------------------------
+# 3. BUILD PER-PLAYER & TEAM PDFs
+#    (only players whose tables changed are redrawn; incremental runs
+#    only list players with new tests to begin with. File names
+#    depend only on the player, so a pool run writes the same files)
+# -------------------------------------------------------------
+def player_pdf_jobs():
+    for player, frames in run["players"]:
+        safe_name = str(player).replace("/", "_").replace("\\", "_")
+        pdf_path = os.path.join(PDF_OUTPUT_DIR, f"{safe_name}_SLJ_Classification.pdf")
+
+        df_gen_L_p = frames["SLJ_L"]["Generation"]
+        df_abs_L_p = frames["SLJ_L"]["Absorption"]
+        df_gen_R_p = frames["SLJ_R"]["Generation"]
+        df_abs_R_p = frames["SLJ_R"]["Absorption"]
+
+        gen_value_cols_L = ["Generation_Class_L", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (L)"] + GENERATION_PARAMS["L"]
+        abs_value_cols_L = ["Absorption_Class_L", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (L)"] + ABSORPTION_PARAMS["L"]
+        gen_value_cols_R = ["Generation_Class_R", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (R)"] + GENERATION_PARAMS["R"]
+        abs_value_cols_R = ["Absorption_Class_R", "BW [KG]", f"Jump Height (Imp-Mom) [cm] (R)"] + ABSORPTION_PARAMS["R"]
+
+        gen_class_map_L = {
+            "Generation_Class_L": "Generation_Class_L",
+            "BW [KG]": "BW [KG]_class",
+            "Jump Height (Imp-Mom) [cm] (L)": "Jump Height (Imp-Mom) [cm] (L)_class",
+            f"Concentric Duration [ms] (L)": f"Concentric Duration [ms] (L)_class",
+            f"Countermovement Depth [cm] (L)": f"Countermovement Depth [cm] (L)_class",
+            f"Concentric Mean Force / BM [N/kg] (L)": f"Concentric Mean Force / BM [N/kg] (L)_class",
+        }
+        abs_class_map_L = {
+            "Absorption_Class_L": "Absorption_Class_L",
+            "BW [KG]": "BW [KG]_class",
+            "Jump Height (Imp-Mom) [cm] (L)": "Jump Height (Imp-Mom) [cm] (L)_class",
+            f"Braking Phase Duration [ms] (L)": f"Braking Phase Duration [ms] (L)_class",
+            f"Countermovement Depth [cm] (L)": f"Countermovement Depth [cm] (L)_class",
+            f"Eccentric Mean Force / BM [N/kg] (L)": f"Eccentric Mean Force / BM [N/kg] (L)_class",
+        }
+        gen_class_map_R = {
+            "Generation_Class_R": "Generation_Class_R",
+            "BW [KG]": "BW [KG]_class",
+            "Jump Height (Imp-Mom) [cm] (R)": "Jump Height (Imp-Mom) [cm] (R)_class",
+            f"Concentric Duration [ms] (R)": f"Concentric Duration [ms] (R)_class",
+            f"Countermovement Depth [cm] (R)": f"Countermovement Depth [cm] (R)_class",
+            f"Concentric Mean Force / BM [N/kg] (R)": f"Concentric Mean Force / BM [N/kg] (R)_class",
+        }
+        abs_class_map_R = {
+            "Absorption_Class_R": "Absorption_Class_R",
+            "BW [KG]": "BW [KG]_class",
+            "Jump Height (Imp-Mom) [cm] (R)": "Jump Height (Imp-Mom) [cm] (R)_class",
+            f"Braking Phase Duration [ms] (R)": f"Braking Phase Duration [ms] (R)_class",
+            f"Countermovement Depth [cm] (R)": f"Countermovement Depth [cm] (R)_class",
+            f"Eccentric Mean Force / BM [N/kg] (R)": f"Eccentric Mean Force / BM [N/kg] (R)_class",
+        }
+
+        pages = [
+            ("SLJ Left - Generation", df_gen_L_p, gen_value_cols_L, gen_class_map_L),
+            ("SLJ Left - Absorption", df_abs_L_p, abs_value_cols_L, abs_class_map_L),
+            ("SLJ Right - Generation", df_gen_R_p, gen_value_cols_R, gen_class_map_R),
+            ("SLJ Right - Absorption", df_abs_R_p, abs_value_cols_R, abs_class_map_R),
+        ]
+        tables = [player_table(player, *page) for page in pages]
+        yield player, pdf_path, [t for t in tables if t is not None]
+
+def stale_pdf_jobs(old_pdfs, pdfs, unchanged):
+    # records every listed player's fingerprint in pdfs, yields the jobs to redraw
+    for job in player_pdf_jobs():
+        name = os.path.basename(job[1])
+        pdfs[name] = pdf_fingerprint(job[0], job[2])
+        if page_is_current(old_pdfs, job[1], pdfs[name]):
+            unchanged.append(job[0])
+        else:
+            yield job
 
-    print(f"Saved player SLJ PDF: {pdf_path}")
+if __name__ == "__main__":
+    old_pdfs = {} if REBUILD_ALL_PDFS else load_manifest(PDF_MANIFEST_FILE)
+    pdfs = dict(old_pdfs)  # players an incremental run does not list keep their entry
+    unchanged = []
 
-with PdfPages(TEAM_PDF_PATH) as pdf:
-    add_team_overview_leg(pdf, team_df_leg["L"], "Left", "L")
-    add_team_overview_leg(pdf, team_df_leg["R"], "Right", "R")
+    failed = []
+    for player, pdf_path, error in map_in_pool(write_player_pdf, stale_pdf_jobs(old_pdfs, pdfs, unchanged), PDF_WORKERS):
+        if error is None:
+            print(f"Saved player SLJ PDF: {pdf_path}")
+        else:
+            print(f"FAILED player SLJ PDF for {player}: {error}")
+            failed.append(player)
+            pdfs.pop(os.path.basename(pdf_path))  # retried on the next run
+    print(f"Player PDFs: {len(unchanged)} unchanged.")
+
+    tables = [team_table_leg(team_df_leg["L"], "Left", "L"), team_table_leg(team_df_leg["R"], "Right", "R")]
+    tables = [t for t in tables if t is not None]
+    key = pdf_fingerprint(os.path.basename(TEAM_PDF_PATH), tables)
+    if page_is_current(old_pdfs, TEAM_PDF_PATH, key):
+        print(f"Unchanged SLJ team overview PDF: {TEAM_PDF_PATH}")
+    else:
+        write_tables_pdf(TEAM_PDF_PATH, tables)
+        print(f"Saved SLJ team overview PDF: {TEAM_PDF_PATH}")
+    pdfs[os.path.basename(TEAM_PDF_PATH)] = key
+    save_manifest(PDF_MANIFEST_FILE, pdfs)
 
-print(f"Saved SLJ team overview PDF: {TEAM_PDF_PATH}")
+    if failed:
+        raise SystemExit(f"{len(failed)} player PDF(s) failed: {', '.join(map(str, failed))}")
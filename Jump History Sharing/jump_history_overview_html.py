@@ -1,10 +1,30 @@
 import os
+import sys
+import hashlib
+import json
+import pickle
+import tempfile
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 from datetime import datetime
 from urllib.parse import quote
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from jump_pipeline.phase_rules import GENERATION_LUT, ABSORPTION_LUT, phase_classes
+from jump_pipeline.class_codes import AVG, BASE_CODE, CLASS_LABELS, as_class, class_code, encode_class_columns
+from jump_pipeline.cell_format import as_float, display_codes, format_column, format_frame, format_value, value_spec
+from jump_pipeline.z_bands import z_classes
+from jump_pipeline.site_manifest import (
+    frame_digest, page_fingerprint, load_manifest, save_manifest, page_is_current, template_version,
+    write_text_atomic,
+)
+from jump_pipeline.process_pool import map_in_pool
+from jump_pipeline.site_output import COMPRESSED_SUFFIXES, finish_site_file, print_size_report
+from jump_pipeline.test_engine import join_phases, latest_tests, run_tests, team_columns
+from jump_pipeline.vald_schema import MissingColumnsError
+
 # ============================================================
 # FILE PATHS (single source of truth)
 # ============================================================
@@ -29,10 +49,19 @@ SLJ_L_ABS_CSV = os.path.join(ROOT_SLJ, "L_Absorption_Daily_Classes.csv")
 SLJ_R_GEN_CSV = os.path.join(ROOT_SLJ, "R_Generation_Daily_Classes.csv")
 SLJ_R_ABS_CSV = os.path.join(ROOT_SLJ, "R_Absorption_Daily_Classes.csv")
 
+# Raw exports + classifier state (DATA_SOURCE = "pipeline")
+CMJ_RAW_CSV = os.path.join(ROOT_CMJ, "raw_VALD_cmj.csv")
+SLJ_RAW_CSV = os.path.join(ROOT_SLJ, "raw_VALD_slj.csv")
+CMJ_BASELINE_FILE = os.path.join(ROOT_CMJ, "CMJ_Baseline_State.json")
+SLJ_BASELINE_FILE = os.path.join(ROOT_SLJ, "SLJ_Baseline_State.json")
+EXPORT_CACHE_DIR = os.path.join(ROOT_OVERVW, "_export_cache")
+
 # Outputs
 OUTPUT_SUMMARY_CSV = os.path.join(ROOT_OVERVW, "Team_AllTests_Overview.csv")
 OUTPUT_SUMMARY_PDF = os.path.join(ROOT_OVERVW, "Team_AllTests_Overview.pdf")
 
+SITE_MANIFEST_FILE = os.path.join(ROOT_OVERVW, "site_manifest.json")
+
 # HTML assets (relative paths used inside HTML)
 ACCESSORIES_DIR = os.path.join(ROOT_OVERVW, "html_accessories")
 ACCESSORIES_REL = "html_accessories"  # relative from ROOT_OVERVW HTML pages
@@ -41,23 +70,125 @@ ACCESSORIES_REL = "html_accessories"  # relative from ROOT_OVERVW HTML pages
 PLAYER_COL = "Name"
 DATE_COL = "Date"
 
+# Where the classified data comes from:
+#   "csv"      -> the CSVs written by the CMJ / SLJ classifier scripts
+#                 (run those first)
+#   "pipeline" -> classify the raw CMJ + SLJ exports here in one pass and
+#                 hand the frames straight to the site builder; the CSVs
+#                 are only written when WRITE_CSV_EXPORTS is on
+DATA_SOURCE = "csv"
+
+# Daily / team snapshot / team overview CSVs (plus the classifier baseline
+# state in "pipeline" mode) as side outputs
+WRITE_CSV_EXPORTS = True
+
+PIPELINE_INPUTS = {"CMJ": CMJ_RAW_CSV, "SLJ": SLJ_RAW_CSV}
+PIPELINE_BASELINES = {"CMJ": CMJ_BASELINE_FILE, "SLJ": SLJ_BASELINE_FILE}
+PIPELINE_OUTPUTS = {
+    "CMJ": {"Generation": CMJ_GEN_CSV, "Absorption": CMJ_ABS_CSV, "Team": CMJ_TEAM_CSV},
+    "SLJ_L": {"Generation": SLJ_L_GEN_CSV, "Absorption": SLJ_L_ABS_CSV, "Team": SLJ_L_TEAM_CSV},
+    "SLJ_R": {"Generation": SLJ_R_GEN_CSV, "Absorption": SLJ_R_ABS_CSV, "Team": SLJ_R_TEAM_CSV},
+}
+
+# Player pages: 1 -> built one after another in this process;
+# N > 1 -> spread over N worker processes (None -> one per CPU)
+PAGE_WORKERS = 1
+
+# Pool workers share the loaded data copy-on-write where processes can
+# fork. Elsewhere (Windows) each worker re-imports this script: it loads
+# the data once, read-only, and skips the CSV / baseline side outputs.
+# In "pipeline" mode it does not classify the exports again but reads
+# the parent's run from the file named in PIPELINE_RUN_ENV.
+PAGE_WORKER = __name__ == "__mp_main__"
+PIPELINE_RUN_ENV = "JUMP_HISTORY_PIPELINE_RUN"
+
+# False -> only re-render pages whose inputs (the player's daily rows, or
+# the whole team for index.html) or this script changed since the last
+# build (see site_manifest.json); True -> re-render every page
+REBUILD_ALL_PAGES = False
+
+# Player pages:
+#   "embedded" -> one self-contained page per player (history tables and
+#                 Visualize It data inline)
+#   "lazy"     -> a light page shell plus data/player_<name>.history.json
+#                 and .viz.json; the shell renders the history tables from
+#                 the JSON on load and fetches the Visualize It series only
+#                 when that tab is opened. Browsers block fetch() from
+#                 file:// pages, so serve the folder over HTTP
+#                 (e.g. python -m http.server) in this mode.
+PLAYER_PAGE_MODE = "embedded"
+
+# Output stage (jump_pipeline/site_output.py) for the files each build
+# writes: store precompressed .gz (plus .br when the brotli package is
+# installed) siblings for the static server. A per-file size report is
+# printed at the end of the build.
+PRECOMPRESS_OUTPUT = True
+
 os.makedirs(ROOT_OVERVW, exist_ok=True)
 os.makedirs(ACCESSORIES_DIR, exist_ok=True)
 
-# ============================================================
-# 1) BUILD THE TEAM OVERVIEW CSV + PDF (unchanged)
-# ============================================================
-cmj = pd.read_csv(CMJ_TEAM_CSV)
-sljL = pd.read_csv(SLJ_L_TEAM_CSV)
-sljR = pd.read_csv(SLJ_R_TEAM_CSV)
-
-for df in [cmj, sljL, sljR]:
+def clean_columns(df):
     df.columns = (
         df.columns.astype(str)
         .str.replace("\ufeff", "", regex=False)
         .str.replace("\xa0", " ", regex=False)
         .str.strip()
     )
+    return df
+
+# ============================================================
+# 0) CLASSIFY IN PROCESS (DATA_SOURCE = "pipeline")
+#    One run over CMJ + SLJ-L + SLJ-R (one load per export, one
+#    rolling-stats pass); the team snapshots and daily rows are
+#    kept in memory for the steps below.
+# ============================================================
+pipeline_run = None
+if DATA_SOURCE == "pipeline" and PAGE_WORKER:
+    # spawn-started page worker: the parent's run, not a second one
+    with open(os.environ[PIPELINE_RUN_ENV], "rb") as f:
+        pipeline_run = pickle.load(f)
+elif DATA_SOURCE == "pipeline":
+    try:
+        pipeline_run = run_tests(
+            PIPELINE_INPUTS, ["CMJ", "SLJ_L", "SLJ_R"], PIPELINE_OUTPUTS, PIPELINE_BASELINES,
+            cache_dir=EXPORT_CACHE_DIR, write_csv=WRITE_CSV_EXPORTS,
+        )
+    except MissingColumnsError as e:
+        raise SystemExit(str(e))
+
+def share_pipeline_run():
+    # -> path of the pickled run for spawn-started page workers (None
+    #    when there is no run); the caller removes it after the pool
+    if pipeline_run is None:
+        return None
+    fd, path = tempfile.mkstemp(prefix="jump_history_run_", suffix=".pkl")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump({"daily": pipeline_run["daily"], "team": pipeline_run["team"]}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.environ[PIPELINE_RUN_ENV] = path
+    return path
+
+def team_snapshot_frame(test):
+    # the in-memory snapshot, shaped like its CSV (snapshot columns, LTD as text)
+    df = pipeline_run["team"][test]
+    df = df[[c for c in team_columns(test) if c in df.columns]].reset_index(drop=True)
+    df["LTD"] = df["LTD"].dt.strftime("%Y-%m-%d")
+    return df
+
+# ============================================================
+# 1) BUILD THE TEAM OVERVIEW (+ optional CSV)
+# ============================================================
+if pipeline_run is not None:
+    cmj = team_snapshot_frame("CMJ")
+    sljL = team_snapshot_frame("SLJ_L")
+    sljR = team_snapshot_frame("SLJ_R")
+else:
+    cmj = pd.read_csv(CMJ_TEAM_CSV)
+    sljL = pd.read_csv(SLJ_L_TEAM_CSV)
+    sljR = pd.read_csv(SLJ_R_TEAM_CSV)
+
+for df in [cmj, sljL, sljR]:
+    clean_columns(df)
+    encode_class_columns(df)
 
 cmj_sub = cmj[
     [
@@ -97,26 +228,17 @@ if "LTD" in summary.columns:
 else:
     summary = summary.sort_values(PLAYER_COL)
 
-def classify_z(z):
-    if pd.isna(z):
-        return "Avg"
-    if z >= 1:
-        return "High"
-    if z <= -1:
-        return "Low"
-    return "Avg"
-
 def classify_continuous_column(df, value_col, class_col):
     if value_col not in df.columns:
-        df[class_col] = "Avg"
+        df[class_col] = as_class(pd.Series("Avg", index=df.index))
         return df
     mean_val = df[value_col].mean()
     std_val = df[value_col].std(ddof=1)
     if std_val == 0 or pd.isna(std_val):
-        df[class_col] = "Avg"
+        df[class_col] = as_class(pd.Series("Avg", index=df.index))
     else:
         z = (df[value_col] - mean_val) / std_val
-        df[class_col] = z.apply(classify_z)
+        df[class_col] = z_classes(z, value_col)
     return df
 
 summary = classify_continuous_column(summary, "BW [KG]", "BW [KG]_class")
@@ -124,8 +246,9 @@ summary = classify_continuous_column(summary, "Jump Height (Imp-Mom) [cm]", "Jum
 summary = classify_continuous_column(summary, "Jump Height (Imp-Mom) [cm] (L)", "Jump Height (Imp-Mom) [cm] (L)_class")
 summary = classify_continuous_column(summary, "Jump Height (Imp-Mom) [cm] (R)", "Jump Height (Imp-Mom) [cm] (R)_class")
 
-summary.to_csv(OUTPUT_SUMMARY_CSV, index=False)
-print("Saved unified team overview CSV to:", OUTPUT_SUMMARY_CSV)
+if WRITE_CSV_EXPORTS and not PAGE_WORKER:
+    summary.to_csv(OUTPUT_SUMMARY_CSV, index=False)
+    print("Saved unified team overview CSV to:", OUTPUT_SUMMARY_CSV)
 
 # ============================================================
 # 2) HTML GENERATION
@@ -420,723 +543,898 @@ document.addEventListener("DOMContentLoaded", () => {
 });
 """
 
-COLOR_MAP_PY = {
-    "High": {"bg": "#FF7276", "text": "#840000"},
-    "Low":  {"bg": "#87CEEB", "text": "#305CDE"},
-    "Avg":  {"bg": "#D3D3D3", "text": "black"},
-}
+# ============================================================
+# Visualize It JS (player pages; data comes from window.PLAYER_DATA,
+# or is fetched from window.PLAYER_DATA_URL on lazy pages)
+# EDITS ONLY:
+# - Time series (Line) x-axis ALWAYS Date (and hide/disable X dropdown)
+# ============================================================
+VISUALIZE_IT_JS = r"""
+(function(){
+  const COLORS = {
+    "CMJ":   "#CE0E2D",
+    "SLJ_L": "#3A8DDE",
+    "SLJ_R": "#F25623"
+  };
 
-def normalize_class(v) -> str:
-    s = "" if v is None else str(v).strip()
-    if s in ("High", "Low", "Avg"):
-        return s
-    return "Avg"
+  function colorForTest(t){
+    return COLORS[t] || "#CE0E2D";
+  }
 
-def classify_color(class_val):
-    v = normalize_class(class_val)
-    colors = COLOR_MAP_PY.get(v, COLOR_MAP_PY["Avg"])
-    return (colors["bg"], colors["text"])
+  function $(id){ return document.getElementById(id); }
 
-def arrow_for_class(cls: str) -> str:
-    c = normalize_class(cls)
-    if c == "High":
-        return "↑"
-    if c == "Low":
-        return "↓"
-    return "-"
+  const VAR_DEFS = [
+    {key:"Body Weight [kg]", label:"Body Weight [kg]"},
+    {key:"Jump Height [cm]", label:"Jump Height [cm]"},
+    {key:"Braking Duration [ms]", label:"Braking Duration [ms]"},
+    {key:"Squat Depth [cm]", label:"Squat Depth [cm]"},
+    {key:"Braking Force [N/kg]", label:"Braking Force [N/kg]"},
+    {key:"Propulsive Duration [ms]", label:"Propulsive Duration [ms]"},
+    {key:"Propulsive Force [N/kg]", label:"Propulsive Force [N/kg]"}
+  ];
 
-def safe_player_filename(name):
-    safe = "".join(c if c.isalnum() or c in " _-" else "_" for c in str(name))
-    safe = safe.strip().replace(" ", "_")
-    return f"player_{safe}.html"
+  // window.PLAYER_DATA is column-wise ({Test: [...], Date: [...], <var>: [...]});
+  // one pass turns it into the per-test records the filters / plots use
+  function recordsFromColumns(cols){
+    if (!cols || !cols.Date) return [];
+    const keys = Object.keys(cols);
+    return cols.Date.map((_, i) => {
+      const rec = {};
+      for (const k of keys) rec[k] = cols[k][i];
+      return rec;
+    });
+  }
 
-def html_escape(s):
-    if s is None:
-        return ""
-    s = str(s)
-    return (s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&#39;"))
+  // Lazy pages set window.PLAYER_DATA_URL instead: the same columns are
+  // fetched the first time the Visualize It tab is opened
+  let PLAYER_DATA = window.PLAYER_DATA_URL ? null : recordsFromColumns(window.PLAYER_DATA);
+  let __vizLoading = false;
+  function loadVizData(){
+    if (__vizLoading) return;
+    __vizLoading = true;
+    const msg = $("viz-msg");
+    if (msg) msg.textContent = "Loading data...";
+    fetch(window.PLAYER_DATA_URL)
+      .then(r => { if (!r.ok) throw new Error("HTTP " + r.status); return r.json(); })
+      .then(cols => {
+        PLAYER_DATA = recordsFromColumns(cols);
+        if (msg) msg.textContent = "";
+        initVizOnce();
+      })
+      .catch(() => {
+        __vizLoading = false;
+        if (msg) msg.textContent = "Could not load this player's data (serve the site over HTTP).";
+      });
+  }
 
-def player_headshot_rel(player_name: str) -> str:
-    return f"{ACCESSORIES_REL}/{quote(str(player_name))}.png"
+  function setTab(tabId){
+    const tabHistory = $("tab-history");
+    const tabViz = $("tab-viz");
+    const btnHistory = $("tabbtn-history");
+    const btnViz = $("tabbtn-viz");
+    if (!tabHistory || !tabViz || !btnHistory || !btnViz) return;
 
-DURATION_COLS = {
-    "Concentric Duration [ms]",
-    "Braking Phase Duration [ms]",
-    "Concentric Duration [ms] (L)",
-    "Braking Phase Duration [ms] (L)",
-    "Concentric Duration [ms] (R)",
-    "Braking Phase Duration [ms] (R)",
-}
+    if (tabId === "viz") {
+      tabHistory.style.display = "none";
+      tabViz.style.display = "";
+      btnViz.classList.add("active");
+      btnHistory.classList.remove("active");
+      try { localStorage.setItem("playerTab", "viz"); } catch(e) {}
+      try { initVizOnce(); } catch(e) {}
+    } else {
+      tabViz.style.display = "none";
+      tabHistory.style.display = "";
+      btnHistory.classList.add("active");
+      btnViz.classList.remove("active");
+      try { localStorage.setItem("playerTab", "history"); } catch(e) {}
+    }
+  }
 
-def format_number(col, val):
-    try:
-        x = float(val)
-    except Exception:
-        return str(val)
-    if pd.isna(x):
-        return ""
-    if col in DURATION_COLS:
-        return f"{round(x):.0f}"
-    return f"{x:.1f}"
+  function uniq(arr){ return Array.from(new Set(arr)); }
 
-def format_z(z):
-    try:
-        x = float(z)
-    except Exception:
-        return ""
-    if pd.isna(x):
-        return ""
-    return f"{x:.2f}"
+  function minDate(dates){
+    if (!dates.length) return "";
+    return dates.reduce((a,b)=> (a<b?a:b));
+  }
+  function maxDate(dates){
+    if (!dates.length) return "";
+    return dates.reduce((a,b)=> (a>b?a:b));
+  }
+  function inRange(dateStr, startStr, endStr){
+    if (!dateStr) return false;
+    if (startStr && dateStr < startStr) return false;
+    if (endStr && dateStr > endStr) return false;
+    return true;
+  }
 
-def unit_from_col(col: str) -> str:
-    s = str(col)
-    i1 = s.find("[")
-    i2 = s.find("]")
-    if i1 != -1 and i2 != -1 and i2 > i1:
-        return s[i1+1:i2].strip()
-    return ""
+  function testLabel(t){
+    if (t === "CMJ") return "CMJ";
+    if (t === "SLJ_L") return "SLJ - Left";
+    if (t === "SLJ_R") return "SLJ - Right";
+    return t || "";
+  }
 
-# ============================================================
-# WORD DISPLAY (old words, unbolded, stacked)
-# ============================================================
-def word_for_duration(cls: str) -> str:
-    c = normalize_class(cls)
-    if c == "Low":
-        return "Quicker"
-    if c == "High":
-        return "Slower"
-    return "Normal"
+  function filteredRecords(){
+    const recs = (PLAYER_DATA || []).slice();
+    const test = $("viz-test") ? $("viz-test").value : "ALL";
+    const start = $("viz-date-start") ? $("viz-date-start").value : "";
+    const end = $("viz-date-end") ? $("viz-date-end").value : "";
 
-def word_for_force(cls: str) -> str:
-    c = normalize_class(cls)
-    if c == "High":
-        return "Stronger"
-    if c == "Low":
-        return "Weaker"
-    return "Normal"
+    return recs.filter(r => {
+      if (test && test !== "ALL" && r.Test !== test) return false;
+      if (!inRange(r.Date, start, end)) return false;
+      return true;
+    });
+  }
 
-def word_for_depth(cls: str) -> str:
-    c = normalize_class(cls)
-    if c == "High":
-        return "Deeper"
-    if c == "Low":
-        return "Shallower"
-    return "Normal"
+  function getAvailableVarsForTest(test){
+    const recs = (PLAYER_DATA || []).filter(r => test === "ALL" ? true : r.Test === test);
+    const available = [];
+    VAR_DEFS.forEach(vd => {
+      const hasAny = recs.some(r => typeof r[vd.key] === "number" && !isNaN(r[vd.key]));
+      if (hasAny) available.push(vd);
+    });
+    return available;
+  }
 
-def label_to_word(lbl: str, cls: str) -> str:
-    if lbl in ("PD", "BD"):
-        return word_for_duration(cls)
-    if lbl == "DEP":
-        return word_for_depth(cls)
-    if lbl in ("PF", "BF"):
-        return word_for_force(cls)
-    return "Normal"
+  function setSelectOptions(selectEl, options, defaultKey){
+    if (!selectEl) return;
+    selectEl.innerHTML = "";
+    options.forEach(opt => {
+      const o = document.createElement("option");
+      o.value = opt.key;
+      o.textContent = opt.label;
+      selectEl.appendChild(o);
+    });
+    if (options.length) {
+      const pick = options.find(o => o.key === defaultKey) ? defaultKey : options[0].key;
+      selectEl.value = pick;
+    }
+  }
 
-def pretty_lbl(lbl: str) -> str:
-    return {"PD":"Duration", "BD":"Duration", "DEP":"Depth", "PF":"Force", "BF":"Force"}.get(lbl, lbl)
+  function syncVariableDropdowns(){
+    const test = $("viz-test") ? $("viz-test").value : "ALL";
+    const avail = getAvailableVarsForTest(test);
 
-def value_unit_z_text(colname: str, value, z) -> str:
-    v_str = "" if pd.isna(value) else format_number(colname, value)
-    if v_str == "":
-        return ""
-    unit = unit_from_col(colname)
-    unit_str = f" {unit}" if unit else ""
-    z_str = format_z(z)
-    if z_str == "":
-        return f"{v_str}{unit_str}"
-    return f"{v_str}{unit_str} (Z: {z_str})"
+    const plotType = $("viz-plot-type") ? $("viz-plot-type").value : "scatter";
+    const xSel = $("viz-x");
 
-def tooltip_label_for_component(lbl: str, colname: str, value, z) -> str:
-    detail = value_unit_z_text(colname, value, z)
-    if detail == "":
-        return f"{lbl}: N/A"
-    return f"{lbl}: {detail}"
+    // Always rebuild X options (but "line" will force Date and disable)
+    if (xSel) {
+      xSel.innerHTML = "";
+      const od = document.createElement("option");
+      od.value = "Date";
+      od.textContent = "Date";
+      xSel.appendChild(od);
+      avail.forEach(v => {
+        const o = document.createElement("option");
+        o.value = v.key;
+        o.textContent = v.label;
+        xSel.appendChild(o);
+      });
+      xSel.value = "Date";
+      // For time series (line), lock X to Date
+      if (plotType === "line") {
+        xSel.value = "Date";
+        xSel.disabled = true;
+      } else {
+        xSel.disabled = false;
+      }
+    }
 
-def build_advanced_phase_cell_html_words_only(adv_items):
-    lines = []
-    for it in adv_items:
-        lbl = it["lbl"]
-        cls = normalize_class(it["cls"])
-        word = label_to_word(lbl, cls)
-        fg = classify_color(cls)[1]
-        txt = f"{pretty_lbl(lbl)}: {word}"
-        lines.append(f"<div class='adv-line' style='color:{fg};'>{html_escape(txt)}</div>")
-    return "".join(lines)
+    const ySel = $("viz-y");
+    const defaultY = avail.find(v => v.key.indexOf("Jump Height") !== -1)?.key;
+    setSelectOptions(ySel, avail, defaultY);
 
-def build_advanced_phase_tooltip_items_str(adv_items):
-    parts = []
-    for it in adv_items:
-        lbl = it["lbl"]
-        cls = normalize_class(it["cls"])
-        col = it["col"]
-        val = it["val"]
-        z = it["z"]
-        label = tooltip_label_for_component(lbl, col, val, z)
-        parts.append(f"{label}|{cls}")
-    return ";".join(parts)
-
-# ============================================================
-# LOGIC IMPLEMENTATION (unchanged)
-# ============================================================
-def classify_generation_from_components(PD, DEP, PF) -> str:
-    if PD not in ["High", "Low", "Avg"] or DEP not in ["High", "Low", "Avg"] or PF not in ["High", "Low", "Avg"]:
-        return ""
-    if PD == "High" and DEP == "High":
-        if PF in ["Avg", "Low"]: return "Low"
-        if PF == "High": return "Avg"
-    if PD == "Low" and DEP == "Low":
-        if PF == "Avg": return "High"
-        if PF == "Low": return "Avg"
-        if PF == "High": return "High"
-    if PD == "High" and DEP == "Avg":
-        if PF in ["Avg", "Low"]: return "Low"
-        if PF == "High": return "High"
-    if DEP == "High" and PD == "Avg":
-        if PF == "Avg": return "High"
-        if PF == "Low": return "Low"
-        if PF == "High": return "High"
-    if PD == "Low" and DEP == "Avg":
-        if PF == "Avg": return "High"
-        if PF == "Low": return "Low"
-        if PF == "High": return "High"
-    if DEP == "Low" and PD == "Avg":
-        if PF in ["Avg", "Low"]: return "Low"
-        if PF == "High": return "High"
-    if PD == "Avg" and DEP == "Avg":
-        if PF == "High": return "High"
-        if PF == "Low": return "Low"
-        return "Avg"
-    if PD == "Low" and DEP == "High": return "High"
-    if PD == "High" and DEP == "Low": return "Low"
-    return "Avg"
-
-def classify_absorption_from_components(BD, DEP, BF) -> str:
-    if BD not in ["High", "Low", "Avg"] or DEP not in ["High", "Low", "Avg"] or BF not in ["High", "Low", "Avg"]:
-        return ""
-    if BD == "High" and DEP == "High":
-        if BF in ["Avg", "Low"]: return "High"
-        if BF == "High": return "Avg"
-    if BD == "Low" and DEP == "Low":
-        if BF == "Avg": return "Low"
-        if BF == "Low": return "Avg"
-        if BF == "High": return "Low"
-    if BD == "High" and DEP == "Avg":
-        if BF in ["Avg", "Low"]: return "Low"
-        if BF == "High": return "High"
-    if DEP == "High" and BD == "Avg":
-        if BF == "Avg": return "High"
-        if BF == "Low": return "Low"
-        if BF == "High": return "High"
-    if BD == "Low" and DEP == "Avg":
-        if BF == "Avg": return "High"
-        if BF == "Low": return "Low"
-        if BF == "High": return "High"
-    if DEP == "Low" and BD == "Avg":
-        if BF in ["Avg", "Low"]: return "Low"
-        if BF == "High": return "High"
-    if BD == "Avg" and DEP == "Avg":
-        if BF == "High": return "High"
-        if BF == "Low": return "Low"
-        return "Avg"
-    if BD == "Low" and DEP == "High": return "High"
-    if BD == "High" and DEP == "Low": return "Low"
-    return "Avg"
-
-# ============================================================
-# LOAD TEAM OVERVIEW (CSV created above)
-# ============================================================
-team_df = pd.read_csv(TEAM_OVERVIEW_CSV)
-if "LTD" in team_df.columns:
-    team_df["LTD_dt"] = pd.to_datetime(team_df["LTD"], errors="coerce")
-    team_df = team_df.sort_values("LTD_dt", ascending=False).drop(columns=["LTD_dt"])
-else:
-    team_df = team_df.sort_values(PLAYER_COL)
+    const varSel = $("viz-var");
+    setSelectOptions(varSel, avail, defaultY);
+  }
 
-# ============================================================
-# LOAD DAILY FILES
-# ============================================================
-def load_daily(file_path, label):
-    if not os.path.exists(file_path):
-        print(f"WARNING: {label} file not found at {file_path}.")
-        return pd.DataFrame()
-    df = pd.read_csv(file_path)
-    df.columns = (
-        df.columns.astype(str)
-          .str.replace("\ufeff", "", regex=False)
-          .str.replace("\xa0", " ", regex=False)
-          .str.strip()
-    )
-    if DATE_COL in df.columns:
-        df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="coerce")
-    return df
+  function syncControlVisibility(){
+    const plotType = $("viz-plot-type");
+    const rowXY = $("viz-row-xy");
+    const rowVar = $("viz-row-var");
+    const rowGroup = $("viz-row-group");
+    if (!plotType) return;
 
-cmj_gen = load_daily(CMJ_GEN_CSV, "CMJ Generation")
-cmj_abs = load_daily(CMJ_ABS_CSV, "CMJ Absorption")
-sljL_gen = load_daily(SLJ_L_GEN_CSV, "SLJ-L Generation")
-sljL_abs = load_daily(SLJ_L_ABS_CSV, "SLJ-L Absorption")
-sljR_gen = load_daily(SLJ_R_GEN_CSV, "SLJ-R Generation")
-sljR_abs = load_daily(SLJ_R_ABS_CSV, "SLJ-R Absorption")
+    const v = plotType.value;
 
-def merge_daily(gen_df, abs_df):
-    if gen_df.empty and abs_df.empty:
-        return pd.DataFrame()
-    if gen_df.empty:
-        return abs_df.copy()
-    if abs_df.empty:
-        return gen_df.copy()
-    return pd.merge(gen_df, abs_df, on=[PLAYER_COL, DATE_COL], how="outer", suffixes=("_GEN", "_ABS"))
+    if (rowXY) rowXY.style.display = (v === "scatter" || v === "line") ? "" : "none";
+    if (rowVar) rowVar.style.display = (v === "box") ? "" : "none";
+    if (rowGroup) rowGroup.style.display = (v === "box") ? "" : "none";
 
-def coalesce_columns(df, base_name):
-    if base_name not in df.columns:
-        for cand in [base_name + "_GEN", base_name + "_ABS", base_name + "_x", base_name + "_y"]:
-            if cand in df.columns:
-                df[base_name] = df[cand]
-                break
-    class_base = base_name + "_class"
-    if class_base not in df.columns:
-        for cand in [class_base + "_GEN", class_base + "_ABS", class_base + "_x", class_base + "_y"]:
-            if cand in df.columns:
-                df[class_base] = df[cand]
-                break
-    avg_prev = base_name + "_avg_prev"
-    if avg_prev not in df.columns:
-        for cand in [avg_prev + "_GEN", avg_prev + "_ABS", avg_prev + "_x", avg_prev + "_y"]:
-            if cand in df.columns:
-                df[avg_prev] = df[cand]
-                break
-    z_col = base_name + "_z"
-    if z_col not in df.columns:
-        for cand in [z_col + "_GEN", z_col + "_ABS", z_col + "_x", z_col + "_y"]:
-            if cand in df.columns:
-                df[z_col] = df[cand]
-                break
+    // For line plot, lock X selector to Date (also handled in syncVariableDropdowns)
+    const xSel = $("viz-x");
+    if (xSel) {
+      if (v === "line") {
+        xSel.value = "Date";
+        xSel.disabled = true;
+      } else {
+        xSel.disabled = false;
+      }
+    }
+  }
 
-def coalesce_simple(df, col_base):
-    if col_base in df.columns:
-        return
-    for cand in [col_base + "_GEN", col_base + "_ABS", col_base + "_x", col_base + "_y"]:
-        if cand in df.columns:
-            df[col_base] = df[cand]
-            break
+  // quantiles for box hover text (removes fence entirely)
+  function quantileSorted(sorted, q){
+    if (!sorted.length) return null;
+    if (sorted.length === 1) return sorted[0];
+    const pos = (sorted.length - 1) * q;
+    const base = Math.floor(pos);
+    const rest = pos - base;
+    if (sorted[base + 1] === undefined) return sorted[base];
+    return sorted[base] + rest * (sorted[base + 1] - sorted[base]);
+  }
 
-def standardize_test_df(df, test_type):
-    if df.empty:
-        return df
+  let __vizInitialized = false;
+  function initVizOnce(){
+    if (__vizInitialized) return;
+    if (PLAYER_DATA === null) { loadVizData(); return; }
+    __vizInitialized = true;
 
-    if test_type == "CMJ":
-        bases = [
-            "Concentric Duration [ms]",
-            "Concentric Mean Force / BM [N/kg]",
-            "Braking Phase Duration [ms]",
-            "Countermovement Depth [cm]",
-            "Eccentric Mean Force / BM [N/kg]",
-            "BW [KG]",
-            "Jump Height (Imp-Mom) [cm]",
-        ]
-    elif test_type == "SLJ_L":
-        bases = [
-            "Concentric Duration [ms] (L)",
-            "Concentric Mean Force / BM [N/kg] (L)",
-            "Braking Phase Duration [ms] (L)",
-            "Countermovement Depth [cm] (L)",
-            "Eccentric Mean Force / BM [N/kg] (L)",
-            "BW [KG]",
-            "Jump Height (Imp-Mom) [cm] (L)",
-        ]
-    else:
-        bases = [
-            "Concentric Duration [ms] (R)",
-            "Concentric Mean Force / BM [N/kg] (R)",
-            "Braking Phase Duration [ms] (R)",
-            "Countermovement Depth [cm] (R)",
-            "Eccentric Mean Force / BM [N/kg] (R)",
-            "BW [KG]",
-            "Jump Height (Imp-Mom) [cm] (R)",
-        ]
+    const recs = (PLAYER_DATA || []).slice();
+    const dates = recs.map(r => r.Date).filter(Boolean);
+    const dmin = minDate(dates);
+    const dmax = maxDate(dates);
 
-    for b in bases:
-        coalesce_columns(df, b)
+    const dateStart = $("viz-date-start");
+    const dateEnd = $("viz-date-end");
+    if (dateStart) dateStart.value = dmin;
+    if (dateEnd) dateEnd.value = dmax;
 
-    coalesce_simple(df, "Generation_Class")
-    coalesce_simple(df, "Absorption_Class")
+    const testSel = $("viz-test");
+    if (testSel) {
+      const tests = uniq(recs.map(r => r.Test).filter(Boolean));
+      testSel.innerHTML = "";
+      const optAll = document.createElement("option");
+      optAll.value = "ALL";
+      optAll.textContent = "All Tests";
+      testSel.appendChild(optAll);
+      tests.forEach(t => {
+        const opt = document.createElement("option");
+        opt.value = t;
+        opt.textContent = testLabel(t);
+        testSel.appendChild(opt);
+      });
+      testSel.value = "ALL";
+    }
 
-    if test_type == "SLJ_L":
-        if "Generation_Class" not in df.columns and "Generation_Class_L" in df.columns:
-            df["Generation_Class"] = df["Generation_Class_L"]
-        if "Absorption_Class" not in df.columns and "Absorption_Class_L" in df.columns:
-            df["Absorption_Class"] = df["Absorption_Class_L"]
+    const plotType = $("viz-plot-type");
+    if (plotType) {
+      plotType.innerHTML = "";
+      [
+        {v:"scatter", t:"Scatter"},
+        {v:"line", t:"Line (time series)"},
+        {v:"box", t:"Box Plot"}
+      ].forEach(p => {
+        const opt = document.createElement("option");
+        opt.value = p.v; opt.textContent = p.t;
+        plotType.appendChild(opt);
+      });
+      plotType.value = "scatter";
+    }
 
-    if test_type == "SLJ_R":
-        if "Generation_Class" not in df.columns and "Generation_Class_R" in df.columns:
-            df["Generation_Class"] = df["Generation_Class_R"]
-        if "Absorption_Class" not in df.columns and "Absorption_Class_R" in df.columns:
-            df["Absorption_Class"] = df["Absorption_Class_R"]
+    const groupSel = $("viz-group");
+    if (groupSel) {
+      groupSel.innerHTML = "";
+      [
+        {v:"NONE", t:"No grouping"},
+        {v:"Test", t:"Group by Test"}
+      ].forEach(g => {
+        const opt = document.createElement("option");
+        opt.value = g.v; opt.textContent = g.t;
+        groupSel.appendChild(opt);
+      });
+      groupSel.value = "Test";
+    }
 
-    return df
+    syncVariableDropdowns();
+    syncControlVisibility();
 
-cmj_daily = standardize_test_df(merge_daily(cmj_gen, cmj_abs), "CMJ")
-sljL_daily = standardize_test_df(merge_daily(sljL_gen, sljL_abs), "SLJ_L")
-sljR_daily = standardize_test_df(merge_daily(sljR_gen, sljR_abs), "SLJ_R")
+    if (testSel) testSel.addEventListener("change", () => {
+      syncVariableDropdowns();
+      renderPlot();
+    });
 
-def recompute_overall_phase_classes(df_daily, test_type: str):
-    if df_daily is None or df_daily.empty:
-        return df_daily
+    if (plotType) plotType.addEventListener("change", () => {
+      syncVariableDropdowns();   // IMPORTANT: re-lock X when switching to line
+      syncControlVisibility();
+      renderPlot();
+    });
 
-    if test_type == "CMJ":
-        pd_col = "Concentric Duration [ms]"
-        pf_col = "Concentric Mean Force / BM [N/kg]"
-        bd_col = "Braking Phase Duration [ms]"
-        dep_col = "Countermovement Depth [cm]"
-        bf_col = "Eccentric Mean Force / BM [N/kg]"
-    elif test_type == "SLJ_L":
-        pd_col = "Concentric Duration [ms] (L)"
-        pf_col = "Concentric Mean Force / BM [N/kg] (L)"
-        bd_col = "Braking Phase Duration [ms] (L)"
-        dep_col = "Countermovement Depth [cm] (L)"
-        bf_col = "Eccentric Mean Force / BM [N/kg] (L)"
-    else:
-        pd_col = "Concentric Duration [ms] (R)"
-        pf_col = "Concentric Mean Force / BM [N/kg] (R)"
-        bd_col = "Braking Phase Duration [ms] (R)"
-        dep_col = "Countermovement Depth [cm] (R)"
-        bf_col = "Eccentric Mean Force / BM [N/kg] (R)"
+    ["viz-date-start","viz-date-end","viz-x","viz-y","viz-var","viz-group"].forEach(id=>{
+      const el = $(id);
+      if (el) el.addEventListener("change", () => renderPlot());
+    });
 
-    def cls_of(row, base):
-        return normalize_class(row.get(f"{base}_class", "Avg"))
+    const renderBtn = $("viz-render");
+    if (renderBtn) renderBtn.addEventListener("click", () => renderPlot());
 
-    if all(f"{c}_class" in df_daily.columns for c in [pd_col, dep_col, pf_col]):
-        df_daily["Generation_Class"] = df_daily.apply(
-            lambda r: classify_generation_from_components(cls_of(r, pd_col), cls_of(r, dep_col), cls_of(r, pf_col)),
-            axis=1
-        )
+    const resetBtn = $("viz-reset");
+    if (resetBtn) resetBtn.addEventListener("click", () => {
+      if (testSel) testSel.value = "ALL";
+      if (plotType) plotType.value = "scatter";
+      if (dateStart) dateStart.value = dmin;
+      if (dateEnd) dateEnd.value = dmax;
+      if (groupSel) groupSel.value = "Test";
+      syncVariableDropdowns();
+      syncControlVisibility();
+      renderPlot();
+    });
 
-    if all(f"{c}_class" in df_daily.columns for c in [bd_col, dep_col, bf_col]):
-        df_daily["Absorption_Class"] = df_daily.apply(
-            lambda r: classify_absorption_from_components(cls_of(r, bd_col), cls_of(r, dep_col), cls_of(r, bf_col)),
-            axis=1
-        )
+    loadChartScript(renderPlot);
+  }
 
-    return df_daily
+  // The chart renderer (static/chart.*.js, named by #viz-plot[data-chart-src])
+  // is only fetched the first time the Visualize It tab is opened
+  function loadChartScript(done){
+    const plotDiv = $("viz-plot");
+    const src = plotDiv ? plotDiv.getAttribute("data-chart-src") : null;
+    if (typeof JumpChart !== "undefined" || !src) { done(); return; }
+    const script = document.createElement("script");
+    script.src = src;
+    script.onload = done;
+    script.onerror = done;
+    document.head.appendChild(script);
+  }
 
-cmj_daily = recompute_overall_phase_classes(cmj_daily, "CMJ")
-sljL_daily = recompute_overall_phase_classes(sljL_daily, "SLJ_L")
-sljR_daily = recompute_overall_phase_classes(sljR_daily, "SLJ_R")
+  function renderPlot(){
+    if (typeof JumpChart === "undefined") {
+      const msg = $("viz-msg");
+      if (msg) msg.textContent = "The chart script failed to load.";
+      return;
+    }
+    const msg = $("viz-msg");
+    if (msg) msg.textContent = "";
 
-# ============================================================
-# Phase component mapping
-# ============================================================
-def phase_component_columns(test_type, phase):
-    if test_type == "CMJ":
-        PD = "Concentric Duration [ms]"
-        PF = "Concentric Mean Force / BM [N/kg]"
-        BD = "Braking Phase Duration [ms]"
-        DEP = "Countermovement Depth [cm]"
-        BF = "Eccentric Mean Force / BM [N/kg]"
-    elif test_type == "SLJ_L":
-        PD = "Concentric Duration [ms] (L)"
-        PF = "Concentric Mean Force / BM [N/kg] (L)"
-        BD = "Braking Phase Duration [ms] (L)"
-        DEP = "Countermovement Depth [cm] (L)"
-        BF = "Eccentric Mean Force / BM [N/kg] (L)"
-    else:
-        PD = "Concentric Duration [ms] (R)"
-        PF = "Concentric Mean Force / BM [N/kg] (R)"
-        BD = "Braking Phase Duration [ms] (R)"
-        DEP = "Countermovement Depth [cm] (R)"
-        BF = "Eccentric Mean Force / BM [N/kg] (R)"
+    const recs = filteredRecords();
+    const plotType = $("viz-plot-type") ? $("viz-plot-type").value : "scatter";
+    const plotDiv = $("viz-plot");
+    if (!plotDiv) return;
 
-    if phase == "Generation":
-        return [("PD", PD), ("DEP", DEP), ("PF", PF)]
-    return [("BD", BD), ("DEP", DEP), ("BF", BF)]
+    if (!recs.length) {
+      JumpChart.newPlot(plotDiv, [], { title: "No data in selected range." });
+      return;
+    }
 
-# ============================================================
-# Z-score fallback computation (per player, per test_type, per param)
-# ============================================================
-def compute_z_for_value(df_all, player, value_col, value):
-    try:
-        x_all = pd.to_numeric(df_all[df_all[PLAYER_COL] == player][value_col], errors="coerce")
-        mu = x_all.mean()
-        sd = x_all.std(ddof=1)
-        x_cur = pd.to_numeric(pd.Series([value]), errors="coerce").iloc[0]
-        if pd.isna(sd) or sd == 0 or pd.isna(mu) or pd.isna(x_cur):
-            return None
-        return (x_cur - mu) / sd
-    except Exception:
-        return None
+    const commonLayout = {
+      paper_bgcolor: "rgba(0,0,0,0)",
+      plot_bgcolor: "rgba(255,255,255,0.06)",
+      font: { color: "#FFFFFF" },
+      legend: { orientation: "h" },
+      margin: { t: 60, l: 60, r: 30, b: 60 }
+    };
 
-def get_df_for_test(test_type):
-    return cmj_daily if test_type == "CMJ" else sljL_daily if test_type == "SLJ_L" else sljR_daily
+    if (plotType === "scatter" || plotType === "line") {
+      // FORCE Date for line (time series)
+      const xKey = (plotType === "line") ? "Date" : ($("viz-x") ? $("viz-x").value : "Date");
+      const yKey = $("viz-y") ? $("viz-y").value : "";
+      const mode = (plotType === "line") ? "lines+markers" : "markers";
 
-def get_latest_phase_components(player, test_type, phase):
-    df = get_df_for_test(test_type)
-    if df is None or df.empty:
-        return ("", [], [])
-    sub = df[df[PLAYER_COL] == player].copy()
-    if sub.empty:
-        return ("", [], [])
-    sub = sub.sort_values(DATE_COL)
-    last = sub.iloc[-1]
-    date_val = last.get(DATE_COL, None)
-    date_str = date_val.strftime("%Y-%m-%d") if isinstance(date_val, pd.Timestamp) else ""
+      const tests = uniq(recs.map(r => r.Test).filter(Boolean));
+      const traces = tests.map(t => {
+        const sub = recs.filter(r => r.Test === t);
+        const xs = [];
+        const ys = [];
+        const cd = []; // [TestLabel, Date]
+        sub.forEach(r => {
+          const xv = (xKey === "Date") ? r.Date : (typeof r[xKey] === "number" ? r[xKey] : null);
+          const yv = (typeof r[yKey] === "number" ? r[yKey] : null);
+          if (xv == null || yv == null) return;
+          xs.push(xv);
+          ys.push(yv);
+          cd.push([testLabel(r.Test), r.Date]);
+        });
 
-    mapping = phase_component_columns(test_type, phase)
+        const c = colorForTest(t);
 
-    tooltip_items_summary = []
-    adv_items = []
+        if (xKey === "Date") {
+          const zipped = xs.map((x,i)=>({x, y:ys[i], cd:cd[i]})).sort((a,b)=> a.x.localeCompare(b.x));
+          return {
+            type: "scatter",
+            mode: mode,
+            name: testLabel(t),
+            x: zipped.map(z=>z.x),
+            y: zipped.map(z=>z.y),
+            customdata: zipped.map(z=>z.cd),
+            marker: { color: c, size: 8 },
+            line: { color: c, width: 2 },
+            hovertemplate:
+              "Test: %{customdata[0]}<br>" +
+              "Date: %{customdata[1]}<br>" +
+              (xKey === "Date" ? "" : ("X: %{x:.1f}<br>")) +
+              "Y: %{y:.1f}<extra></extra>"
+          };
+        }
 
-    for lbl, col in mapping:
-        cls = normalize_class(last.get(f"{col}_class", "Avg"))
-        tooltip_items_summary.append((lbl, cls))
+        return {
+          type: "scatter",
+          mode: mode,
+          name: testLabel(t),
+          x: xs,
+          y: ys,
+          customdata: cd,
+          marker: { color: c, size: 8 },
+          line: { color: c, width: 2 },
+          hovertemplate:
+            "Test: %{customdata[0]}<br>" +
+            "Date: %{customdata[1]}<br>" +
+            "X: %{x:.1f}<br>" +
+            "Y: %{y:.1f}<extra></extra>"
+        };
+      });
 
-        val = last.get(col, None)
+      const layout = Object.assign({}, commonLayout, {
+        title: (plotType === "line" ? "Line" : "Scatter") + `: ${yKey} vs ${xKey === "Date" ? "Date" : xKey}`,
+        xaxis: { title: (xKey === "Date" ? "Date" : xKey) },
+        yaxis: { title: yKey }
+      });
 
-        z_val = last.get(f"{col}_z", None)
-        if z_val is None or (isinstance(z_val, float) and pd.isna(z_val)) or str(z_val) == "nan":
-            z_val = compute_z_for_value(df, player, col, val)
+      JumpChart.newPlot(plotDiv, traces, layout);
+      return;
+    }
 
-        adv_items.append({"lbl": lbl, "cls": cls, "col": col, "val": val, "z": z_val})
+    if (plotType === "box") {
+      const vKey = $("viz-var") ? $("viz-var").value : "";
+      const groupKey = $("viz-group") ? $("viz-group").value : "Test";
 
-    return (date_str, tooltip_items_summary, adv_items)
+      let groups = ["All"];
+      if (groupKey === "Test") {
+        groups = uniq(recs.map(r => r.Test)).filter(Boolean);
+      }
 
-# ============================================================
-# TEAM OVERVIEW HTML HELPERS
-# ============================================================
-def get_param_mean(player, test_type, param_col):
-    df = cmj_daily if test_type == "CMJ" else sljL_daily if test_type == "SLJ_L" else sljR_daily
-    if df is None or df.empty or param_col not in df.columns:
-        return None
-    sub = df[df[PLAYER_COL] == player]
-    if sub.empty:
-        return None
-    m = pd.to_numeric(sub[param_col], errors="coerce").mean()
-    return None if pd.isna(m) else m
+      const traces = [];
 
-def get_latest_param_class(player, test_type, param_col):
-    df = cmj_daily if test_type == "CMJ" else sljL_daily if test_type == "SLJ_L" else sljR_daily
-    if df is None or df.empty or param_col not in df.columns:
-        return None
-    sub = df[df[PLAYER_COL] == player].copy()
-    if sub.empty:
-        return None
-    sub = sub.sort_values(DATE_COL)
-    last = sub.iloc[-1]
-    return last.get(f"{param_col}_class", None)
+      groups.forEach(g => {
+        const sub = (groupKey === "Test") ? recs.filter(r => r.Test === g) : recs;
+        const ys = sub.map(r => r[vKey]).filter(v => typeof v === "number" && !isNaN(v));
+        const c = (groupKey === "Test") ? colorForTest(g) : colorForTest("CMJ");
 
-# ============================================================
-# TEAM OVERVIEW HTML
-# ============================================================
-def build_team_overview_html(df: pd.DataFrame, out_path: str):
-    cols = [
-        PLAYER_COL, "TTD", "LTD",
-        "BW [KG]",
-        "Jump Height (Imp-Mom) [cm]",
-        "Jump Height (Imp-Mom) [cm] (L)",
-        "Jump Height (Imp-Mom) [cm] (R)",
-        "CMJ_ABS_OVR", "CMJ_GEN_OVR",
-        "SLJ_L_ABS_OVR", "SLJ_L_GEN_OVR",
-        "SLJ_R_ABS_OVR", "SLJ_R_GEN_OVR",
-    ]
+        // No hover on the box itself (fences & duplicates)
+        traces.push({
+          type: "box",
+          name: (groupKey === "Test") ? testLabel(g) : "All",
+          y: ys,
+          boxpoints: "outliers",
+          marker: { color: c },
+          line: { color: c },
+          hoverinfo: "skip"
+        });
 
-    display_labels = {
-        PLAYER_COL: "PLAYER",
-        "TTD": "Total\nTesting Days",
-        "LTD": "Last\nTesting Day",
-        "BW [KG]": "Weight [kg]",
-        "Jump Height (Imp-Mom) [cm]": "CMJ\nJump Height [cm]",
-        "Jump Height (Imp-Mom) [cm] (L)": "SLJ-L\nJump Height [cm]",
-        "Jump Height (Imp-Mom) [cm] (R)": "SLJ-R\nJump Height [cm]",
-        "CMJ_ABS_OVR": "CMJ\nAbsorption",
-        "CMJ_GEN_OVR": "CMJ\nGeneration",
-        "SLJ_L_ABS_OVR": "SLJ-L\nAbsorption",
-        "SLJ_L_GEN_OVR": "SLJ-L\nGeneration",
-        "SLJ_R_ABS_OVR": "SLJ-R\nAbsorption",
-        "SLJ_R_GEN_OVR": "SLJ-R\nGeneration",
-    }
+        // Add custom hover anchor with ONLY Min/Q1/Median/Q3/Max
+        const sorted = ys.slice().sort((a,b)=>a-b);
+        const vmin = sorted.length ? sorted[0] : null;
+        const vmax = sorted.length ? sorted[sorted.length - 1] : null;
+        const q1 = quantileSorted(sorted, 0.25);
+        const med = quantileSorted(sorted, 0.50);
+        const q3 = quantileSorted(sorted, 0.75);
 
-    metric_phase_map = {
-        "CMJ_ABS_OVR":   ("CMJ",   "Absorption"),
-        "CMJ_GEN_OVR":   ("CMJ",   "Generation"),
-        "SLJ_L_ABS_OVR": ("SLJ_L", "Absorption"),
-        "SLJ_L_GEN_OVR": ("SLJ_L", "Generation"),
-        "SLJ_R_ABS_OVR": ("SLJ_R", "Absorption"),
-        "SLJ_R_GEN_OVR": ("SLJ_R", "Generation"),
-    }
+        if (med !== null) {
+          traces.push({
+            type: "scatter",
+            mode: "markers",
+            name: (groupKey === "Test") ? testLabel(g) : "All",
+            showlegend: false,
+            x: [(groupKey === "Test") ? testLabel(g) : "All"],
+            y: [med],
+            marker: { opacity: 0, size: 16, color: c },
+            customdata: [[vmin, q1, med, q3, vmax]],
+            hovertemplate:
+              "Min: %{customdata[0]:.1f}<br>" +
+              "Q1: %{customdata[1]:.1f}<br>" +
+              "Median: %{customdata[2]:.1f}<br>" +
+              "Q3: %{customdata[3]:.1f}<br>" +
+              "Max: %{customdata[4]:.1f}<extra></extra>"
+          });
+        }
+      });
 
-    col_widths = {
-        PLAYER_COL: "190px",
-        "TTD": "120px",
-        "LTD": "120px",
-        "BW [KG]": "110px",
-        "Jump Height (Imp-Mom) [cm]": "130px",
-        "Jump Height (Imp-Mom) [cm] (L)": "130px",
-        "Jump Height (Imp-Mom) [cm] (R)": "130px",
-        "CMJ_ABS_OVR": "120px",
-        "CMJ_GEN_OVR": "120px",
-        "SLJ_L_ABS_OVR": "120px",
-        "SLJ_L_GEN_OVR": "120px",
-        "SLJ_R_ABS_OVR": "120px",
-        "SLJ_R_GEN_OVR": "120px",
+      const layout = Object.assign({}, commonLayout, {
+        title: (groupKey === "Test") ? `Box Plot: ${vKey} (grouped by Test)` : `Box Plot: ${vKey}`,
+        yaxis: { title: vKey }
+      });
+
+      JumpChart.newPlot(plotDiv, traces, layout);
+      return;
     }
-    colgroup = "<colgroup>" + "".join([f"<col style='width:{col_widths.get(c,'120px')}'>" for c in cols]) + "</colgroup>"
+  }
 
-    header_cells = "".join(f"<th>{display_labels.get(c, c)}</th>" for c in cols)
+  document.addEventListener("DOMContentLoaded", function(){
+    const btnH = $("tabbtn-history");
+    const btnV = $("tabbtn-viz");
+    if (btnH) btnH.addEventListener("click", () => setTab("history"));
+    if (btnV) btnV.addEventListener("click", () => setTab("viz"));
 
-    html_rows = []
-    for _, row in df.iterrows():
-        player = row.get(PLAYER_COL, "")
-        player_filename = safe_player_filename(player)
+    let initial = "history";
+    try {
+      const saved = localStorage.getItem("playerTab");
+      if (saved === "viz" || saved === "history") initial = saved;
+    } catch(e) {}
+    setTab(initial);
+  });
+})();
+"""
 
-        bw_cls_row = row.get("BW [KG]_class", None)
-        cmj_jh_cls_row = row.get("Jump Height (Imp-Mom) [cm]_class", None)
-        sljL_jh_cls_row = row.get("Jump Height (Imp-Mom) [cm] (L)_class", None)
-        sljR_jh_cls_row = row.get("Jump Height (Imp-Mom) [cm] (R)_class", None)
+# ============================================================
+# Chart JS (Visualize It; loaded on demand from static/)
+#   A small SVG renderer for the three plot types the tab draws, so
+#   player pages work offline. JumpChart.newPlot(div, traces, layout)
+#   takes the Plotly-style subset renderPlot builds:
+#     scatter -> x (numbers or "YYYY-MM-DD"), y, mode "markers" /
+#                "lines+markers", marker {color, size, opacity}, line
+#                {color, width}, customdata, hovertemplate, showlegend
+#     box     -> y, name, marker / line color, boxpoints "outliers"
+#                (whiskers at 1.5 IQR), no hover
+#   layout: title, xaxis / yaxis title, font color, plot_bgcolor, margin.
+# ============================================================
+CHART_JS = r"""
+(function(){
+  const NS = "http://www.w3.org/2000/svg";
+  const DATE_RE = /^\d{4}-\d{2}-\d{2}$/;
+
+  function el(tag, attrs, parent){
+    const e = document.createElementNS(NS, tag);
+    for (const k in attrs) e.setAttribute(k, attrs[k]);
+    if (parent) parent.appendChild(e);
+    return e;
+  }
 
-        bw_cls = get_latest_param_class(player, "CMJ", "BW [KG]")
-        cmj_jh_cls = get_latest_param_class(player, "CMJ", "Jump Height (Imp-Mom) [cm]")
-        sljL_jh_cls = get_latest_param_class(player, "SLJ_L", "Jump Height (Imp-Mom) [cm] (L)")
-        sljR_jh_cls = get_latest_param_class(player, "SLJ_R", "Jump Height (Imp-Mom) [cm] (R)")
+  function label(parent, x, y, str, attrs){
+    const t = el("text", Object.assign({x: x, y: y}, attrs || {}), parent);
+    t.textContent = str;
+    return t;
+  }
 
-        if bw_cls not in ["High", "Low", "Avg"]:
-            bw_cls = bw_cls_row
-        if cmj_jh_cls not in ["High", "Low", "Avg"]:
-            cmj_jh_cls = cmj_jh_cls_row
-        if sljL_jh_cls not in ["High", "Low", "Avg"]:
-            sljL_jh_cls = sljL_jh_cls_row
-        if sljR_jh_cls not in ["High", "Low", "Avg"]:
-            sljR_jh_cls = sljR_jh_cls_row
+  function niceTicks(lo, hi, count){
+    const raw = (hi - lo) / Math.max(1, count);
+    const mag = Math.pow(10, Math.floor(Math.log10(raw)));
+    const step = [1, 2, 2.5, 5, 10].map(m => m * mag).find(s => s >= raw);
+    const ticks = [];
+    for (let v = Math.ceil(lo / step) * step; v <= hi + step * 1e-9; v += step) ticks.push(+v.toFixed(10));
+    return ticks;
+  }
 
-        mean_bw_cmj   = get_param_mean(player, "CMJ",   "BW [KG]")
-        mean_jh_cmj   = get_param_mean(player, "CMJ",   "Jump Height (Imp-Mom) [cm]")
-        mean_jh_sljL  = get_param_mean(player, "SLJ_L", "Jump Height (Imp-Mom) [cm] (L)")
-        mean_jh_sljR  = get_param_mean(player, "SLJ_R", "Jump Height (Imp-Mom) [cm] (R)")
+  function dateValue(s){ return Date.parse(s + "T00:00:00Z"); }
+  function dateText(ms){ return new Date(ms).toISOString().slice(0, 10); }
+
+  // continuous axis over [lo, hi] with a 5% pad; kind "linear" or "date"
+  function continuousAxis(values, kind){
+    let lo = Math.min.apply(null, values);
+    let hi = Math.max.apply(null, values);
+    if (!values.length) { lo = 0; hi = 1; }
+    if (lo === hi) {
+      const pad = kind === "date" ? 86400000 : (Math.abs(lo) || 1) * 0.1;
+      lo -= pad; hi += pad;
+    }
+    const pad = (hi - lo) * 0.05;
+    const axis = {kind: kind, lo: lo - pad, hi: hi + pad};
+    if (kind === "date") {
+      const day = 86400000;
+      const step = Math.max(day, Math.ceil((hi - lo) / 6 / day) * day);
+      axis.ticks = [];
+      for (let v = lo; v <= hi + 1; v += step) axis.ticks.push(v);
+      axis.tickText = dateText;
+    } else {
+      axis.ticks = niceTicks(axis.lo, axis.hi, 6).filter(v => v >= axis.lo && v <= axis.hi);
+      axis.tickText = v => String(v);
+    }
+    axis.value = kind === "date" ? dateValue : (v => v);
+    return axis;
+  }
 
-        row_tds = []
-        for col in cols:
-            val = row.get(col, "")
-            val_str = "" if pd.isna(val) else str(val)
+  function categoryAxis(names){
+    const idx = {};
+    names.forEach((n, i) => { idx[n] = i; });
+    return {
+      kind: "category", lo: -0.5, hi: names.length - 0.5,
+      ticks: names.map((_, i) => i), tickText: i => names[i], value: n => idx[n]
+    };
+  }
 
-            if col == PLAYER_COL:
-                img_src = player_headshot_rel(val_str)
-                row_tds.append(
-                    f'<td class="sticky-name">'
-                    f'  <a class="player-link" href="{player_filename}">'
-                    f'    <img class="player-avatar" src="{img_src}" alt="{html_escape(val_str)}" '
-                    f'         onerror="this.style.display=\'none\';" />'
-                    f'    <span class="player-name-text">{html_escape(val_str)}</span>'
-                    f'  </a>'
-                    f'</td>'
-                )
-                continue
+  function quantile(sorted, q){
+    const pos = (sorted.length - 1) * q;
+    const base = Math.floor(pos);
+    if (sorted[base + 1] === undefined) return sorted[base];
+    return sorted[base] + (pos - base) * (sorted[base + 1] - sorted[base]);
+  }
 
-            if col == "BW [KG]":
-                bg, fg = classify_color(bw_cls)
-                title = (f"CMJ Body Weight mean: {mean_bw_cmj:.1f} kg"
-                         if mean_bw_cmj is not None else "CMJ Body Weight mean: N/A")
-                row_tds.append(
-                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
-                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
-                    f'{html_escape(val_str)}</td>'
-                )
-                continue
+  function boxStats(ys){
+    const sorted = ys.slice().sort((a, b) => a - b);
+    const q1 = quantile(sorted, 0.25);
+    const q3 = quantile(sorted, 0.75);
+    const iqr = q3 - q1;
+    const inside = sorted.filter(v => v >= q1 - 1.5 * iqr && v <= q3 + 1.5 * iqr);
+    return {
+      q1: q1, med: quantile(sorted, 0.5), q3: q3,
+      lo: inside[0], hi: inside[inside.length - 1],
+      outliers: sorted.filter(v => v < q1 - 1.5 * iqr || v > q3 + 1.5 * iqr)
+    };
+  }
 
-            if col == "Jump Height (Imp-Mom) [cm]":
-                bg, fg = classify_color(cmj_jh_cls)
-                title = (f"CMJ Jump Height mean: {mean_jh_cmj:.1f} cm"
-                         if mean_jh_cmj is not None else "CMJ Jump Height mean: N/A")
-                row_tds.append(
-                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
-                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
-                    f'{html_escape(val_str)}</td>'
-                )
-                continue
+  function hoverLines(template, point){
+    return template
+      .replace(/<extra>.*?<\/extra>/g, "")
+      .replace(/%\{(\w+)(?:\[(\d+)\])?(?::\.(\d+)f)?\}/g, (_, key, i, digits) => {
+        let v = point[key];
+        if (i !== undefined) v = v ? v[+i] : null;
+        if (v === null || v === undefined) return "";
+        return (digits !== undefined && typeof v === "number") ? v.toFixed(+digits) : String(v);
+      })
+      .split("<br>");
+  }
 
-            if col == "Jump Height (Imp-Mom) [cm] (L)":
-                bg, fg = classify_color(sljL_jh_cls)
-                title = (f"SLJ-L Jump Height mean: {mean_jh_sljL:.1f} cm"
-                         if mean_jh_sljL is not None else "SLJ-L Jump Height mean: N/A")
-                row_tds.append(
-                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
-                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
-                    f'{html_escape(val_str)}</td>'
-                )
-                continue
+  function tooltipFor(div){
+    let tip = div.querySelector(".jc-tooltip");
+    if (!tip) {
+      tip = document.createElement("div");
+      tip.className = "jc-tooltip";
+      tip.style.cssText = "position:absolute;pointer-events:none;display:none;z-index:5;" +
+        "background:rgba(0,0,0,0.85);color:#fff;padding:6px 8px;border-radius:6px;font-size:11px;white-space:nowrap;";
+      div.appendChild(tip);
+    }
+    return tip;
+  }
 
-            if col == "Jump Height (Imp-Mom) [cm] (R)":
-                bg, fg = classify_color(sljR_jh_cls)
-                title = (f"SLJ-R Jump Height mean: {mean_jh_sljR:.1f} cm"
-                         if mean_jh_sljR is not None else "SLJ-R Jump Height mean: N/A")
-                row_tds.append(
-                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
-                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
-                    f'{html_escape(val_str)}</td>'
-                )
-                continue
+  function bindHover(div, node, lines){
+    const tip = tooltipFor(div);
+    node.addEventListener("mouseenter", () => {
+      tip.innerHTML = "";
+      lines.forEach(line => {
+        const row = document.createElement("div");
+        row.textContent = line;
+        tip.appendChild(row);
+      });
+      tip.style.display = "block";
+    });
+    node.addEventListener("mousemove", evt => {
+      const rect = div.getBoundingClientRect();
+      tip.style.left = (evt.clientX - rect.left + 12) + "px";
+      tip.style.top = (evt.clientY - rect.top + 12) + "px";
+    });
+    node.addEventListener("mouseleave", () => { tip.style.display = "none"; });
+  }
 
-            if col in metric_phase_map:
-                test_type, phase = metric_phase_map[col]
-                overall_cls = normalize_class(val_str)
-                bg, fg = classify_color(overall_cls)
+  function draw(div, traces, layout){
+    div.innerHTML = "";
+    if (getComputedStyle(div).position === "static") div.style.position = "relative";
+
+    const width = div.clientWidth || 800;
+    const height = div.clientHeight || 520;
+    const fontColor = (layout.font && layout.font.color) || "#FFFFFF";
+    const grid = "rgba(255,255,255,0.14)";
+    const margin = Object.assign({t: 60, l: 60, r: 30, b: 60}, layout.margin || {});
+    const legendItems = [];
+    traces.forEach(t => {
+      if (t.showlegend !== false && t.name && !legendItems.some(i => i.name === t.name)) {
+        legendItems.push({name: t.name, color: (t.marker && t.marker.color) || (t.line && t.line.color)});
+      }
+    });
+    if (legendItems.length) margin.b += 24;
 
-                date_str, tooltip_items_summary, adv_items = get_latest_phase_components(player, test_type, phase)
+    const svg = el("svg", {
+      width: width, height: height, viewBox: "0 0 " + width + " " + height,
+      "font-family": "sans-serif", "font-size": 12, fill: fontColor
+    }, div);
+    const left = margin.l, right = width - margin.r, top = margin.t, bottom = height - margin.b;
 
-                items_str_summary = ";".join(f"{lbl}|{cls}" for (lbl, cls) in tooltip_items_summary if lbl and cls)
-                tooltip_title_summary = f"{test_type} {phase} ({date_str})"
+    if (layout.title) label(svg, width / 2, 30, layout.title, {"text-anchor": "middle", "font-size": 16});
+    el("rect", {x: left, y: top, width: Math.max(0, right - left), height: Math.max(0, bottom - top),
+                fill: layout.plot_bgcolor || "rgba(255,255,255,0.06)"}, svg);
 
-                tooltip_title_advanced = f"{test_type} {phase} details ({date_str})"
-                items_str_advanced = build_advanced_phase_tooltip_items_str(adv_items)
+    const boxes = traces.filter(t => t.type === "box");
+    const points = traces.filter(t => t.type !== "box");
+    if (!boxes.length && !points.length) return;
 
-                summary_disp = arrow_for_class(overall_cls)
-                advanced_cell_html = build_advanced_phase_cell_html_words_only(adv_items)
+    let xAxis;
+    if (boxes.length) {
+      xAxis = categoryAxis(boxes.map(t => t.name));
+    } else {
+      const xs = [].concat.apply([], points.map(t => t.x || []));
+      const isDate = xs.length && xs.every(v => typeof v === "string" && DATE_RE.test(v));
+      xAxis = continuousAxis(isDate ? xs.map(dateValue) : xs, isDate ? "date" : "linear");
+    }
+    const allY = [].concat.apply([], traces.map(t => t.y || [])).filter(v => typeof v === "number");
+    const yAxis = continuousAxis(allY, "linear");
 
-                row_tds.append(
-                    f'<td class="metric-cell phase-cell" style="background-color:{bg};color:{fg};" '
-                    f'data-tooltip-title-summary="{html_escape(tooltip_title_summary)}" '
-                    f'data-tooltip-items-summary="{html_escape(items_str_summary)}" '
-                    f'data-tooltip-title-advanced="{html_escape(tooltip_title_advanced)}" '
-                    f'data-tooltip-items-advanced="{html_escape(items_str_advanced)}">'
-                    f'  <div class="view-summary" style="font-weight:900;font-size:16px;line-height:1;">{html_escape(summary_disp)}</div>'
-                    f'  <div class="view-advanced" style="display:none;">{advanced_cell_html}</div>'
-                    f'</td>'
-                )
-                continue
+    const sx = v => left + (xAxis.value(v) - xAxis.lo) / (xAxis.hi - xAxis.lo) * (right - left);
+    const sxRaw = v => left + (v - xAxis.lo) / (xAxis.hi - xAxis.lo) * (right - left);
+    const sy = v => bottom - (v - yAxis.lo) / (yAxis.hi - yAxis.lo) * (bottom - top);
 
-            row_tds.append(f"<td class='cell-tight'>{html_escape(val_str)}</td>")
+    yAxis.ticks.forEach(v => {
+      el("line", {x1: left, x2: right, y1: sy(v), y2: sy(v), stroke: grid}, svg);
+      label(svg, left - 6, sy(v) + 4, yAxis.tickText(v), {"text-anchor": "end"});
+    });
+    xAxis.ticks.forEach(v => {
+      if (xAxis.kind !== "category") el("line", {x1: sxRaw(v), x2: sxRaw(v), y1: top, y2: bottom, stroke: grid}, svg);
+      label(svg, sxRaw(v), bottom + 18, xAxis.tickText(v), {"text-anchor": "middle"});
+    });
 
-        html_rows.append("<tr>" + "".join(row_tds) + "</tr>")
+    const xTitle = layout.xaxis && layout.xaxis.title;
+    const yTitle = layout.yaxis && layout.yaxis.title;
+    if (xTitle) label(svg, (left + right) / 2, bottom + 40, xTitle, {"text-anchor": "middle", "font-size": 13});
+    if (yTitle) {
+      const y0 = (top + bottom) / 2;
+      label(svg, 16, y0, yTitle, {"text-anchor": "middle", "font-size": 13, transform: "rotate(-90 16 " + y0 + ")"});
+    }
 
-    html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8">
-<title>Team CMJ / SLJ Overview</title>
-<style>
-:root {{
+    const band = (right - left) / Math.max(1, boxes.length);
+    boxes.forEach(t => {
+      const ys = (t.y || []).filter(v => typeof v === "number" && !isNaN(v));
+      if (!ys.length) return;
+      const st = boxStats(ys);
+      const color = (t.line && t.line.color) || (t.marker && t.marker.color) || fontColor;
+      const cx = sx(t.name);
+      const half = band * 0.25;
+      const g = el("g", {stroke: color, "stroke-width": 2}, svg);
+      el("line", {x1: cx, x2: cx, y1: sy(st.hi), y2: sy(st.q3)}, g);
+      el("line", {x1: cx, x2: cx, y1: sy(st.q1), y2: sy(st.lo)}, g);
+      el("line", {x1: cx - half / 2, x2: cx + half / 2, y1: sy(st.hi), y2: sy(st.hi)}, g);
+      el("line", {x1: cx - half / 2, x2: cx + half / 2, y1: sy(st.lo), y2: sy(st.lo)}, g);
+      el("rect", {x: cx - half, y: sy(st.q3), width: 2 * half, height: Math.max(1, sy(st.q1) - sy(st.q3)),
+                  fill: color, "fill-opacity": 0.35}, g);
+      el("line", {x1: cx - half, x2: cx + half, y1: sy(st.med), y2: sy(st.med)}, g);
+      if (t.boxpoints === "outliers") {
+        st.outliers.forEach(v => el("circle", {cx: cx, cy: sy(v), r: 3, fill: color, stroke: "none"}, svg));
+      }
+    });
+
+    points.forEach(t => {
+      const xs = t.x || [], ys = t.y || [];
+      const marker = t.marker || {};
+      const color = marker.color || (t.line && t.line.color) || fontColor;
+      if ((t.mode || "").indexOf("lines") !== -1 && xs.length > 1) {
+        el("polyline", {
+          points: xs.map((x, i) => sx(x) + "," + sy(ys[i])).join(" "),
+          fill: "none", stroke: (t.line && t.line.color) || color, "stroke-width": (t.line && t.line.width) || 2
+        }, svg);
+      }
+      xs.forEach((x, i) => {
+        const dot = el("circle", {
+          cx: sx(x), cy: sy(ys[i]), r: (marker.size || 8) / 2,
+          fill: color, "fill-opacity": marker.opacity === undefined ? 1 : marker.opacity
+        }, svg);
+        if (t.hovertemplate) {
+          bindHover(div, dot, hoverLines(t.hovertemplate, {x: x, y: ys[i], customdata: t.customdata ? t.customdata[i] : null}));
+        }
+      });
+    });
+
+    let lx = left;
+    legendItems.forEach(item => {
+      const ly = height - 14;
+      el("circle", {cx: lx + 6, cy: ly - 4, r: 5, fill: item.color || fontColor}, svg);
+      const t = label(svg, lx + 16, ly, item.name);
+      lx += 16 + (t.getComputedTextLength ? t.getComputedTextLength() : item.name.length * 7) + 18;
+    });
+  }
+
+  const plotted = [];
+  function newPlot(div, traces, layout){
+    div.__jumpChart = [traces, layout || {}];
+    if (plotted.indexOf(div) === -1) plotted.push(div);
+    draw(div, traces, layout || {});
+  }
+
+  let resizeTimer = null;
+  window.addEventListener("resize", () => {
+    clearTimeout(resizeTimer);
+    resizeTimer = setTimeout(() => {
+      plotted.forEach(div => { if (div.offsetParent !== null) draw(div, div.__jumpChart[0], div.__jumpChart[1]); });
+    }, 150);
+  });
+
+  window.JumpChart = {newPlot: newPlot};
+})();
+"""
+
+# ============================================================
+# History table JS (lazy player pages only)
+#   #tab-history[data-src] names the player's history JSON; the
+#   sections are rendered with the same markup embedded pages carry
+#   (see render_history_section), then wired up like them.
+# ============================================================
+HISTORY_TABLE_JS = r"""
+(function(){
+  function esc(s){
+    return String(s === null || s === undefined ? "" : s)
+      .replace(/&/g, "&amp;")
+      .replace(/</g, "&lt;")
+      .replace(/>/g, "&gt;")
+      .replace(/"/g, "&quot;")
+      .replace(/'/g, "&#39;");
+  }
+
+  function renderSection(sec, colors, arrows){
+    if (!sec.rows) return "<h2>" + esc(sec.title) + "</h2><p>No data available.</p>";
+
+    const colgroup = "<colgroup>" + sec.cols.map(c => "<col style='width:" + c.width + "px'>").join("") + "</colgroup>";
+    const header = sec.cols.map(c => '<th data-col="' + esc(c.key) + '">' + esc(c.label) + "</th>").join("");
+
+    const body = sec.rows.map(row => {
+      const date = row[0];
+      const tds = sec.cols.map((c, i) => {
+        const cell = row[i];
+        if (c.kind === "date") return "<td class='cell-tight'>" + esc(cell) + "</td>";
+
+        const bg = colors[cell[0]][0];
+        const fg = colors[cell[0]][1];
+        if (c.kind === "phase") {
+          const advanced = cell[4].map(line =>
+            "<div class='adv-line' style='color:" + colors[line[0]][1] + ";'>" + esc(line[1]) + "</div>"
+          ).join("");
+          return '<td class="metric-cell phase-cell" style="background-color:' + bg + ';color:' + fg + ';" ' +
+            'data-tooltip-title-summary="' + esc(sec.test + " " + cell[1] + " (" + date + ")") + '" ' +
+            'data-tooltip-items-summary="' + esc(cell[2]) + '" ' +
+            'data-tooltip-title-advanced="' + esc(sec.test + " " + cell[1] + " details (" + date + ")") + '" ' +
+            'data-tooltip-items-advanced="' + esc(cell[3]) + '">' +
+            '  <div class="view-summary" style="font-weight:900;font-size:16px;line-height:1;">' + esc(arrows[cell[0]]) + '</div>' +
+            '  <div class="view-advanced" style="display:none;">' + advanced + '</div>' +
+            '</td>';
+        }
+        return '<td class="metric-cell cell-tight" style="background-color:' + bg + ';color:' + fg + ';" ' +
+          'data-tooltip-title="' + esc(cell[3]) + '" data-tooltip-items="">' +
+          '  <span class="view-summary">' + esc(cell[1]) + '</span>' +
+          '  <span class="view-advanced" style="display:none;">' + esc(cell[2]) + '</span>' +
+          '</td>';
+      });
+      return "<tr>" + tds.join("") + "</tr>";
+    }).join("");
+
+    return "\n<h2>" + esc(sec.title) + "</h2>\n<div class=\"table-wrap\">\n" +
+      '<table class="sortable-table paginated-table" data-test="' + esc(sec.test) + '">\n' +
+      "    " + colgroup + "\n" +
+      "    <thead><tr>" + header + "</tr></thead>\n" +
+      "    <tbody>" + body + "</tbody>\n" +
+      "</table>\n</div>\n";
+  }
+
+  document.addEventListener("DOMContentLoaded", function(){
+    const host = document.getElementById("tab-history");
+    const src = host && host.getAttribute("data-src");
+    if (!src) return;
+
+    fetch(src)
+      .then(r => { if (!r.ok) throw new Error("HTTP " + r.status); return r.json(); })
+      .then(data => {
+        host.innerHTML = data.sections.map(sec => renderSection(sec, data.colors, data.arrows)).join("");
+        makeTablesSortable();
+        attachMetricTooltips();
+        initPagination();
+        setOverviewView(getViewMode());
+      })
+      .catch(() => {
+        host.innerHTML = "<p>Could not load this player's jump history (serve the site over HTTP).</p>";
+      });
+  });
+})();
+"""
+
+# ============================================================
+# Page style sheets
+# ============================================================
+TEAM_PAGE_CSS = """
+:root {
     --primary-200:#CE0E2D;
     --text-100:#FFFFFF;
     --text-200:#e0e0e0;
     --bg-100:#0A2240;
     --bg-200:#3A8DDE;
     --bg-300:#3A8DDE;
-}}
-body {{
+}
+body {
     font-family: Arial, sans-serif;
     margin: 20px;
     background: var(--bg-100);
     color: var(--text-100);
-}}
-.topbar {{
+}
+.topbar {
     display: flex;
     align-items: flex-start;
     justify-content: space-between;
     gap: 12px;
     margin-bottom: 8px;
-}}
-.view-toggle {{
+}
+.view-toggle {
     display: inline-flex;
     align-items: center;
     gap: 6px;
@@ -1144,13 +1442,13 @@ body {{
     border: 1px solid rgba(255,255,255,0.18);
     border-radius: 10px;
     background: rgba(255,255,255,0.08);
-}}
-.view-toggle .label {{
+}
+.view-toggle .label {
     font-size: 11px;
     color: var(--text-200);
     margin-right: 4px;
-}}
-.view-toggle button {{
+}
+.view-toggle button {
     font-size: 11px;
     padding: 4px 8px;
     border-radius: 8px;
@@ -1158,56 +1456,56 @@ body {{
     background: rgba(255,255,255,0.10);
     color: var(--text-100);
     cursor: pointer;
-}}
-.view-toggle button.active {{
+}
+.view-toggle button.active {
     background: var(--primary-200);
     border-color: rgba(0,0,0,0.0);
-}}
-.table-wrap {{
+}
+.table-wrap {
     width: 100%;
     overflow-x: auto;
     border-radius: 10px;
-}}
-table {{
+}
+table {
     border-collapse: collapse;
     width: 100%;
     table-layout: fixed;
     font-size: 12px;
     background: rgba(255,255,255,0.06);
-}}
-th, td {{
+}
+th, td {
     border: 1px solid rgba(255,255,255,0.18);
     padding: 4px 6px;
     text-align: center;
     overflow: hidden;
     text-overflow: ellipsis;
-}}
-.cell-tight {{ white-space: nowrap; }}
-th {{
+}
+.cell-tight { white-space: nowrap; }
+th {
     background-color: var(--bg-300);
     color: var(--text-100);
     position: sticky;
     top: 0;
     z-index: 2;
-}}
-.sticky-name {{
+}
+.sticky-name {
     position: sticky;
     left: 0;
     background-color: var(--bg-200);
     z-index: 1;
     text-align: left;
     white-space: nowrap;
-}}
-a {{
+}
+a {
     color: inherit;
     text-decoration: none;
     font-weight: 600;
-}}
-a:hover {{ text-decoration: underline; }}
-tbody tr:nth-child(even) {{ background-color: rgba(255,255,255,0.06); }}
-tbody tr:nth-child(odd)  {{ background-color: rgba(255,255,255,0.03); }}
-.player-link {{ display: inline-flex; align-items: center; gap: 8px; }}
-.player-avatar {{
+}
+a:hover { text-decoration: underline; }
+tbody tr:nth-child(even) { background-color: rgba(255,255,255,0.06); }
+tbody tr:nth-child(odd)  { background-color: rgba(255,255,255,0.03); }
+.player-link { display: inline-flex; align-items: center; gap: 8px; }
+.player-avatar {
     width: 22px;
     height: 22px;
     border-radius: 50%;
@@ -1215,808 +1513,1310 @@ tbody tr:nth-child(odd)  {{ background-color: rgba(255,255,255,0.03); }}
     border: 1px solid rgba(255,255,255,0.35);
     flex: 0 0 auto;
     background: rgba(255,255,255,0.08);
-}}
-.view-advanced {{
+}
+.view-advanced {
     font-weight: 400;
     font-size: 11px;
     line-height: 1.2;
     text-align: left;
     white-space: normal;
-}}
-.view-advanced .adv-line {{
+}
+.view-advanced .adv-line {
     margin: 2px 0;
     font-weight: 400;
-}}
-.phase-cell {{ padding: 6px 6px; }}
-</style>
-</head>
-<body>
-
-<div class="topbar">
-  <div>
-    <h1>CMJ & SLJ Team Overview</h1>
-    <p style="margin:0; color: var(--text-200);">
-      Hover over Absorption and Generation cells to see classifications.
-      Click a player's name to view their history.
-      Use the view toggle to switch between summary and advanced views.
-    </p>
-  </div>
-
-  <div class="view-toggle" title="Switch between Summary and Advanced views">
-    <span class="label">View:</span>
-    <button id="btn-view-summary" type="button">Summary</button>
-    <button id="btn-view-advanced" type="button">Advanced</button>
-  </div>
-</div>
-
-<div class="table-wrap">
-  <table class="sortable-table">
-      {colgroup}
-      <thead><tr>{header_cells}</tr></thead>
-      <tbody>{"".join(html_rows)}</tbody>
-  </table>
-</div>
-
-<script>
-{JS_SORT_AND_TOOLTIP}
-</script>
-</body>
-</html>
+}
+.phase-cell { padding: 6px 6px; }
 """
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    print("Saved team overview HTML to:", out_path)
-
-# ============================================================
-# PLAYER HISTORY HTML
-# ============================================================
-def build_player_history_html(player, out_path):
-    sections = []
-
-    def ensure_class_column(sub, value_col, class_col):
-        if class_col in sub.columns or value_col not in sub.columns:
-            return sub
-        sub[class_col] = "Avg"
-        return sub
-
-    def tooltip_for_avg_prev(row, value_col, label):
-        avg_col = f"{value_col}_avg_prev"
-        avg_val = row.get(avg_col, None)
-        if avg_val is None or (isinstance(avg_val, float) and pd.isna(avg_val)) or str(avg_val) == "nan":
-            return f"{label} mean: N/A (first test)"
-        try:
-            avg_str = format_number(value_col, avg_val)
-        except Exception:
-            avg_str = str(avg_val)
-        return f"{label} mean: {avg_str}"
-
-    def build_section(title, df_daily, test_type):
-        if df_daily is None or df_daily.empty:
-            return f"<h2>{html_escape(title)}</h2><p>No data available.</p>"
-
-        sub = df_daily[df_daily[PLAYER_COL] == player].copy()
-        if sub.empty:
-            return f"<h2>{html_escape(title)}</h2><p>No data available.</p>"
-
-        sub = sub.sort_values(DATE_COL, ascending=False)
 
-        for col in ["Generation_Class", "Absorption_Class"]:
-            if col not in sub.columns:
-                for cand in [col + "_GEN", col + "_ABS", col + "_x", col + "_y", col + "_L", col + "_R"]:
-                    if cand in sub.columns:
-                        sub[col] = sub[cand]
-                        break
-
-        if test_type == "CMJ":
-            param_specs = [
-                {"value_col": "BW [KG]", "class_col": "BW [KG]_class", "label": "Body Weight [kg]"},
-                {"value_col": "Jump Height (Imp-Mom) [cm]", "class_col": "Jump Height (Imp-Mom) [cm]_class", "label": "Jump Height [cm]"},
-                {"value_col": "Braking Phase Duration [ms]", "class_col": "Braking Phase Duration [ms]_class", "label": "Braking Duration [ms]"},
-                {"value_col": "Countermovement Depth [cm]", "class_col": "Countermovement Depth [cm]_class", "label": "Squat Depth [cm]"},
-                {"value_col": "Eccentric Mean Force / BM [N/kg]", "class_col": "Eccentric Mean Force / BM [N/kg]_class", "label": "Braking Force [N/kg]"},
-                {"value_col": "Concentric Duration [ms]", "class_col": "Concentric Duration [ms]_class", "label": "Propulsive Duration [ms]"},
-                {"value_col": "Concentric Mean Force / BM [N/kg]", "class_col": "Concentric Mean Force / BM [N/kg]_class", "label": "Propulsive Force [N/kg]"},
-            ]
-        elif test_type == "SLJ_L":
-            param_specs = [
-                {"value_col": "BW [KG]", "class_col": "BW [KG]_class", "label": "Body Weight [kg]"},
-                {"value_col": "Jump Height (Imp-Mom) [cm] (L)", "class_col": "Jump Height (Imp-Mom) [cm] (L)_class", "label": "Jump Height [cm]"},
-                {"value_col": "Braking Phase Duration [ms] (L)", "class_col": "Braking Phase Duration [ms] (L)_class", "label": "Braking Duration [ms]"},
-                {"value_col": "Countermovement Depth [cm] (L)", "class_col": "Countermovement Depth [cm] (L)_class", "label": "Squat Depth [cm]"},
-                {"value_col": "Eccentric Mean Force / BM [N/kg] (L)", "class_col": "Eccentric Mean Force / BM [N/kg] (L)_class", "label": "Braking Force [N/kg]"},
-                {"value_col": "Concentric Duration [ms] (L)", "class_col": "Concentric Duration [ms] (L)_class", "label": "Propulsive Duration [ms]"},
-                {"value_col": "Concentric Mean Force / BM [N/kg] (L)", "class_col": "Concentric Mean Force / BM [N/kg] (L)_class", "label": "Propulsive Force [N/kg]"},
-            ]
-        else:
-            param_specs = [
-                {"value_col": "BW [KG]", "class_col": "BW [KG]_class", "label": "Body Weight [kg]"},
-                {"value_col": "Jump Height (Imp-Mom) [cm] (R)", "class_col": "Jump Height (Imp-Mom) [cm] (R)_class", "label": "Jump Height [cm]"},
-                {"value_col": "Braking Phase Duration [ms] (R)", "class_col": "Braking Phase Duration [ms] (R)_class", "label": "Braking Duration [ms]"},
-                {"value_col": "Countermovement Depth [cm] (R)", "class_col": "Countermovement Depth [cm] (R)_class", "label": "Squat Depth [cm]"},
-                {"value_col": "Eccentric Mean Force / BM [N/kg] (R)", "class_col": "Eccentric Mean Force / BM [N/kg] (R)_class", "label": "Braking Force [N/kg]"},
-                {"value_col": "Concentric Duration [ms] (R)", "class_col": "Concentric Duration [ms] (R)_class", "label": "Propulsive Duration [ms]"},
-                {"value_col": "Concentric Mean Force / BM [N/kg] (R)", "class_col": "Concentric Mean Force / BM [N/kg] (R)_class", "label": "Propulsive Force [N/kg]"},
-            ]
+PLAYER_PAGE_CSS = """
+:root {
+    --primary-200:#CE0E2D;
+    --text-100:#FFFFFF;
+    --text-200:#e0e0e0;
+    --bg-100:#0A2240;
+    --bg-300:#3A8DDE;
+}
+body {
+    font-family: Arial, sans-serif;
+    margin: 20px;
+    background: var(--bg-100);
+    color: var(--text-100);
+}
+.page-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: flex-start;
+    gap: 16px;
+}
+.back-link {
+    display: inline-block;
+    margin-top: 8px;
+    color: var(--primary-200);
+    text-decoration: none;
+    font-weight: 600;
+}
+.back-link:hover { text-decoration: underline; }
+.player-identity { display: flex; align-items: center; gap: 10px; }
+.player-identity img {
+    width: 48px;
+    height: 48px;
+    border-radius: 50%;
+    object-fit: cover;
+    border: 1px solid rgba(255,255,255,0.35);
+    background: rgba(255,255,255,0.08);
+}
+.player-identity-name {
+    font-weight: 700;
+    font-size: 16px;
+    white-space: nowrap;
+}
+.topbar {
+    display: flex;
+    align-items: flex-start;
+    justify-content: space-between;
+    gap: 12px;
+    margin: 10px 0 12px 0;
+}
+.view-toggle {
+    display: inline-flex;
+    align-items: center;
+    gap: 6px;
+    padding: 6px 8px;
+    border: 1px solid rgba(255,255,255,0.18);
+    border-radius: 10px;
+    background: rgba(255,255,255,0.08);
+}
+.view-toggle .label {
+    font-size: 11px;
+    color: var(--text-200);
+    margin-right: 4px;
+}
+.view-toggle button {
+    font-size: 11px;
+    padding: 4px 8px;
+    border-radius: 8px;
+    border: 1px solid rgba(255,255,255,0.18);
+    background: rgba(255,255,255,0.10);
+    color: var(--text-100);
+    cursor: pointer;
+}
+.view-toggle button.active {
+    background: var(--primary-200);
+    border-color: rgba(0,0,0,0.0);
+}
+.table-pagination-controls {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+    margin-bottom: 6px;
+    font-size: 12px;
+    color: var(--text-200);
+}
+.table-wrap {
+    width: 100%;
+    overflow-x: auto;
+    border-radius: 10px;
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    table-layout: fixed;
+    font-size: 12px;
+    margin-bottom: 20px;
+    background: rgba(255,255,255,0.06);
+}
+th, td {
+    border: 1px solid rgba(255,255,255,0.18);
+    padding: 4px 6px;
+    text-align: center;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+.cell-tight { white-space: nowrap; }
+th {
+    background-color: var(--bg-300);
+    color: var(--text-100);
+}
+tbody tr:nth-child(even) { background-color: rgba(255,255,255,0.06); }
+tbody tr:nth-child(odd)  { background-color: rgba(255,255,255,0.03); }
+.view-advanced {
+    font-weight: 400;
+    font-size: 11px;
+    line-height: 1.2;
+    text-align: left;
+    white-space: normal;
+}
+.view-advanced .adv-line {
+    margin: 2px 0;
+    font-weight: 400;
+}
+.phase-cell { padding: 6px 6px; }
+
+/* Tabs */
+.tabs {
+    display: inline-flex;
+    gap: 6px;
+    padding: 6px;
+    border-radius: 12px;
+    border: 1px solid rgba(255,255,255,0.18);
+    background: rgba(255,255,255,0.08);
+}
+.tabs button {
+    font-size: 12px;
+    padding: 6px 10px;
+    border-radius: 10px;
+    border: 1px solid rgba(255,255,255,0.18);
+    background: rgba(255,255,255,0.10);
+    color: var(--text-100);
+    cursor: pointer;
+}
+.tabs button.active {
+    background: var(--primary-200);
+    border-color: rgba(0,0,0,0.0);
+}
+
+.viz-panel {
+    margin-top: 14px;
+    padding: 12px;
+    border-radius: 12px;
+    border: 1px solid rgba(255,255,255,0.18);
+    background: rgba(255,255,255,0.06);
+}
+.viz-controls {
+    display: grid;
+    grid-template-columns: 1fr 1fr 1fr;
+    gap: 10px;
+    margin-bottom: 10px;
+}
+.viz-row {
+    display: grid;
+    grid-template-columns: 1fr 1fr 1fr;
+    gap: 10px;
+    margin-bottom: 10px;
+}
+.viz-controls label, .viz-row label {
+    display: block;
+    font-size: 12px;
+    color: var(--text-200);
+    margin-bottom: 4px;
+}
+.viz-controls select, .viz-controls input, .viz-row select {
+    width: 100%;
+    padding: 8px 10px;
+    border-radius: 10px;
+    border: 1px solid rgba(255,255,255,0.18);
+    background: rgba(10,34,64,0.35);
+    color: var(--text-100);
+    outline: none;
+}
+.viz-controls select:disabled, .viz-row select:disabled {
+    opacity: 0.55;
+    cursor: not-allowed;
+}
+.viz-actions {
+    display: inline-flex;
+    gap: 8px;
+    align-items: center;
+    margin-bottom: 8px;
+}
+.viz-actions button {
+    font-size: 12px;
+    padding: 8px 12px;
+    border-radius: 10px;
+    border: 1px solid rgba(255,255,255,0.18);
+    background: rgba(255,255,255,0.10);
+    color: var(--text-100);
+    cursor: pointer;
+}
+.viz-actions button.primary {
+    background: var(--primary-200);
+    border-color: rgba(0,0,0,0.0);
+}
+#viz-msg {
+    color: #ffb3b3;
+    font-size: 12px;
+}
+#viz-plot {
+    width: 100%;
+    height: 520px;
+    border-radius: 12px;
+}
+@media (max-width: 980px) {
+  .viz-controls, .viz-row {
+    grid-template-columns: 1fr;
+  }
+}
+"""
+
+# ============================================================
+# STATIC ASSETS
+#   The scripts and style sheets above are shared by every page, so
+#   they are written once as static/<name>.<content hash>.<ext> and
+#   linked from the pages: browsers cache them across pages, and a
+#   changed script gets a new file name instead of a stale cache hit.
+# ============================================================
+STATIC_DIR = os.path.join(ROOT_OVERVW, "static")
+STATIC_REL = "static"  # relative from ROOT_OVERVW HTML pages
+
+STATIC_SOURCES = {
+    "app_js": ("app", "js", JS_SORT_AND_TOOLTIP),
+    "visualize_js": ("visualize", "js", VISUALIZE_IT_JS),
+    "chart_js": ("chart", "js", CHART_JS),
+    "history_js": ("history", "js", HISTORY_TABLE_JS),
+    "team_css": ("team", "css", TEAM_PAGE_CSS),
+    "player_css": ("player", "css", PLAYER_PAGE_CSS),
+}
+
+def hashed_file_name(name, ext, text):
+    return f"{name}.{hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]}.{ext}"
+
+STATIC_FILES = {key: hashed_file_name(*src) for key, src in STATIC_SOURCES.items()}
+
+def static_href(key):
+    return f"{STATIC_REL}/{STATIC_FILES[key]}"
+
+def write_static_assets():
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    written = []
+    for key, (_, _, text) in STATIC_SOURCES.items():
+        path = os.path.join(STATIC_DIR, STATIC_FILES[key])
+        if not os.path.exists(path) or PRECOMPRESS_OUTPUT != os.path.exists(path + ".gz"):
+            write_text_atomic(path, text)
+            print("Saved static asset:", path)
+            written.append(path)
+    return finish_output(written)
+
+def prune_static_assets():
+    # earlier versions of our assets, no longer linked from any page
+    current = set(STATIC_FILES.values())
+    names = {(name, ext) for name, ext, _ in STATIC_SOURCES.values()}
+    for fname in os.listdir(STATIC_DIR):
+        base = fname
+        for suffix in COMPRESSED_SUFFIXES:
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        parts = base.split(".")
+        if base not in current and len(parts) == 3 and (parts[0], parts[2]) in names:
+            os.remove(os.path.join(STATIC_DIR, fname))
+
+def finish_output(paths):
+    # -> size report rows
+    return [finish_site_file(p, PRECOMPRESS_OUTPUT) for p in paths]
+
+COLOR_MAP_PY = {
+    "High": {"bg": "#FF7276", "text": "#840000"},
+    "Low":  {"bg": "#87CEEB", "text": "#305CDE"},
+    "Avg":  {"bg": "#D3D3D3", "text": "black"},
+}
+
+# Display lookups by class code (Low/Avg/High = 0/1/2); anything else shows as Avg
+COLORS_BY_CODE = [(COLOR_MAP_PY[c]["bg"], COLOR_MAP_PY[c]["text"]) for c in CLASS_LABELS[:3]]
+ARROWS_BY_CODE = ["↓", "-", "↑"]
+
+def display_code(v) -> int:
+    code = class_code(v)
+    # Very Low / Very High bands show as Low / High
+    return AVG if code < 0 else int(BASE_CODE[code])
+
+def normalize_class(v) -> str:
+    return CLASS_LABELS[display_code(v)]
+
+def classify_color(class_val):
+    return COLORS_BY_CODE[display_code(class_val)]
+
+def arrow_for_class(cls) -> str:
+    return ARROWS_BY_CODE[display_code(cls)]
+
+def safe_player_filename(name):
+    safe = "".join(c if c.isalnum() or c in " _-" else "_" for c in str(name))
+    safe = safe.strip().replace(" ", "_")
+    return f"player_{safe}.html"
+
+# Lazy player pages keep their data next to the shell: data/player_<name>.<kind>.json
+PLAYER_DATA_DIR = os.path.join(ROOT_OVERVW, "data")
+PLAYER_DATA_REL = "data"  # relative from ROOT_OVERVW HTML pages
+
+def player_data_file(player, kind):
+    return f"{os.path.splitext(safe_player_filename(player))[0]}.{kind}.json"
+
+def html_escape(s):
+    if s is None:
+        return ""
+    s = str(s)
+    return (s.replace("&", "&amp;")
+             .replace("<", "&lt;")
+             .replace(">", "&gt;")
+             .replace('"', "&quot;")
+             .replace("'", "&#39;"))
+
+def player_headshot_rel(player_name: str) -> str:
+    return f"{ACCESSORIES_REL}/{quote(str(player_name))}.png"
+
+# Cell text comes from jump_pipeline/cell_format.py: durations as whole
+# ms, other measures to 1 dp, z to 2 dp, dates as YYYY-MM-DD. Tables
+# format whole columns; these two are for single values (tooltips).
+def format_number(col, val):
+    return format_value(col, val)
+
+def format_z(z):
+    return format_value(None, z, "2dp")
+
+def unit_from_col(col: str) -> str:
+    s = str(col)
+    i1 = s.find("[")
+    i2 = s.find("]")
+    if i1 != -1 and i2 != -1 and i2 > i1:
+        return s[i1+1:i2].strip()
+    return ""
+
+# ============================================================
+# WORD DISPLAY (old words, unbolded, stacked)
+# ============================================================
+def word_for_duration(cls: str) -> str:
+    c = normalize_class(cls)
+    if c == "Low":
+        return "Quicker"
+    if c == "High":
+        return "Slower"
+    return "Normal"
+
+def word_for_force(cls: str) -> str:
+    c = normalize_class(cls)
+    if c == "High":
+        return "Stronger"
+    if c == "Low":
+        return "Weaker"
+    return "Normal"
+
+def word_for_depth(cls: str) -> str:
+    c = normalize_class(cls)
+    if c == "High":
+        return "Deeper"
+    if c == "Low":
+        return "Shallower"
+    return "Normal"
+
+def label_to_word(lbl: str, cls: str) -> str:
+    if lbl in ("PD", "BD"):
+        return word_for_duration(cls)
+    if lbl == "DEP":
+        return word_for_depth(cls)
+    if lbl in ("PF", "BF"):
+        return word_for_force(cls)
+    return "Normal"
+
+def pretty_lbl(lbl: str) -> str:
+    return {"PD":"Duration", "BD":"Duration", "DEP":"Depth", "PF":"Force", "BF":"Force"}.get(lbl, lbl)
+
+def value_unit_z_texts(colname: str, values, z):
+    # "<value> <unit> (Z: <z>)" per row; no z -> "<value> <unit>", no value -> ""
+    v_str = format_column(values, value_spec(colname))
+    z_str = format_column(z, "2dp")
+    unit = unit_from_col(colname)
+    unit_str = f" {unit}" if unit else ""
+    with_z = v_str + unit_str + " (Z: " + z_str + ")"
+    return np.where(v_str == "", "", np.where(z_str == "", v_str + unit_str, with_z))
+
+def value_unit_z_text(colname: str, value, z) -> str:
+    return value_unit_z_texts(colname, [value], [z])[0]
+
+def tooltip_label_for_component(lbl: str, colname: str, value, z) -> str:
+    detail = value_unit_z_text(colname, value, z)
+    if detail == "":
+        return f"{lbl}: N/A"
+    return f"{lbl}: {detail}"
+
+def advanced_phase_lines(adv_items):
+    # [display code, "Label: word"] per phase component
+    lines = []
+    for it in adv_items:
+        lbl = it["lbl"]
+        cls = normalize_class(it["cls"])
+        lines.append([display_code(cls), f"{pretty_lbl(lbl)}: {label_to_word(lbl, cls)}"])
+    return lines
+
+def adv_lines_html(lines):
+    return "".join(
+        f"<div class='adv-line' style='color:{COLORS_BY_CODE[code][1]};'>{html_escape(txt)}</div>"
+        for code, txt in lines
+    )
+
+def build_advanced_phase_cell_html_words_only(adv_items):
+    return adv_lines_html(advanced_phase_lines(adv_items))
+
+def build_advanced_phase_tooltip_items_str(adv_items):
+    parts = []
+    for it in adv_items:
+        lbl = it["lbl"]
+        cls = normalize_class(it["cls"])
+        col = it["col"]
+        val = it["val"]
+        z = it["z"]
+        label = tooltip_label_for_component(lbl, col, val, z)
+        parts.append(f"{label}|{cls}")
+    return ";".join(parts)
+
+# ============================================================
+# TEAM OVERVIEW (built above; no CSV round trip)
+# ============================================================
+team_df = summary.reset_index(drop=True)
+if "LTD" in team_df.columns:
+    team_df["LTD_dt"] = pd.to_datetime(team_df["LTD"], errors="coerce")
+    team_df = team_df.sort_values("LTD_dt", ascending=False).drop(columns=["LTD_dt"])
+else:
+    team_df = team_df.sort_values(PLAYER_COL)
+
+# ============================================================
+# LOAD DAILY FILES
+# ============================================================
+def load_daily(file_path, label):
+    if not os.path.exists(file_path):
+        print(f"WARNING: {label} file not found at {file_path}.")
+        return pd.DataFrame()
+    df = clean_columns(pd.read_csv(file_path))
+    if DATE_COL in df.columns:
+        df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="coerce")
+    return encode_class_columns(df)
+
+def load_test_daily(test_type, label, gen_csv, abs_csv):
+    # one row per test with both phases: in-memory rows from the pipeline
+    # run, else the two phase CSVs joined row for row (the classifiers
+    # write them from the same rows, so repeat tests on one day stay
+    # separate rows)
+    if pipeline_run is not None:
+        df = pipeline_run["daily"][test_type].copy()
+    else:
+        df = join_phases({
+            "Generation": load_daily(gen_csv, f"{label} Generation"),
+            "Absorption": load_daily(abs_csv, f"{label} Absorption"),
+        })
+    if df.empty:
+        return df
+    return df.sort_values([PLAYER_COL, DATE_COL], kind="stable").reset_index(drop=True)
+
+def coalesce_columns(df, base_name):
+    if base_name not in df.columns:
+        for cand in [base_name + "_GEN", base_name + "_ABS", base_name + "_x", base_name + "_y"]:
+            if cand in df.columns:
+                df[base_name] = df[cand]
+                break
+    class_base = base_name + "_class"
+    if class_base not in df.columns:
+        for cand in [class_base + "_GEN", class_base + "_ABS", class_base + "_x", class_base + "_y"]:
+            if cand in df.columns:
+                df[class_base] = df[cand]
+                break
+    avg_prev = base_name + "_avg_prev"
+    if avg_prev not in df.columns:
+        for cand in [avg_prev + "_GEN", avg_prev + "_ABS", avg_prev + "_x", avg_prev + "_y"]:
+            if cand in df.columns:
+                df[avg_prev] = df[cand]
+                break
+    z_col = base_name + "_z"
+    if z_col not in df.columns:
+        for cand in [z_col + "_GEN", z_col + "_ABS", z_col + "_x", z_col + "_y"]:
+            if cand in df.columns:
+                df[z_col] = df[cand]
+                break
+
+def coalesce_simple(df, col_base):
+    if col_base in df.columns:
+        return
+    for cand in [col_base + "_GEN", col_base + "_ABS", col_base + "_x", col_base + "_y"]:
+        if cand in df.columns:
+            df[col_base] = df[cand]
+            break
+
+def standardize_test_df(df, test_type):
+    if df.empty:
+        return df
+
+    if test_type == "CMJ":
+        bases = [
+            "Concentric Duration [ms]",
+            "Concentric Mean Force / BM [N/kg]",
+            "Braking Phase Duration [ms]",
+            "Countermovement Depth [cm]",
+            "Eccentric Mean Force / BM [N/kg]",
+            "BW [KG]",
+            "Jump Height (Imp-Mom) [cm]",
+        ]
+    elif test_type == "SLJ_L":
+        bases = [
+            "Concentric Duration [ms] (L)",
+            "Concentric Mean Force / BM [N/kg] (L)",
+            "Braking Phase Duration [ms] (L)",
+            "Countermovement Depth [cm] (L)",
+            "Eccentric Mean Force / BM [N/kg] (L)",
+            "BW [KG]",
+            "Jump Height (Imp-Mom) [cm] (L)",
+        ]
+    else:
+        bases = [
+            "Concentric Duration [ms] (R)",
+            "Concentric Mean Force / BM [N/kg] (R)",
+            "Braking Phase Duration [ms] (R)",
+            "Countermovement Depth [cm] (R)",
+            "Eccentric Mean Force / BM [N/kg] (R)",
+            "BW [KG]",
+            "Jump Height (Imp-Mom) [cm] (R)",
+        ]
+
+    for b in bases:
+        coalesce_columns(df, b)
+
+    coalesce_simple(df, "Generation_Class")
+    coalesce_simple(df, "Absorption_Class")
+    return df
+
+def add_leg_phase_classes(df, test_type):
+    # SLJ pages read the leg's overall classes as Generation_Class / Absorption_Class
+    if df.empty:
+        return df
 
-        for spec in param_specs:
-            sub = ensure_class_column(sub, spec["value_col"], spec["class_col"])
+    if test_type == "SLJ_L":
+        if "Generation_Class" not in df.columns and "Generation_Class_L" in df.columns:
+            df["Generation_Class"] = df["Generation_Class_L"]
+        if "Absorption_Class" not in df.columns and "Absorption_Class_L" in df.columns:
+            df["Absorption_Class"] = df["Absorption_Class_L"]
 
-        gen_col = "Generation_Class"
-        abs_col = "Absorption_Class"
-        cols = [DATE_COL, abs_col, gen_col] + [spec["value_col"] for spec in param_specs]
-        value_col_map = {spec["value_col"]: spec for spec in param_specs}
-        numeric_cols = set(value_col_map.keys())
-
-        colgroup = "<colgroup>"
-        for c in cols:
-            if c == DATE_COL:
-                colgroup += "<col style='width:110px'>"
-            elif c in (abs_col, gen_col):
-                colgroup += "<col style='width:170px'>"
-            else:
-                colgroup += "<col style='width:150px'>"
-        colgroup += "</colgroup>"
-
-        header_cells = []
-        for c in cols:
-            if c == DATE_COL:
-                header_cells.append('<th data-col="Date">Date</th>')
-            elif c == gen_col:
-                header_cells.append('<th data-col="Generation_Class">Generation Overall</th>')
-            elif c == abs_col:
-                header_cells.append('<th data-col="Absorption_Class">Absorption Overall</th>')
-            else:
-                header_cells.append(f'<th data-col="{html_escape(c)}">{html_escape(value_col_map[c]["label"])}</th>')
-
-        body_rows = []
-        for _, r in sub.iterrows():
-            date_val = r.get(DATE_COL, None)
-            date_str = date_val.strftime("%Y-%m-%d") if isinstance(date_val, pd.Timestamp) else ""
-            tds = []
-
-            for c in cols:
-                v = r.get(c, "")
-
-                if c == DATE_COL:
-                    tds.append(f"<td class='cell-tight'>{html_escape(date_str)}</td>")
-                    continue
-
-                if c in [gen_col, abs_col]:
-                    cls_val = normalize_class(v)
-                    bg, fg = classify_color(cls_val)
-                    phase = "Generation" if c == gen_col else "Absorption"
-
-                    mapping = phase_component_columns(test_type, phase)
-
-                    tooltip_items_summary = [(lbl, normalize_class(r.get(f"{colname}_class", "Avg"))) for (lbl, colname) in mapping]
-                    items_str_summary = ";".join(f"{lbl}|{cls}" for (lbl, cls) in tooltip_items_summary if lbl and cls)
-                    tooltip_title_summary = f"{test_type} {phase} ({date_str})"
-
-                    adv_items = []
-                    for lbl, colname in mapping:
-                        comp_cls = normalize_class(r.get(f"{colname}_class", "Avg"))
-                        comp_val = r.get(colname, None)
-
-                        comp_z = r.get(f"{colname}_z", None)
-                        if comp_z is None or (isinstance(comp_z, float) and pd.isna(comp_z)) or str(comp_z) == "nan":
-                            comp_z = compute_z_for_value(df_daily, player, colname, comp_val)
-
-                        adv_items.append({"lbl": lbl, "cls": comp_cls, "col": colname, "val": comp_val, "z": comp_z})
-
-                    tooltip_title_advanced = f"{test_type} {phase} details ({date_str})"
-                    items_str_advanced = build_advanced_phase_tooltip_items_str(adv_items)
-
-                    summary_disp = arrow_for_class(cls_val)
-                    advanced_cell_html = build_advanced_phase_cell_html_words_only(adv_items)
-
-                    tds.append(
-                        f'<td class="metric-cell phase-cell" style="background-color:{bg};color:{fg};" '
-                        f'data-tooltip-title-summary="{html_escape(tooltip_title_summary)}" '
-                        f'data-tooltip-items-summary="{html_escape(items_str_summary)}" '
-                        f'data-tooltip-title-advanced="{html_escape(tooltip_title_advanced)}" '
-                        f'data-tooltip-items-advanced="{html_escape(items_str_advanced)}">'
-                        f'  <div class="view-summary" style="font-weight:900;font-size:16px;line-height:1;">{html_escape(summary_disp)}</div>'
-                        f'  <div class="view-advanced" style="display:none;">{advanced_cell_html}</div>'
-                        f'</td>'
-                    )
-                    continue
+    if test_type == "SLJ_R":
+        if "Generation_Class" not in df.columns and "Generation_Class_R" in df.columns:
+            df["Generation_Class"] = df["Generation_Class_R"]
+        if "Absorption_Class" not in df.columns and "Absorption_Class_R" in df.columns:
+            df["Absorption_Class"] = df["Absorption_Class_R"]
 
-                if c in numeric_cols:
-                    cls_val = normalize_class(r.get(value_col_map[c]["class_col"], "Avg"))
-                    bg, fg = classify_color(cls_val)
-                    tt_title = tooltip_for_avg_prev(r, c, value_col_map[c]["label"])
+    return df
 
-                    v_summary = "" if pd.isna(v) else format_number(c, v)
+# The pipeline frames come straight from the engine: one column per
+# parameter and the classifiers' own overall classes (blank when an
+# input is missing, as in the daily CSVs and PDFs). The clean-up of
+# suffixed copies and the re-derived classes below are for CSV data only.
+cmj_daily = load_test_daily("CMJ", "CMJ", CMJ_GEN_CSV, CMJ_ABS_CSV)
+sljL_daily = load_test_daily("SLJ_L", "SLJ-L", SLJ_L_GEN_CSV, SLJ_L_ABS_CSV)
+sljR_daily = load_test_daily("SLJ_R", "SLJ-R", SLJ_R_GEN_CSV, SLJ_R_ABS_CSV)
 
-                    z_val = r.get(f"{c}_z", None)
-                    if z_val is None or (isinstance(z_val, float) and pd.isna(z_val)) or str(z_val) == "nan":
-                        z_val = compute_z_for_value(df_daily, player, c, v)
-                    z_str = format_z(z_val)
+if pipeline_run is None:
+    cmj_daily = standardize_test_df(cmj_daily, "CMJ")
+    sljL_daily = standardize_test_df(sljL_daily, "SLJ_L")
+    sljR_daily = standardize_test_df(sljR_daily, "SLJ_R")
 
-                    v_adv = v_summary if z_str == "" or v_summary == "" else f"{v_summary} (Z: {z_str})"
+def recompute_overall_phase_classes(df_daily, test_type: str):
+    if df_daily is None or df_daily.empty:
+        return df_daily
 
-                    tds.append(
-                        f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
-                        f'data-tooltip-title="{html_escape(tt_title)}" data-tooltip-items="">'
-                        f'  <span class="view-summary">{html_escape(v_summary)}</span>'
-                        f'  <span class="view-advanced" style="display:none;">{html_escape(v_adv)}</span>'
-                        f'</td>'
-                    )
-                    continue
+    if test_type == "CMJ":
+        pd_col = "Concentric Duration [ms]"
+        pf_col = "Concentric Mean Force / BM [N/kg]"
+        bd_col = "Braking Phase Duration [ms]"
+        dep_col = "Countermovement Depth [cm]"
+        bf_col = "Eccentric Mean Force / BM [N/kg]"
+    elif test_type == "SLJ_L":
+        pd_col = "Concentric Duration [ms] (L)"
+        pf_col = "Concentric Mean Force / BM [N/kg] (L)"
+        bd_col = "Braking Phase Duration [ms] (L)"
+        dep_col = "Countermovement Depth [cm] (L)"
+        bf_col = "Eccentric Mean Force / BM [N/kg] (L)"
+    else:
+        pd_col = "Concentric Duration [ms] (R)"
+        pf_col = "Concentric Mean Force / BM [N/kg] (R)"
+        bd_col = "Braking Phase Duration [ms] (R)"
+        dep_col = "Countermovement Depth [cm] (R)"
+        bf_col = "Eccentric Mean Force / BM [N/kg] (R)"
 
-                tds.append(f"<td class='cell-tight'>{html_escape(v)}</td>")
+    # same lookup tables as the classifiers; blank/unknown classes count as Avg (normalize_class)
+    if all(f"{c}_class" in df_daily.columns for c in [pd_col, dep_col, pf_col]):
+        df_daily["Generation_Class"] = phase_classes(
+            df_daily, GENERATION_LUT, [f"{c}_class" for c in [pd_col, dep_col, pf_col]],
+            missing=AVG,
+        )
 
-            body_rows.append("<tr>" + "".join(tds) + "</tr>")
+    if all(f"{c}_class" in df_daily.columns for c in [bd_col, dep_col, bf_col]):
+        df_daily["Absorption_Class"] = phase_classes(
+            df_daily, ABSORPTION_LUT, [f"{c}_class" for c in [bd_col, dep_col, bf_col]],
+            missing=AVG,
+        )
 
-        return f"""
-<h2>{html_escape(title)}</h2>
-<div class="table-wrap">
-<table class="sortable-table paginated-table" data-test="{html_escape(test_type)}">
-    {colgroup}
-    <thead><tr>{"".join(header_cells)}</tr></thead>
-    <tbody>{"".join(body_rows)}</tbody>
-</table>
-</div>
-"""
+    return df_daily
 
-    sections.append(build_section("CMJ", cmj_daily, "CMJ"))
-    sections.append(build_section("SLJ - Left", sljL_daily, "SLJ_L"))
-    sections.append(build_section("SLJ - Right", sljR_daily, "SLJ_R"))
+if pipeline_run is None:
+    cmj_daily = recompute_overall_phase_classes(cmj_daily, "CMJ")
+    sljL_daily = recompute_overall_phase_classes(sljL_daily, "SLJ_L")
+    sljR_daily = recompute_overall_phase_classes(sljR_daily, "SLJ_R")
 
-    # ============================================================
-    # Visualize It dataset (canonical vars to prevent duplicates)
-    # ============================================================
-    def canonical_records_for_player(df_daily, test_type):
-        if df_daily is None or df_daily.empty:
-            return []
-        sub = df_daily[df_daily[PLAYER_COL] == player].copy()
-        if sub.empty:
-            return []
-        sub = sub.sort_values(DATE_COL)
+sljL_daily = add_leg_phase_classes(sljL_daily, "SLJ_L")
+sljR_daily = add_leg_phase_classes(sljR_daily, "SLJ_R")
 
-        def date_to_str(d):
-            if isinstance(d, pd.Timestamp):
-                return d.strftime("%Y-%m-%d")
-            return ""
+# ============================================================
+# PER-PLAYER INDEX
+#   The daily frames are sorted by player, then date, so each
+#   player's tests are one contiguous, date-ascending block. The
+#   blocks are cut once per test type; the team / player page
+#   helpers below look their player up here instead of filtering
+#   the whole daily frame for every player and cell.
+# ============================================================
+def index_players(df_daily):
+    if df_daily is None or df_daily.empty:
+        return {}
+    return dict(iter(df_daily.groupby(PLAYER_COL, sort=False)))
 
-        if test_type == "CMJ":
-            col_map = {
-                "Body Weight [kg]": "BW [KG]",
-                "Jump Height [cm]": "Jump Height (Imp-Mom) [cm]",
-                "Braking Duration [ms]": "Braking Phase Duration [ms]",
-                "Squat Depth [cm]": "Countermovement Depth [cm]",
-                "Braking Force [N/kg]": "Eccentric Mean Force / BM [N/kg]",
-                "Propulsive Duration [ms]": "Concentric Duration [ms]",
-                "Propulsive Force [N/kg]": "Concentric Mean Force / BM [N/kg]",
-            }
-        elif test_type == "SLJ_L":
-            col_map = {
-                "Body Weight [kg]": "BW [KG]",
-                "Jump Height [cm]": "Jump Height (Imp-Mom) [cm] (L)",
-                "Braking Duration [ms]": "Braking Phase Duration [ms] (L)",
-                "Squat Depth [cm]": "Countermovement Depth [cm] (L)",
-                "Braking Force [N/kg]": "Eccentric Mean Force / BM [N/kg] (L)",
-                "Propulsive Duration [ms]": "Concentric Duration [ms] (L)",
-                "Propulsive Force [N/kg]": "Concentric Mean Force / BM [N/kg] (L)",
-            }
-        else:
-            col_map = {
-                "Body Weight [kg]": "BW [KG]",
-                "Jump Height [cm]": "Jump Height (Imp-Mom) [cm] (R)",
-                "Braking Duration [ms]": "Braking Phase Duration [ms] (R)",
-                "Squat Depth [cm]": "Countermovement Depth [cm] (R)",
-                "Braking Force [N/kg]": "Eccentric Mean Force / BM [N/kg] (R)",
-                "Propulsive Duration [ms]": "Concentric Duration [ms] (R)",
-                "Propulsive Force [N/kg]": "Concentric Mean Force / BM [N/kg] (R)",
-            }
+PLAYER_INDEX = {
+    "CMJ": index_players(cmj_daily),
+    "SLJ_L": index_players(sljL_daily),
+    "SLJ_R": index_players(sljR_daily),
+}
+NO_ROWS = pd.DataFrame()
 
-        recs = []
-        for _, r in sub.iterrows():
-            d = date_to_str(r.get(DATE_COL, None))
-            if not d:
-                continue
-            rec = {"Test": test_type, "Date": d}
-            for canon, src in col_map.items():
-                if src in r.index:
-                    v = pd.to_numeric(pd.Series([r.get(src, None)]), errors="coerce").iloc[0]
-                    rec[canon] = None if pd.isna(v) else float(v)
-                else:
-                    rec[canon] = None
-            recs.append(rec)
-        return recs
-
-    player_records = []
-    player_records.extend(canonical_records_for_player(cmj_daily, "CMJ"))
-    player_records.extend(canonical_records_for_player(sljL_daily, "SLJ_L"))
-    player_records.extend(canonical_records_for_player(sljR_daily, "SLJ_R"))
-
-    def py_to_js(obj):
-        if obj is None:
-            return "null"
-        if isinstance(obj, bool):
-            return "true" if obj else "false"
-        if isinstance(obj, (int, float)):
-            if pd.isna(obj):
-                return "null"
-            return str(obj)
-        if isinstance(obj, str):
-            return '"' + obj.replace("\\", "\\\\").replace('"', '\\"') + '"'
-        if isinstance(obj, list):
-            return "[" + ",".join(py_to_js(x) for x in obj) + "]"
-        if isinstance(obj, dict):
-            items = []
-            for k, v in obj.items():
-                items.append(py_to_js(str(k)) + ":" + py_to_js(v))
-            return "{" + ",".join(items) + "}"
-        return py_to_js(str(obj))
-
-    PLAYER_DATA_JS = py_to_js(player_records)
+def player_rows(test_type, player):
+    # date-ascending daily rows of one player (shared: copy before editing)
+    return PLAYER_INDEX[test_type].get(player, NO_ROWS)
 
-    # ============================================================
-    # Visualize It JS (EDITS ONLY):
-    # - Time series (Line) x-axis ALWAYS Date (and hide/disable X dropdown)
-    # ============================================================
-    VISUALIZE_IT_JS = r"""
-(function(){
-  const COLORS = {
-    "CMJ":   "#CE0E2D",
-    "SLJ_L": "#3A8DDE",
-    "SLJ_R": "#F25623"
-  };
+# ============================================================
+# LATEST TEST PER PLAYER
+#   the same latest-test view the classifiers' team snapshots use,
+#   one row (as a dict) per (test type, player) with every value,
+#   z and class; read by the team overview cells and tooltips
+# ============================================================
+def latest_test_rows(df_daily):
+    if df_daily is None or df_daily.empty:
+        return {}
+    return latest_tests(df_daily).set_index(PLAYER_COL, drop=False).to_dict("index")
 
-  function colorForTest(t){
-    return COLORS[t] || "#CE0E2D";
-  }
+LATEST_TESTS = {
+    "CMJ": latest_test_rows(cmj_daily),
+    "SLJ_L": latest_test_rows(sljL_daily),
+    "SLJ_R": latest_test_rows(sljR_daily),
+}
 
-  function $(id){ return document.getElementById(id); }
+# ============================================================
+# PER-PLAYER PARAMETER STATS
+#   mean / SD / count of every value column per (test type, player),
+#   from one groupby per test type. The z-score fallbacks and the
+#   team tooltip means look them up instead of re-aggregating the
+#   player's rows for every cell.
+# ============================================================
+def player_param_stats(df_daily):
+    if df_daily is None or df_daily.empty:
+        return {}
+    value_cols = [
+        c for c in df_daily.columns
+        if c not in (PLAYER_COL, DATE_COL) and not isinstance(df_daily[c].dtype, pd.CategoricalDtype)
+    ]
+    values = df_daily[value_cols].apply(pd.to_numeric, errors="coerce")
+    stats = values.groupby(df_daily[PLAYER_COL], sort=False).agg(["mean", "std", "count"])
+    return stats.to_dict("index")
+
+PARAM_STATS = {
+    "CMJ": player_param_stats(cmj_daily),
+    "SLJ_L": player_param_stats(sljL_daily),
+    "SLJ_R": player_param_stats(sljR_daily),
+}
 
-  const VAR_DEFS = [
-    {key:"Body Weight [kg]", label:"Body Weight [kg]"},
-    {key:"Jump Height [cm]", label:"Jump Height [cm]"},
-    {key:"Braking Duration [ms]", label:"Braking Duration [ms]"},
-    {key:"Squat Depth [cm]", label:"Squat Depth [cm]"},
-    {key:"Braking Force [N/kg]", label:"Braking Force [N/kg]"},
-    {key:"Propulsive Duration [ms]", label:"Propulsive Duration [ms]"},
-    {key:"Propulsive Force [N/kg]", label:"Propulsive Force [N/kg]"}
-  ];
+def param_stats(test_type, player, value_col):
+    # (mean, SD, count) of one player's value column, or None
+    stats = PARAM_STATS[test_type].get(player)
+    if stats is None or (value_col, "mean") not in stats:
+        return None
+    return stats[(value_col, "mean")], stats[(value_col, "std")], stats[(value_col, "count")]
+
+# ============================================================
+# Phase component mapping
+# ============================================================
+def phase_component_columns(test_type, phase):
+    if test_type == "CMJ":
+        PD = "Concentric Duration [ms]"
+        PF = "Concentric Mean Force / BM [N/kg]"
+        BD = "Braking Phase Duration [ms]"
+        DEP = "Countermovement Depth [cm]"
+        BF = "Eccentric Mean Force / BM [N/kg]"
+    elif test_type == "SLJ_L":
+        PD = "Concentric Duration [ms] (L)"
+        PF = "Concentric Mean Force / BM [N/kg] (L)"
+        BD = "Braking Phase Duration [ms] (L)"
+        DEP = "Countermovement Depth [cm] (L)"
+        BF = "Eccentric Mean Force / BM [N/kg] (L)"
+    else:
+        PD = "Concentric Duration [ms] (R)"
+        PF = "Concentric Mean Force / BM [N/kg] (R)"
+        BD = "Braking Phase Duration [ms] (R)"
+        DEP = "Countermovement Depth [cm] (R)"
+        BF = "Eccentric Mean Force / BM [N/kg] (R)"
 
-  const PLAYER_DATA = __PLAYER_DATA__;
+    if phase == "Generation":
+        return [("PD", PD), ("DEP", DEP), ("PF", PF)]
+    return [("BD", BD), ("DEP", DEP), ("BF", BF)]
 
-  function setTab(tabId){
-    const tabHistory = $("tab-history");
-    const tabViz = $("tab-viz");
-    const btnHistory = $("tabbtn-history");
-    const btnViz = $("tabbtn-viz");
-    if (!tabHistory || !tabViz || !btnHistory || !btnViz) return;
+# ============================================================
+# Z-score fallback computation (per player, per test_type, per param)
+# ============================================================
+def compute_z_for_value(test_type, player, value_col, value):
+    stats = param_stats(test_type, player, value_col)
+    if stats is None:
+        return None
+    mu, sd, _ = stats
+    try:
+        x_cur = pd.to_numeric(pd.Series([value]), errors="coerce").iloc[0]
+        if pd.isna(sd) or sd == 0 or pd.isna(mu) or pd.isna(x_cur):
+            return None
+        return (x_cur - mu) / sd
+    except Exception:
+        return None
 
-    if (tabId === "viz") {
-      tabHistory.style.display = "none";
-      tabViz.style.display = "";
-      btnViz.classList.add("active");
-      btnHistory.classList.remove("active");
-      try { localStorage.setItem("playerTab", "viz"); } catch(e) {}
-      try { initVizOnce(); } catch(e) {}
-    } else {
-      tabViz.style.display = "none";
-      tabHistory.style.display = "";
-      btnHistory.classList.add("active");
-      btnViz.classList.remove("active");
-      try { localStorage.setItem("playerTab", "history"); } catch(e) {}
-    }
-  }
+def z_scores(test_type, player, value_col, rows):
+    # the rows' stored z, else the compute_z_for_value fallback, as one array
+    z_col = f"{value_col}_z"
+    z = as_float(rows[z_col]) if z_col in rows.columns else np.full(len(rows), np.nan)
+    stats = param_stats(test_type, player, value_col)
+    if stats is None or value_col not in rows.columns:
+        return z
+    mu, sd, _ = stats
+    if pd.isna(sd) or sd == 0 or pd.isna(mu):
+        return z
+    return np.where(np.isnan(z), (as_float(rows[value_col]) - mu) / sd, z)
 
-  function uniq(arr){ return Array.from(new Set(arr)); }
+def get_latest_phase_components(player, test_type, phase):
+    last = LATEST_TESTS[test_type].get(player)
+    if last is None:
+        return ("", [], [])
+    date_val = last.get(DATE_COL, None)
+    date_str = date_val.strftime("%Y-%m-%d") if isinstance(date_val, pd.Timestamp) else ""
 
-  function minDate(dates){
-    if (!dates.length) return "";
-    return dates.reduce((a,b)=> (a<b?a:b));
-  }
-  function maxDate(dates){
-    if (!dates.length) return "";
-    return dates.reduce((a,b)=> (a>b?a:b));
-  }
-  function inRange(dateStr, startStr, endStr){
-    if (!dateStr) return false;
-    if (startStr && dateStr < startStr) return false;
-    if (endStr && dateStr > endStr) return false;
-    return true;
-  }
+    mapping = phase_component_columns(test_type, phase)
 
-  function testLabel(t){
-    if (t === "CMJ") return "CMJ";
-    if (t === "SLJ_L") return "SLJ - Left";
-    if (t === "SLJ_R") return "SLJ - Right";
-    return t || "";
-  }
+    tooltip_items_summary = []
+    adv_items = []
 
-  function filteredRecords(){
-    const recs = (PLAYER_DATA || []).slice();
-    const test = $("viz-test") ? $("viz-test").value : "ALL";
-    const start = $("viz-date-start") ? $("viz-date-start").value : "";
-    const end = $("viz-date-end") ? $("viz-date-end").value : "";
+    for lbl, col in mapping:
+        cls = normalize_class(last.get(f"{col}_class", "Avg"))
+        tooltip_items_summary.append((lbl, cls))
 
-    return recs.filter(r => {
-      if (test && test !== "ALL" && r.Test !== test) return false;
-      if (!inRange(r.Date, start, end)) return false;
-      return true;
-    });
-  }
+        val = last.get(col, None)
 
-  function getAvailableVarsForTest(test){
-    const recs = (PLAYER_DATA || []).filter(r => test === "ALL" ? true : r.Test === test);
-    const available = [];
-    VAR_DEFS.forEach(vd => {
-      const hasAny = recs.some(r => typeof r[vd.key] === "number" && !isNaN(r[vd.key]));
-      if (hasAny) available.push(vd);
-    });
-    return available;
-  }
+        z_val = last.get(f"{col}_z", None)
+        if z_val is None or (isinstance(z_val, float) and pd.isna(z_val)) or str(z_val) == "nan":
+            z_val = compute_z_for_value(test_type, player, col, val)
+
+        adv_items.append({"lbl": lbl, "cls": cls, "col": col, "val": val, "z": z_val})
+
+    return (date_str, tooltip_items_summary, adv_items)
+
+# ============================================================
+# TEAM OVERVIEW HTML HELPERS
+# ============================================================
+def get_param_mean(player, test_type, param_col):
+    stats = param_stats(test_type, player, param_col)
+    if stats is None:
+        return None
+    m = stats[0]
+    return None if pd.isna(m) else m
+
+def get_latest_param_class(player, test_type, param_col):
+    last = LATEST_TESTS[test_type].get(player)
+    if last is None or param_col not in last:
+        return None
+    return last.get(f"{param_col}_class", None)
+
+# ============================================================
+# TEAM OVERVIEW HTML
+# ============================================================
+def build_team_overview_html(df: pd.DataFrame, out_path: str):
+    cols = [
+        PLAYER_COL, "TTD", "LTD",
+        "BW [KG]",
+        "Jump Height (Imp-Mom) [cm]",
+        "Jump Height (Imp-Mom) [cm] (L)",
+        "Jump Height (Imp-Mom) [cm] (R)",
+        "CMJ_ABS_OVR", "CMJ_GEN_OVR",
+        "SLJ_L_ABS_OVR", "SLJ_L_GEN_OVR",
+        "SLJ_R_ABS_OVR", "SLJ_R_GEN_OVR",
+    ]
 
-  function setSelectOptions(selectEl, options, defaultKey){
-    if (!selectEl) return;
-    selectEl.innerHTML = "";
-    options.forEach(opt => {
-      const o = document.createElement("option");
-      o.value = opt.key;
-      o.textContent = opt.label;
-      selectEl.appendChild(o);
-    });
-    if (options.length) {
-      const pick = options.find(o => o.key === defaultKey) ? defaultKey : options[0].key;
-      selectEl.value = pick;
+    display_labels = {
+        PLAYER_COL: "PLAYER",
+        "TTD": "Total\nTesting Days",
+        "LTD": "Last\nTesting Day",
+        "BW [KG]": "Weight [kg]",
+        "Jump Height (Imp-Mom) [cm]": "CMJ\nJump Height [cm]",
+        "Jump Height (Imp-Mom) [cm] (L)": "SLJ-L\nJump Height [cm]",
+        "Jump Height (Imp-Mom) [cm] (R)": "SLJ-R\nJump Height [cm]",
+        "CMJ_ABS_OVR": "CMJ\nAbsorption",
+        "CMJ_GEN_OVR": "CMJ\nGeneration",
+        "SLJ_L_ABS_OVR": "SLJ-L\nAbsorption",
+        "SLJ_L_GEN_OVR": "SLJ-L\nGeneration",
+        "SLJ_R_ABS_OVR": "SLJ-R\nAbsorption",
+        "SLJ_R_GEN_OVR": "SLJ-R\nGeneration",
     }
-  }
-
-  function syncVariableDropdowns(){
-    const test = $("viz-test") ? $("viz-test").value : "ALL";
-    const avail = getAvailableVarsForTest(test);
 
-    const plotType = $("viz-plot-type") ? $("viz-plot-type").value : "scatter";
-    const xSel = $("viz-x");
+    metric_phase_map = {
+        "CMJ_ABS_OVR":   ("CMJ",   "Absorption"),
+        "CMJ_GEN_OVR":   ("CMJ",   "Generation"),
+        "SLJ_L_ABS_OVR": ("SLJ_L", "Absorption"),
+        "SLJ_L_GEN_OVR": ("SLJ_L", "Generation"),
+        "SLJ_R_ABS_OVR": ("SLJ_R", "Absorption"),
+        "SLJ_R_GEN_OVR": ("SLJ_R", "Generation"),
+    }
 
-    // Always rebuild X options (but "line" will force Date and disable)
-    if (xSel) {
-      xSel.innerHTML = "";
-      const od = document.createElement("option");
-      od.value = "Date";
-      od.textContent = "Date";
-      xSel.appendChild(od);
-      avail.forEach(v => {
-        const o = document.createElement("option");
-        o.value = v.key;
-        o.textContent = v.label;
-        xSel.appendChild(o);
-      });
-      xSel.value = "Date";
-      // For time series (line), lock X to Date
-      if (plotType === "line") {
-        xSel.value = "Date";
-        xSel.disabled = true;
-      } else {
-        xSel.disabled = false;
-      }
+    col_widths = {
+        PLAYER_COL: "190px",
+        "TTD": "120px",
+        "LTD": "120px",
+        "BW [KG]": "110px",
+        "Jump Height (Imp-Mom) [cm]": "130px",
+        "Jump Height (Imp-Mom) [cm] (L)": "130px",
+        "Jump Height (Imp-Mom) [cm] (R)": "130px",
+        "CMJ_ABS_OVR": "120px",
+        "CMJ_GEN_OVR": "120px",
+        "SLJ_L_ABS_OVR": "120px",
+        "SLJ_L_GEN_OVR": "120px",
+        "SLJ_R_ABS_OVR": "120px",
+        "SLJ_R_GEN_OVR": "120px",
     }
+    colgroup = "<colgroup>" + "".join([f"<col style='width:{col_widths.get(c,'120px')}'>" for c in cols]) + "</colgroup>"
 
-    const ySel = $("viz-y");
-    const defaultY = avail.find(v => v.key.indexOf("Jump Height") !== -1)?.key;
-    setSelectOptions(ySel, avail, defaultY);
+    header_cells = "".join(f"<th>{display_labels.get(c, c)}</th>" for c in cols)
 
-    const varSel = $("viz-var");
-    setSelectOptions(varSel, avail, defaultY);
-  }
+    # cell text for every column in one pass; phase columns keep their class label
+    specs = {c: value_spec(c) for c in cols}
+    specs.update({PLAYER_COL: "text", "LTD": "date"})
+    specs.update({c: "text" for c in metric_phase_map})
+    cell_text = format_frame(df, specs).to_dict("records")
 
-  function syncControlVisibility(){
-    const plotType = $("viz-plot-type");
-    const rowXY = $("viz-row-xy");
-    const rowVar = $("viz-row-var");
-    const rowGroup = $("viz-row-group");
-    if (!plotType) return;
+    html_rows = []
+    for row, texts in zip(df.to_dict("records"), cell_text):
+        player = row.get(PLAYER_COL, "")
+        player_filename = safe_player_filename(player)
 
-    const v = plotType.value;
+        bw_cls_row = row.get("BW [KG]_class", None)
+        cmj_jh_cls_row = row.get("Jump Height (Imp-Mom) [cm]_class", None)
+        sljL_jh_cls_row = row.get("Jump Height (Imp-Mom) [cm] (L)_class", None)
+        sljR_jh_cls_row = row.get("Jump Height (Imp-Mom) [cm] (R)_class", None)
 
-    if (rowXY) rowXY.style.display = (v === "scatter" || v === "line") ? "" : "none";
-    if (rowVar) rowVar.style.display = (v === "box") ? "" : "none";
-    if (rowGroup) rowGroup.style.display = (v === "box") ? "" : "none";
+        bw_cls = get_latest_param_class(player, "CMJ", "BW [KG]")
+        cmj_jh_cls = get_latest_param_class(player, "CMJ", "Jump Height (Imp-Mom) [cm]")
+        sljL_jh_cls = get_latest_param_class(player, "SLJ_L", "Jump Height (Imp-Mom) [cm] (L)")
+        sljR_jh_cls = get_latest_param_class(player, "SLJ_R", "Jump Height (Imp-Mom) [cm] (R)")
 
-    // For line plot, lock X selector to Date (also handled in syncVariableDropdowns)
-    const xSel = $("viz-x");
-    if (xSel) {
-      if (v === "line") {
-        xSel.value = "Date";
-        xSel.disabled = true;
-      } else {
-        xSel.disabled = false;
-      }
-    }
-  }
+        if class_code(bw_cls) < 0:
+            bw_cls = bw_cls_row
+        if class_code(cmj_jh_cls) < 0:
+            cmj_jh_cls = cmj_jh_cls_row
+        if class_code(sljL_jh_cls) < 0:
+            sljL_jh_cls = sljL_jh_cls_row
+        if class_code(sljR_jh_cls) < 0:
+            sljR_jh_cls = sljR_jh_cls_row
 
-  // quantiles for box hover text (removes fence entirely)
-  function quantileSorted(sorted, q){
-    if (!sorted.length) return null;
-    if (sorted.length === 1) return sorted[0];
-    const pos = (sorted.length - 1) * q;
-    const base = Math.floor(pos);
-    const rest = pos - base;
-    if (sorted[base + 1] === undefined) return sorted[base];
-    return sorted[base] + rest * (sorted[base + 1] - sorted[base]);
-  }
+        mean_bw_cmj   = get_param_mean(player, "CMJ",   "BW [KG]")
+        mean_jh_cmj   = get_param_mean(player, "CMJ",   "Jump Height (Imp-Mom) [cm]")
+        mean_jh_sljL  = get_param_mean(player, "SLJ_L", "Jump Height (Imp-Mom) [cm] (L)")
+        mean_jh_sljR  = get_param_mean(player, "SLJ_R", "Jump Height (Imp-Mom) [cm] (R)")
 
-  let __vizInitialized = false;
-  function initVizOnce(){
-    if (__vizInitialized) return;
-    __vizInitialized = true;
+        row_tds = []
+        for col in cols:
+            val_str = texts[col]
 
-    const recs = (PLAYER_DATA || []).slice();
-    const dates = recs.map(r => r.Date).filter(Boolean);
-    const dmin = minDate(dates);
-    const dmax = maxDate(dates);
+            if col == PLAYER_COL:
+                img_src = player_headshot_rel(val_str)
+                row_tds.append(
+                    f'<td class="sticky-name">'
+                    f'  <a class="player-link" href="{player_filename}">'
+                    f'    <img class="player-avatar" src="{img_src}" alt="{html_escape(val_str)}" '
+                    f'         onerror="this.style.display=\'none\';" />'
+                    f'    <span class="player-name-text">{html_escape(val_str)}</span>'
+                    f'  </a>'
+                    f'</td>'
+                )
+                continue
 
-    const dateStart = $("viz-date-start");
-    const dateEnd = $("viz-date-end");
-    if (dateStart) dateStart.value = dmin;
-    if (dateEnd) dateEnd.value = dmax;
+            if col == "BW [KG]":
+                bg, fg = classify_color(bw_cls)
+                title = (f"CMJ Body Weight mean: {mean_bw_cmj:.1f} kg"
+                         if mean_bw_cmj is not None else "CMJ Body Weight mean: N/A")
+                row_tds.append(
+                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
+                    f'{html_escape(val_str)}</td>'
+                )
+                continue
 
-    const testSel = $("viz-test");
-    if (testSel) {
-      const tests = uniq(recs.map(r => r.Test).filter(Boolean));
-      testSel.innerHTML = "";
-      const optAll = document.createElement("option");
-      optAll.value = "ALL";
-      optAll.textContent = "All Tests";
-      testSel.appendChild(optAll);
-      tests.forEach(t => {
-        const opt = document.createElement("option");
-        opt.value = t;
-        opt.textContent = testLabel(t);
-        testSel.appendChild(opt);
-      });
-      testSel.value = "ALL";
-    }
+            if col == "Jump Height (Imp-Mom) [cm]":
+                bg, fg = classify_color(cmj_jh_cls)
+                title = (f"CMJ Jump Height mean: {mean_jh_cmj:.1f} cm"
+                         if mean_jh_cmj is not None else "CMJ Jump Height mean: N/A")
+                row_tds.append(
+                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
+                    f'{html_escape(val_str)}</td>'
+                )
+                continue
 
-    const plotType = $("viz-plot-type");
-    if (plotType) {
-      plotType.innerHTML = "";
-      [
-        {v:"scatter", t:"Scatter"},
-        {v:"line", t:"Line (time series)"},
-        {v:"box", t:"Box Plot"}
-      ].forEach(p => {
-        const opt = document.createElement("option");
-        opt.value = p.v; opt.textContent = p.t;
-        plotType.appendChild(opt);
-      });
-      plotType.value = "scatter";
-    }
+            if col == "Jump Height (Imp-Mom) [cm] (L)":
+                bg, fg = classify_color(sljL_jh_cls)
+                title = (f"SLJ-L Jump Height mean: {mean_jh_sljL:.1f} cm"
+                         if mean_jh_sljL is not None else "SLJ-L Jump Height mean: N/A")
+                row_tds.append(
+                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
+                    f'{html_escape(val_str)}</td>'
+                )
+                continue
 
-    const groupSel = $("viz-group");
-    if (groupSel) {
-      groupSel.innerHTML = "";
-      [
-        {v:"NONE", t:"No grouping"},
-        {v:"Test", t:"Group by Test"}
-      ].forEach(g => {
-        const opt = document.createElement("option");
-        opt.value = g.v; opt.textContent = g.t;
-        groupSel.appendChild(opt);
-      });
-      groupSel.value = "Test";
-    }
+            if col == "Jump Height (Imp-Mom) [cm] (R)":
+                bg, fg = classify_color(sljR_jh_cls)
+                title = (f"SLJ-R Jump Height mean: {mean_jh_sljR:.1f} cm"
+                         if mean_jh_sljR is not None else "SLJ-R Jump Height mean: N/A")
+                row_tds.append(
+                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title="{html_escape(title)}" data-tooltip-items="">'
+                    f'{html_escape(val_str)}</td>'
+                )
+                continue
+
+            if col in metric_phase_map:
+                test_type, phase = metric_phase_map[col]
+                overall_cls = normalize_class(val_str)
+                bg, fg = classify_color(overall_cls)
 
-    syncVariableDropdowns();
-    syncControlVisibility();
+                date_str, tooltip_items_summary, adv_items = get_latest_phase_components(player, test_type, phase)
 
-    if (testSel) testSel.addEventListener("change", () => {
-      syncVariableDropdowns();
-      renderPlot();
-    });
+                items_str_summary = ";".join(f"{lbl}|{cls}" for (lbl, cls) in tooltip_items_summary if lbl and cls)
+                tooltip_title_summary = f"{test_type} {phase} ({date_str})"
 
-    if (plotType) plotType.addEventListener("change", () => {
-      syncVariableDropdowns();   // IMPORTANT: re-lock X when switching to line
-      syncControlVisibility();
-      renderPlot();
-    });
+                tooltip_title_advanced = f"{test_type} {phase} details ({date_str})"
+                items_str_advanced = build_advanced_phase_tooltip_items_str(adv_items)
 
-    ["viz-date-start","viz-date-end","viz-x","viz-y","viz-var","viz-group"].forEach(id=>{
-      const el = $(id);
-      if (el) el.addEventListener("change", () => renderPlot());
-    });
+                summary_disp = arrow_for_class(overall_cls)
+                advanced_cell_html = build_advanced_phase_cell_html_words_only(adv_items)
 
-    const renderBtn = $("viz-render");
-    if (renderBtn) renderBtn.addEventListener("click", () => renderPlot());
+                row_tds.append(
+                    f'<td class="metric-cell phase-cell" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title-summary="{html_escape(tooltip_title_summary)}" '
+                    f'data-tooltip-items-summary="{html_escape(items_str_summary)}" '
+                    f'data-tooltip-title-advanced="{html_escape(tooltip_title_advanced)}" '
+                    f'data-tooltip-items-advanced="{html_escape(items_str_advanced)}">'
+                    f'  <div class="view-summary" style="font-weight:900;font-size:16px;line-height:1;">{html_escape(summary_disp)}</div>'
+                    f'  <div class="view-advanced" style="display:none;">{advanced_cell_html}</div>'
+                    f'</td>'
+                )
+                continue
 
-    const resetBtn = $("viz-reset");
-    if (resetBtn) resetBtn.addEventListener("click", () => {
-      if (testSel) testSel.value = "ALL";
-      if (plotType) plotType.value = "scatter";
-      if (dateStart) dateStart.value = dmin;
-      if (dateEnd) dateEnd.value = dmax;
-      if (groupSel) groupSel.value = "Test";
-      syncVariableDropdowns();
-      syncControlVisibility();
-      renderPlot();
-    });
+            row_tds.append(f"<td class='cell-tight'>{html_escape(val_str)}</td>")
 
-    renderPlot();
-  }
+        html_rows.append("<tr>" + "".join(row_tds) + "</tr>")
 
-  function renderPlot(){
-    if (typeof Plotly === "undefined") {
-      const msg = $("viz-msg");
-      if (msg) msg.textContent = "Plotly failed to load (check internet access).";
-      return;
-    }
-    const msg = $("viz-msg");
-    if (msg) msg.textContent = "";
+    html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Team CMJ / SLJ Overview</title>
+<link rel="stylesheet" href="{static_href('team_css')}">
+</head>
+<body>
 
-    const recs = filteredRecords();
-    const plotType = $("viz-plot-type") ? $("viz-plot-type").value : "scatter";
-    const plotDiv = $("viz-plot");
-    if (!plotDiv) return;
+<div class="topbar">
+  <div>
+    <h1>CMJ & SLJ Team Overview</h1>
+    <p style="margin:0; color: var(--text-200);">
+      Hover over Absorption and Generation cells to see classifications.
+      Click a player's name to view their history.
+      Use the view toggle to switch between summary and advanced views.
+    </p>
+  </div>
 
-    if (!recs.length) {
-      Plotly.newPlot(plotDiv, [], { title: "No data in selected range." }, {responsive:true, displaylogo:false});
-      return;
-    }
+  <div class="view-toggle" title="Switch between Summary and Advanced views">
+    <span class="label">View:</span>
+    <button id="btn-view-summary" type="button">Summary</button>
+    <button id="btn-view-advanced" type="button">Advanced</button>
+  </div>
+</div>
 
-    const commonLayout = {
-      paper_bgcolor: "rgba(0,0,0,0)",
-      plot_bgcolor: "rgba(255,255,255,0.06)",
-      font: { color: "#FFFFFF" },
-      legend: { orientation: "h" },
-      margin: { t: 60, l: 60, r: 30, b: 60 }
-    };
+<div class="table-wrap">
+  <table class="sortable-table">
+      {colgroup}
+      <thead><tr>{header_cells}</tr></thead>
+      <tbody>{"".join(html_rows)}</tbody>
+  </table>
+</div>
 
-    if (plotType === "scatter" || plotType === "line") {
-      // FORCE Date for line (time series)
-      const xKey = (plotType === "line") ? "Date" : ($("viz-x") ? $("viz-x").value : "Date");
-      const yKey = $("viz-y") ? $("viz-y").value : "";
-      const mode = (plotType === "line") ? "lines+markers" : "markers";
+<script src="{static_href('app_js')}"></script>
+</body>
+</html>
+"""
+    write_text_atomic(out_path, html)
+    print("Saved team overview HTML to:", out_path)
+    return finish_output([out_path])
 
-      const tests = uniq(recs.map(r => r.Test).filter(Boolean));
-      const traces = tests.map(t => {
-        const sub = recs.filter(r => r.Test === t);
-        const xs = [];
-        const ys = [];
-        const cd = []; // [TestLabel, Date]
-        sub.forEach(r => {
-          const xv = (xKey === "Date") ? r.Date : (typeof r[xKey] === "number" ? r[xKey] : null);
-          const yv = (typeof r[yKey] === "number" ? r[yKey] : null);
-          if (xv == null || yv == null) return;
-          xs.push(xv);
-          ys.push(yv);
-          cd.push([testLabel(r.Test), r.Date]);
-        });
+# ============================================================
+# PLAYER HISTORY HTML
+#   A history section is built as plain data first:
+#     {"title", "test", "cols": [{"key", "label", "width", "kind"}],
+#      "rows": [[cell per column], ...]}  (rows None -> no data)
+#   with cells
+#     date  -> "YYYY-MM-DD"
+#     phase -> [code, phase, tooltip items summary, tooltip items advanced,
+#               [[code, "Label: word"], ...]]
+#     value -> [code, summary text, advanced text, tooltip title]
+#   (code = display class code, see COLORS_BY_CODE / ARROWS_BY_CODE).
+#   Embedded pages render it below; lazy pages ship it as JSON and
+#   HISTORY_TABLE_JS renders the same markup in the browser.
+# ============================================================
+def render_history_section(section):
+    title = section["title"]
+    if section["rows"] is None:
+        return f"<h2>{html_escape(title)}</h2><p>No data available.</p>"
+
+    test_type = section["test"]
+    cols = section["cols"]
+    colgroup = "<colgroup>" + "".join(f"<col style='width:{c['width']}px'>" for c in cols) + "</colgroup>"
+    header_cells = [f'<th data-col="{html_escape(c["key"])}">{html_escape(c["label"])}</th>' for c in cols]
+
+    body_rows = []
+    for row in section["rows"]:
+        date_str = row[0]
+        tds = []
+        for c, cell in zip(cols, row):
+            if c["kind"] == "date":
+                tds.append(f"<td class='cell-tight'>{html_escape(cell)}</td>")
+                continue
 
-        const c = colorForTest(t);
+            bg, fg = COLORS_BY_CODE[cell[0]]
+            if c["kind"] == "phase":
+                code, phase, items_str_summary, items_str_advanced, adv_lines = cell
+                tds.append(
+                    f'<td class="metric-cell phase-cell" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title-summary="{html_escape(f"{test_type} {phase} ({date_str})")}" '
+                    f'data-tooltip-items-summary="{html_escape(items_str_summary)}" '
+                    f'data-tooltip-title-advanced="{html_escape(f"{test_type} {phase} details ({date_str})")}" '
+                    f'data-tooltip-items-advanced="{html_escape(items_str_advanced)}">'
+                    f'  <div class="view-summary" style="font-weight:900;font-size:16px;line-height:1;">{html_escape(ARROWS_BY_CODE[code])}</div>'
+                    f'  <div class="view-advanced" style="display:none;">{adv_lines_html(adv_lines)}</div>'
+                    f'</td>'
+                )
+            else:
+                _, v_summary, v_adv, tt_title = cell
+                tds.append(
+                    f'<td class="metric-cell cell-tight" style="background-color:{bg};color:{fg};" '
+                    f'data-tooltip-title="{html_escape(tt_title)}" data-tooltip-items="">'
+                    f'  <span class="view-summary">{html_escape(v_summary)}</span>'
+                    f'  <span class="view-advanced" style="display:none;">{html_escape(v_adv)}</span>'
+                    f'</td>'
+                )
 
-        if (xKey === "Date") {
-          const zipped = xs.map((x,i)=>({x, y:ys[i], cd:cd[i]})).sort((a,b)=> a.x.localeCompare(b.x));
-          return {
-            type: "scatter",
-            mode: mode,
-            name: testLabel(t),
-            x: zipped.map(z=>z.x),
-            y: zipped.map(z=>z.y),
-            customdata: zipped.map(z=>z.cd),
-            marker: { color: c, size: 8 },
-            line: { color: c, width: 2 },
-            hovertemplate:
-              "Test: %{customdata[0]}<br>" +
-              "Date: %{customdata[1]}<br>" +
-              (xKey === "Date" ? "" : ("X: %{x:.1f}<br>")) +
-              "Y: %{y:.1f}<extra></extra>"
-          };
-        }
+        body_rows.append("<tr>" + "".join(tds) + "</tr>")
 
-        return {
-          type: "scatter",
-          mode: mode,
-          name: testLabel(t),
-          x: xs,
-          y: ys,
-          customdata: cd,
-          marker: { color: c, size: 8 },
-          line: { color: c, width: 2 },
-          hovertemplate:
-            "Test: %{customdata[0]}<br>" +
-            "Date: %{customdata[1]}<br>" +
-            "X: %{x:.1f}<br>" +
-            "Y: %{y:.1f}<extra></extra>"
-        };
-      });
+    return f"""
+<h2>{html_escape(title)}</h2>
+<div class="table-wrap">
+<table class="sortable-table paginated-table" data-test="{html_escape(test_type)}">
+    {colgroup}
+    <thead><tr>{"".join(header_cells)}</tr></thead>
+    <tbody>{"".join(body_rows)}</tbody>
+</table>
+</div>
+"""
 
-      const layout = Object.assign({}, commonLayout, {
-        title: (plotType === "line" ? "Line" : "Scatter") + `: ${yKey} vs ${xKey === "Date" ? "Date" : xKey}`,
-        xaxis: { title: (xKey === "Date" ? "Date" : xKey) },
-        yaxis: { title: yKey }
-      });
+def build_player_history_html(player, out_path):
+    sections = []
 
-      Plotly.newPlot(plotDiv, traces, layout, {responsive:true, displaylogo:false});
-      return;
-    }
+    def ensure_class_column(sub, value_col, class_col):
+        if class_col in sub.columns or value_col not in sub.columns:
+            return sub
+        sub[class_col] = "Avg"
+        return sub
 
-    if (plotType === "box") {
-      const vKey = $("viz-var") ? $("viz-var").value : "";
-      const groupKey = $("viz-group") ? $("viz-group").value : "Test";
+    def history_section(title, test_type):
+        rows = player_rows(test_type, player)
+        if rows.empty:
+            return {"title": title, "test": test_type, "cols": None, "rows": None}
 
-      let groups = ["All"];
-      if (groupKey === "Test") {
-        groups = uniq(recs.map(r => r.Test)).filter(Boolean);
-      }
+        sub = rows.sort_values(DATE_COL, ascending=False)
 
-      const traces = [];
+        for col in ["Generation_Class", "Absorption_Class"]:
+            if col not in sub.columns:
+                for cand in [col + "_GEN", col + "_ABS", col + "_x", col + "_y", col + "_L", col + "_R"]:
+                    if cand in sub.columns:
+                        sub[col] = sub[cand]
+                        break
 
-      groups.forEach(g => {
-        const sub = (groupKey === "Test") ? recs.filter(r => r.Test === g) : recs;
-        const ys = sub.map(r => r[vKey]).filter(v => typeof v === "number" && !isNaN(v));
-        const c = (groupKey === "Test") ? colorForTest(g) : colorForTest("CMJ");
+        if test_type == "CMJ":
+            param_specs = [
+                {"value_col": "BW [KG]", "class_col": "BW [KG]_class", "label": "Body Weight [kg]"},
+                {"value_col": "Jump Height (Imp-Mom) [cm]", "class_col": "Jump Height (Imp-Mom) [cm]_class", "label": "Jump Height [cm]"},
+                {"value_col": "Braking Phase Duration [ms]", "class_col": "Braking Phase Duration [ms]_class", "label": "Braking Duration [ms]"},
+                {"value_col": "Countermovement Depth [cm]", "class_col": "Countermovement Depth [cm]_class", "label": "Squat Depth [cm]"},
+                {"value_col": "Eccentric Mean Force / BM [N/kg]", "class_col": "Eccentric Mean Force / BM [N/kg]_class", "label": "Braking Force [N/kg]"},
+                {"value_col": "Concentric Duration [ms]", "class_col": "Concentric Duration [ms]_class", "label": "Propulsive Duration [ms]"},
+                {"value_col": "Concentric Mean Force / BM [N/kg]", "class_col": "Concentric Mean Force / BM [N/kg]_class", "label": "Propulsive Force [N/kg]"},
+            ]
+        elif test_type == "SLJ_L":
+            param_specs = [
+                {"value_col": "BW [KG]", "class_col": "BW [KG]_class", "label": "Body Weight [kg]"},
+                {"value_col": "Jump Height (Imp-Mom) [cm] (L)", "class_col": "Jump Height (Imp-Mom) [cm] (L)_class", "label": "Jump Height [cm]"},
+                {"value_col": "Braking Phase Duration [ms] (L)", "class_col": "Braking Phase Duration [ms] (L)_class", "label": "Braking Duration [ms]"},
+                {"value_col": "Countermovement Depth [cm] (L)", "class_col": "Countermovement Depth [cm] (L)_class", "label": "Squat Depth [cm]"},
+                {"value_col": "Eccentric Mean Force / BM [N/kg] (L)", "class_col": "Eccentric Mean Force / BM [N/kg] (L)_class", "label": "Braking Force [N/kg]"},
+                {"value_col": "Concentric Duration [ms] (L)", "class_col": "Concentric Duration [ms] (L)_class", "label": "Propulsive Duration [ms]"},
+                {"value_col": "Concentric Mean Force / BM [N/kg] (L)", "class_col": "Concentric Mean Force / BM [N/kg] (L)_class", "label": "Propulsive Force [N/kg]"},
+            ]
+        else:
+            param_specs = [
+                {"value_col": "BW [KG]", "class_col": "BW [KG]_class", "label": "Body Weight [kg]"},
+                {"value_col": "Jump Height (Imp-Mom) [cm] (R)", "class_col": "Jump Height (Imp-Mom) [cm] (R)_class", "label": "Jump Height [cm]"},
+                {"value_col": "Braking Phase Duration [ms] (R)", "class_col": "Braking Phase Duration [ms] (R)_class", "label": "Braking Duration [ms]"},
+                {"value_col": "Countermovement Depth [cm] (R)", "class_col": "Countermovement Depth [cm] (R)_class", "label": "Squat Depth [cm]"},
+                {"value_col": "Eccentric Mean Force / BM [N/kg] (R)", "class_col": "Eccentric Mean Force / BM [N/kg] (R)_class", "label": "Braking Force [N/kg]"},
+                {"value_col": "Concentric Duration [ms] (R)", "class_col": "Concentric Duration [ms] (R)_class", "label": "Propulsive Duration [ms]"},
+                {"value_col": "Concentric Mean Force / BM [N/kg] (R)", "class_col": "Concentric Mean Force / BM [N/kg] (R)_class", "label": "Propulsive Force [N/kg]"},
+            ]
 
-        // Remove Plotly default hover content (removes fences & duplicates)
-        traces.push({
-          type: "box",
-          name: (groupKey === "Test") ? testLabel(g) : "All",
-          y: ys,
-          boxpoints: "outliers",
-          marker: { color: c },
-          line: { color: c },
-          hoverinfo: "skip"
-        });
+        for spec in param_specs:
+            sub = ensure_class_column(sub, spec["value_col"], spec["class_col"])
 
-        // Add custom hover anchor with ONLY Min/Q1/Median/Q3/Max
-        const sorted = ys.slice().sort((a,b)=>a-b);
-        const vmin = sorted.length ? sorted[0] : null;
-        const vmax = sorted.length ? sorted[sorted.length - 1] : null;
-        const q1 = quantileSorted(sorted, 0.25);
-        const med = quantileSorted(sorted, 0.50);
-        const q3 = quantileSorted(sorted, 0.75);
+        gen_col = "Generation_Class"
+        abs_col = "Absorption_Class"
+        value_col_map = {spec["value_col"]: spec for spec in param_specs}
 
-        if (med !== null) {
-          traces.push({
-            type: "scatter",
-            mode: "markers",
-            name: (groupKey === "Test") ? testLabel(g) : "All",
-            showlegend: false,
-            x: [(groupKey === "Test") ? testLabel(g) : "All"],
-            y: [med],
-            marker: { opacity: 0, size: 16, color: c },
-            customdata: [[vmin, q1, med, q3, vmax]],
-            hovertemplate:
-              "Min: %{customdata[0]:.1f}<br>" +
-              "Q1: %{customdata[1]:.1f}<br>" +
-              "Median: %{customdata[2]:.1f}<br>" +
-              "Q3: %{customdata[3]:.1f}<br>" +
-              "Max: %{customdata[4]:.1f}<extra></extra>"
-          });
-        }
-      });
+        cols = [
+            {"key": DATE_COL, "label": "Date", "width": 110, "kind": "date"},
+            {"key": abs_col, "label": "Absorption Overall", "width": 170, "kind": "phase"},
+            {"key": gen_col, "label": "Generation Overall", "width": 170, "kind": "phase"},
+        ] + [{"key": spec["value_col"], "label": spec["label"], "width": 150, "kind": "value"} for spec in param_specs]
+
+        # cells are built a column at a time from preformatted text
+        # (jump_pipeline/cell_format.py), then zipped into rows
+        def column(name):
+            return sub[name] if name in sub.columns else pd.Series(None, index=sub.index, dtype=object)
+
+        class_labels = np.array(CLASS_LABELS[:3], dtype=object)
+        columns = [format_column(column(DATE_COL), "date").tolist()]
+        for c in cols[1:]:
+            c = c["key"]
+
+            if c in [gen_col, abs_col]:
+                phase = "Generation" if c == gen_col else "Absorption"
+                summary, advanced, lines = [], [], []
+                for lbl, colname in phase_component_columns(test_type, phase):
+                    comp_codes = display_codes(column(f"{colname}_class"))
+                    comp_cls = class_labels[comp_codes]
+                    detail = value_unit_z_texts(colname, column(colname), z_scores(test_type, player, colname, sub))
+                    words = np.array([f"{pretty_lbl(lbl)}: {label_to_word(lbl, cls)}" for cls in class_labels], dtype=object)
+
+                    summary.append((f"{lbl}|" + comp_cls).tolist())
+                    advanced.append((f"{lbl}: " + np.where(detail == "", "N/A", detail) + "|" + comp_cls).tolist())
+                    lines.append(list(zip(comp_codes.tolist(), words[comp_codes].tolist())))
+
+                columns.append([
+                    [code, phase, ";".join(items_summary), ";".join(items_advanced), [list(line) for line in adv_lines]]
+                    for code, items_summary, items_advanced, adv_lines in zip(
+                        display_codes(column(c)).tolist(), zip(*summary), zip(*advanced), zip(*lines),
+                    )
+                ])
+                continue
 
-      const layout = Object.assign({}, commonLayout, {
-        title: (groupKey === "Test") ? `Box Plot: ${vKey} (grouped by Test)` : `Box Plot: ${vKey}`,
-        yaxis: { title: vKey }
-      });
+            spec = value_col_map[c]
+            v_summary = format_column(column(c), value_spec(c))
+            z_str = format_column(z_scores(test_type, player, c, sub), "2dp")
+            v_adv = np.where((z_str == "") | (v_summary == ""), v_summary, v_summary + " (Z: " + z_str + ")")
+            avg_str = format_column(column(f"{c}_avg_prev"), value_spec(c))
+            tt_title = np.where(avg_str == "", f"{spec['label']} mean: N/A (first test)", f"{spec['label']} mean: " + avg_str)
+            columns.append([
+                list(cell)
+                for cell in zip(display_codes(column(spec["class_col"])).tolist(), v_summary.tolist(), v_adv.tolist(), tt_title.tolist())
+            ])
 
-      Plotly.newPlot(plotDiv, traces, layout, {responsive:true, displaylogo:false});
-      return;
-    }
-  }
+        rows_out = [list(row) for row in zip(*columns)]
 
-  document.addEventListener("DOMContentLoaded", function(){
-    const btnH = $("tabbtn-history");
-    const btnV = $("tabbtn-viz");
-    if (btnH) btnH.addEventListener("click", () => setTab("history"));
-    if (btnV) btnV.addEventListener("click", () => setTab("viz"));
+        return {"title": title, "test": test_type, "cols": cols, "rows": rows_out}
 
-    let initial = "history";
-    try {
-      const saved = localStorage.getItem("playerTab");
-      if (saved === "viz" || saved === "history") initial = saved;
-    } catch(e) {}
-    setTab(initial);
-  });
-})();
-"""
+    sections.append(history_section("CMJ", "CMJ"))
+    sections.append(history_section("SLJ - Left", "SLJ_L"))
+    sections.append(history_section("SLJ - Right", "SLJ_R"))
+
+    # ============================================================
+    # Visualize It dataset (canonical vars to prevent duplicates)
+    #   column-wise: {"Test": [...], "Date": [...], <var>: [...]},
+    #   one entry per dated test, null for missing / non-finite values
+    # ============================================================
+    def canonical_columns_for_player(test_type):
+        sub = player_rows(test_type, player)
+        if sub.empty:
+            return None
+        sub = sub[sub[DATE_COL].notna()]
+
+        if test_type == "CMJ":
+            col_map = {
+                "Body Weight [kg]": "BW [KG]",
+                "Jump Height [cm]": "Jump Height (Imp-Mom) [cm]",
+                "Braking Duration [ms]": "Braking Phase Duration [ms]",
+                "Squat Depth [cm]": "Countermovement Depth [cm]",
+                "Braking Force [N/kg]": "Eccentric Mean Force / BM [N/kg]",
+                "Propulsive Duration [ms]": "Concentric Duration [ms]",
+                "Propulsive Force [N/kg]": "Concentric Mean Force / BM [N/kg]",
+            }
+        elif test_type == "SLJ_L":
+            col_map = {
+                "Body Weight [kg]": "BW [KG]",
+                "Jump Height [cm]": "Jump Height (Imp-Mom) [cm] (L)",
+                "Braking Duration [ms]": "Braking Phase Duration [ms] (L)",
+                "Squat Depth [cm]": "Countermovement Depth [cm] (L)",
+                "Braking Force [N/kg]": "Eccentric Mean Force / BM [N/kg] (L)",
+                "Propulsive Duration [ms]": "Concentric Duration [ms] (L)",
+                "Propulsive Force [N/kg]": "Concentric Mean Force / BM [N/kg] (L)",
+            }
+        else:
+            col_map = {
+                "Body Weight [kg]": "BW [KG]",
+                "Jump Height [cm]": "Jump Height (Imp-Mom) [cm] (R)",
+                "Braking Duration [ms]": "Braking Phase Duration [ms] (R)",
+                "Squat Depth [cm]": "Countermovement Depth [cm] (R)",
+                "Braking Force [N/kg]": "Eccentric Mean Force / BM [N/kg] (R)",
+                "Propulsive Duration [ms]": "Concentric Duration [ms] (R)",
+                "Propulsive Force [N/kg]": "Concentric Mean Force / BM [N/kg] (R)",
+            }
+
+        cols = {"Test": [test_type] * len(sub), "Date": sub[DATE_COL].dt.strftime("%Y-%m-%d").tolist()}
+        for canon, src in col_map.items():
+            if src in sub.columns:
+                # non-finite values (inf from a 0 body weight) as null: JSON has no Infinity / NaN
+                v = pd.to_numeric(sub[src], errors="coerce").astype(float)
+                cols[canon] = v.astype(object).where(np.isfinite(v), None).tolist()
+            else:
+                cols[canon] = [None] * len(sub)
+        return cols
+
+    player_columns = {}
+    for test_type in ["CMJ", "SLJ_L", "SLJ_R"]:
+        cols = canonical_columns_for_player(test_type)
+        for key, values in (cols or {}).items():
+            player_columns.setdefault(key, []).extend(values)
+
+    PLAYER_DATA_JS = json.dumps(player_columns, separators=(",", ":"), allow_nan=False)
+
+    written = [out_path]
+    if PLAYER_PAGE_MODE == "lazy":
+        history_file = player_data_file(player, "history")
+        viz_file = player_data_file(player, "viz")
+        os.makedirs(PLAYER_DATA_DIR, exist_ok=True)
+        written += [os.path.join(PLAYER_DATA_DIR, history_file), os.path.join(PLAYER_DATA_DIR, viz_file)]
+        write_text_atomic(
+            written[1],
+            json.dumps(
+                {"colors": COLORS_BY_CODE, "arrows": ARROWS_BY_CODE, "sections": sections},
+                separators=(",", ":"), allow_nan=False,
+            ),
+        )
+        write_text_atomic(written[2], PLAYER_DATA_JS)
 
-    VISUALIZE_IT_JS = VISUALIZE_IT_JS.replace("__PLAYER_DATA__", PLAYER_DATA_JS)
+        history_attrs = f' data-src="{PLAYER_DATA_REL}/{history_file}"'
+        history_html = '<p style="color: var(--text-200);">Loading jump history...</p>'
+        data_script = (
+            f'<script src="{static_href("history_js")}"></script>\n'
+            f"<script>\nwindow.PLAYER_DATA_URL = {json.dumps(f'{PLAYER_DATA_REL}/{viz_file}')};\n</script>"
+        )
+    else:
+        history_attrs = ""
+        history_html = "".join(render_history_section(sec) for sec in sections)
+        data_script = f"<script>\nwindow.PLAYER_DATA = {PLAYER_DATA_JS};\n</script>"
 
     player_img = player_headshot_rel(player)
 
@@ -2027,228 +2827,7 @@ def build_player_history_html(player, out_path):
 <meta charset="utf-8">
 <title>{html_escape(player)} - Jump History</title>
 
-<!-- Plotly (for Visualize It) -->
-<script src="https://cdn.plot.ly/plotly-2.30.0.min.js"></script>
-
-<style>
-:root {{
-    --primary-200:#CE0E2D;
-    --text-100:#FFFFFF;
-    --text-200:#e0e0e0;
-    --bg-100:#0A2240;
-    --bg-300:#3A8DDE;
-}}
-body {{
-    font-family: Arial, sans-serif;
-    margin: 20px;
-    background: var(--bg-100);
-    color: var(--text-100);
-}}
-.page-header {{
-    display: flex;
-    justify-content: space-between;
-    align-items: flex-start;
-    gap: 16px;
-}}
-.back-link {{
-    display: inline-block;
-    margin-top: 8px;
-    color: var(--primary-200);
-    text-decoration: none;
-    font-weight: 600;
-}}
-.back-link:hover {{ text-decoration: underline; }}
-.player-identity {{ display: flex; align-items: center; gap: 10px; }}
-.player-identity img {{
-    width: 48px;
-    height: 48px;
-    border-radius: 50%;
-    object-fit: cover;
-    border: 1px solid rgba(255,255,255,0.35);
-    background: rgba(255,255,255,0.08);
-}}
-.player-identity-name {{
-    font-weight: 700;
-    font-size: 16px;
-    white-space: nowrap;
-}}
-.topbar {{
-    display: flex;
-    align-items: flex-start;
-    justify-content: space-between;
-    gap: 12px;
-    margin: 10px 0 12px 0;
-}}
-.view-toggle {{
-    display: inline-flex;
-    align-items: center;
-    gap: 6px;
-    padding: 6px 8px;
-    border: 1px solid rgba(255,255,255,0.18);
-    border-radius: 10px;
-    background: rgba(255,255,255,0.08);
-}}
-.view-toggle .label {{
-    font-size: 11px;
-    color: var(--text-200);
-    margin-right: 4px;
-}}
-.view-toggle button {{
-    font-size: 11px;
-    padding: 4px 8px;
-    border-radius: 8px;
-    border: 1px solid rgba(255,255,255,0.18);
-    background: rgba(255,255,255,0.10);
-    color: var(--text-100);
-    cursor: pointer;
-}}
-.view-toggle button.active {{
-    background: var(--primary-200);
-    border-color: rgba(0,0,0,0.0);
-}}
-.table-pagination-controls {{
-    display: flex;
-    align-items: center;
-    gap: 8px;
-    margin-bottom: 6px;
-    font-size: 12px;
-    color: var(--text-200);
-}}
-.table-wrap {{
-    width: 100%;
-    overflow-x: auto;
-    border-radius: 10px;
-}}
-table {{
-    border-collapse: collapse;
-    width: 100%;
-    table-layout: fixed;
-    font-size: 12px;
-    margin-bottom: 20px;
-    background: rgba(255,255,255,0.06);
-}}
-th, td {{
-    border: 1px solid rgba(255,255,255,0.18);
-    padding: 4px 6px;
-    text-align: center;
-    overflow: hidden;
-    text-overflow: ellipsis;
-}}
-.cell-tight {{ white-space: nowrap; }}
-th {{
-    background-color: var(--bg-300);
-    color: var(--text-100);
-}}
-tbody tr:nth-child(even) {{ background-color: rgba(255,255,255,0.06); }}
-tbody tr:nth-child(odd)  {{ background-color: rgba(255,255,255,0.03); }}
-.view-advanced {{
-    font-weight: 400;
-    font-size: 11px;
-    line-height: 1.2;
-    text-align: left;
-    white-space: normal;
-}}
-.view-advanced .adv-line {{
-    margin: 2px 0;
-    font-weight: 400;
-}}
-.phase-cell {{ padding: 6px 6px; }}
-
-/* Tabs */
-.tabs {{
-    display: inline-flex;
-    gap: 6px;
-    padding: 6px;
-    border-radius: 12px;
-    border: 1px solid rgba(255,255,255,0.18);
-    background: rgba(255,255,255,0.08);
-}}
-.tabs button {{
-    font-size: 12px;
-    padding: 6px 10px;
-    border-radius: 10px;
-    border: 1px solid rgba(255,255,255,0.18);
-    background: rgba(255,255,255,0.10);
-    color: var(--text-100);
-    cursor: pointer;
-}}
-.tabs button.active {{
-    background: var(--primary-200);
-    border-color: rgba(0,0,0,0.0);
-}}
-
-.viz-panel {{
-    margin-top: 14px;
-    padding: 12px;
-    border-radius: 12px;
-    border: 1px solid rgba(255,255,255,0.18);
-    background: rgba(255,255,255,0.06);
-}}
-.viz-controls {{
-    display: grid;
-    grid-template-columns: 1fr 1fr 1fr;
-    gap: 10px;
-    margin-bottom: 10px;
-}}
-.viz-row {{
-    display: grid;
-    grid-template-columns: 1fr 1fr 1fr;
-    gap: 10px;
-    margin-bottom: 10px;
-}}
-.viz-controls label, .viz-row label {{
-    display: block;
-    font-size: 12px;
-    color: var(--text-200);
-    margin-bottom: 4px;
-}}
-.viz-controls select, .viz-controls input, .viz-row select {{
-    width: 100%;
-    padding: 8px 10px;
-    border-radius: 10px;
-    border: 1px solid rgba(255,255,255,0.18);
-    background: rgba(10,34,64,0.35);
-    color: var(--text-100);
-    outline: none;
-}}
-.viz-controls select:disabled, .viz-row select:disabled {{
-    opacity: 0.55;
-    cursor: not-allowed;
-}}
-.viz-actions {{
-    display: inline-flex;
-    gap: 8px;
-    align-items: center;
-    margin-bottom: 8px;
-}}
-.viz-actions button {{
-    font-size: 12px;
-    padding: 8px 12px;
-    border-radius: 10px;
-    border: 1px solid rgba(255,255,255,0.18);
-    background: rgba(255,255,255,0.10);
-    color: var(--text-100);
-    cursor: pointer;
-}}
-.viz-actions button.primary {{
-    background: var(--primary-200);
-    border-color: rgba(0,0,0,0.0);
-}}
-#viz-msg {{
-    color: #ffb3b3;
-    font-size: 12px;
-}}
-#viz-plot {{
-    width: 100%;
-    height: 520px;
-    border-radius: 12px;
-}}
-@media (max-width: 980px) {{
-  .viz-controls, .viz-row {{
-    grid-template-columns: 1fr;
-  }}
-}}
-</style>
+<link rel="stylesheet" href="{static_href('player_css')}">
 </head>
 <body>
 
@@ -2283,8 +2862,8 @@ tbody tr:nth-child(odd)  {{ background-color: rgba(255,255,255,0.03); }}
   </div>
 </div>
 
-<div id="tab-history">
-  {"".join(sections)}
+<div id="tab-history"{history_attrs}>
+  {history_html}
 </div>
 
 <div id="tab-viz" style="display:none;">
@@ -2363,32 +2942,113 @@ tbody tr:nth-child(odd)  {{ background-color: rgba(255,255,255,0.03); }}
       <span id="viz-msg"></span>
     </div>
 
-    <div id="viz-plot"></div>
+    <div id="viz-plot" data-chart-src="{static_href('chart_js')}"></div>
   </div>
 </div>
 
-<script>
-{JS_SORT_AND_TOOLTIP}
-</script>
+<script src="{static_href('app_js')}"></script>
 
-<script>
-{VISUALIZE_IT_JS}
-</script>
+{data_script}
+<script src="{static_href('visualize_js')}"></script>
 </body>
 </html>
 """
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(full_html)
-    print("Saved player page:", out_path)
+    write_text_atomic(out_path, full_html)
+    return written
+
+# ============================================================
+# PLAYER PAGES (serial or process pool)
+#   Results come back in roster order whatever the worker count,
+#   and one failing page is reported without stopping the rest.
+# ============================================================
+def build_player_page(player):
+    out_path = os.path.join(ROOT_OVERVW, safe_player_filename(player))
+    try:
+        report = finish_output(build_player_history_html(player, out_path))
+    except Exception as e:
+        return player, out_path, f"{type(e).__name__}: {e}", []
+    return player, out_path, None, report
+
+def build_player_pages(players, workers=PAGE_WORKERS):
+    players = list(players)
+    results = map_in_pool(build_player_page, players, 1 if len(players) < 2 else workers)
+
+    failed, report = [], []
+    for player, out_path, error, rows in results:
+        if error is None:
+            print("Saved player page:", out_path)
+            report += rows
+        else:
+            print(f"FAILED player page for {player}: {error}")
+            failed.append(player)
+    return failed, report
+
+# ============================================================
+# PAGE FINGERPRINTS (incremental builds)
+#   template version = this script's and jump_pipeline's contents
+#   (cell text, classes and bands come from there); a player page (and,
+#   in lazy mode, its data files) also depends on the page mode and
+#   its player's daily rows, the index on the team overview and
+#   every player's rows (team tooltips / means)
+# ============================================================
+SITE_TEMPLATE_VERSION = template_version(__file__)
+
+def index_fingerprint():
+    return page_fingerprint(
+        SITE_TEMPLATE_VERSION, frame_digest(team_df),
+        *(frame_digest(df) for df in [cmj_daily, sljL_daily, sljR_daily]),
+    )
+
+def player_fingerprint(player):
+    return page_fingerprint(
+        SITE_TEMPLATE_VERSION, PLAYER_PAGE_MODE, player,
+        *(frame_digest(player_rows(t, player)) for t in ["CMJ", "SLJ_L", "SLJ_R"]),
+    )
+
+def player_page_is_current(pages, player, fingerprint):
+    if not page_is_current(pages, os.path.join(ROOT_OVERVW, safe_player_filename(player)), fingerprint):
+        return False
+    if PLAYER_PAGE_MODE != "lazy":
+        return True
+    return all(os.path.exists(os.path.join(PLAYER_DATA_DIR, player_data_file(player, kind))) for kind in ["history", "viz"])
 
 # ============================================================
 # MAIN
 # ============================================================
 if __name__ == "__main__":
-    index_path = os.path.join(ROOT_OVERVW, "index.html")
-    build_team_overview_html(team_df, index_path)
+    old_pages = {} if REBUILD_ALL_PAGES else load_manifest(SITE_MANIFEST_FILE)
+    pages = {}
 
-    players = team_df[PLAYER_COL].dropna().unique()
-    for p in players:
-        out_path = os.path.join(ROOT_OVERVW, safe_player_filename(p))
-        build_player_history_html(p, out_path)
+    report = write_static_assets()
+
+    index_path = os.path.join(ROOT_OVERVW, "index.html")
+    key = index_fingerprint()
+    if page_is_current(old_pages, index_path, key):
+        print("Unchanged team overview HTML:", index_path)
+    else:
+        report += build_team_overview_html(team_df, index_path)
+    pages[os.path.basename(index_path)] = key
+
+    stale = []
+    for p in team_df[PLAYER_COL].dropna().unique():
+        name = safe_player_filename(p)
+        pages[name] = player_fingerprint(p)
+        if not player_page_is_current(old_pages, p, pages[name]):
+            stale.append(p)
+    print(f"Player pages: {len(stale)} to build, {len(pages) - 1 - len(stale)} unchanged.")
+
+    run_file = share_pipeline_run() if PAGE_WORKERS != 1 and len(stale) > 1 else None
+    try:
+        failed, player_report = build_player_pages(stale)
+    finally:
+        if run_file is not None:
+            os.remove(run_file)
+    for p in failed:
+        pages.pop(safe_player_filename(p))  # retried on the next build
+    save_manifest(SITE_MANIFEST_FILE, pages)
+    if not failed:
+        prune_static_assets()
+    print_size_report(report + player_report)
+
+    if failed:
+        raise SystemExit(f"{len(failed)} player page(s) failed: {', '.join(map(str, failed))}")
@@ -0,0 +1,4 @@
+# -------------------------------------------------------------
+# Shared building blocks for the CMJ / SLJ classification scripts
+# and the Jump History Sharing site builder.
+# -------------------------------------------------------------
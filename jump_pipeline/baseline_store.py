@@ -0,0 +1,129 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from jump_pipeline.rolling_stats import STATE_FIELDS
+from jump_pipeline.test_specs import join_leg, split_leg
+
+# -------------------------------------------------------------
+# PERSISTED PER-PLAYER BASELINES
+#   One record per (player, test type, leg, parameter) holding the
+#   running count / mean / M2 of every valid value seen so far, plus
+#   the Kahan bookkeeping the rolling engine carries, so continuing
+#   from the store gives exactly the numbers a full rebuild would.
+#
+#   A per-player watermark of the last processed (Date, Time) and the
+#   number of export rows processed tells the next run which rows are
+#   new, and whether any older ones were missed.
+# -------------------------------------------------------------
+BASELINE_VERSION = 2
+
+KEY_COLS = ["Name", "Test", "Leg", "Parameter"]
+INT_FIELDS = ("count", "neg_count", "run_length")
+
+def new_baseline():
+    return {"version": BASELINE_VERSION, "watermarks": {}, "stats": []}
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        store = json.load(f)
+    if store.get("version") != BASELINE_VERSION:
+        print(f"WARNING: baseline state at {path} has version {store.get('version')!r}; ignoring it.")
+        return None
+    return store
+
+def save_baseline(path, store):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(store, f)
+    os.replace(tmp_path, path)
+
+# -------------------------------------------------------------
+# STATE <-> ROLLING ENGINE
+#   The engine works with dicts of field -> DataFrame
+#   (index = player, columns = parameter columns).
+# -------------------------------------------------------------
+def baseline_state(store, test_type, columns):
+    recs = [r for r in store["stats"] if r["Test"] == test_type]
+    if not recs:
+        return {f: pd.DataFrame(columns=columns, dtype="float64") for f in STATE_FIELDS}
+
+    table = pd.DataFrame(recs)
+    table["Column"] = [join_leg(p, l) for p, l in zip(table["Parameter"], table["Leg"])]
+    return {
+        f: table.pivot(index="Name", columns="Column", values=f).reindex(columns=columns)
+        for f in STATE_FIELDS
+    }
+
+def update_baseline(store, test_type, state, watermarks):
+    count = state["count"]
+    n_players, n_cols = count.shape
+    split = [split_leg(c) for c in count.columns]
+
+    fresh = pd.DataFrame({
+        "Name": np.repeat(count.index.to_numpy(dtype=object), n_cols),
+        "Test": test_type,
+        "Leg": [leg for _, leg in split] * n_players,
+        "Parameter": [param for param, _ in split] * n_players,
+    })
+    for f in STATE_FIELDS:
+        fresh[f] = state[f].reindex(index=count.index, columns=count.columns).to_numpy().ravel()
+
+    old = pd.DataFrame(store["stats"], columns=KEY_COLS + list(STATE_FIELDS))
+    table = pd.concat([old, fresh], ignore_index=True).drop_duplicates(KEY_COLS, keep="last")
+
+    records = []
+    for rec in table.to_dict("records"):
+        for f in STATE_FIELDS:
+            rec[f] = int(rec[f]) if f in INT_FIELDS else float(rec[f])
+        records.append(rec)
+    store["stats"] = records
+
+    store["watermarks"].setdefault(test_type, {}).update(watermarks)
+    return store
+
+# -------------------------------------------------------------
+# WATERMARKS (per player: last processed Date + Time, rows processed)
+#   Date and Time are compared as one parsed timestamp (a missing or
+#   unparseable Time counts as midnight). The row count catches tests
+#   that land at or before the watermark after the run that set it:
+#   back-dated or late-imported tests, or a second test on the
+#   watermark's day with no Time. Those rows were never classified,
+#   so the caller has to rebuild rather than skip them.
+# -------------------------------------------------------------
+def _row_stamps(df, date_col, time_col):
+    stamps = df[date_col].dt.normalize()
+    if time_col in df.columns:
+        stamps = stamps + pd.to_timedelta(df[time_col], errors="coerce").fillna(pd.Timedelta(0))
+    return stamps
+
+def _marks(df, store, test_type, player_col):
+    marks = store["watermarks"].get(test_type, {})
+    stamp = pd.to_datetime(df[player_col].map(lambda n: marks.get(n, [None, 0])[0]))
+    rows = df[player_col].map(lambda n: marks.get(n, [None, 0])[1]).astype("int64")
+    return stamp, rows
+
+def latest_watermarks(df, player_col, date_col, time_col):
+    # every export row of each player, not just the ones this run classified
+    keys = pd.DataFrame({"Name": df[player_col], "Stamp": _row_stamps(df, date_col, time_col)})
+    last = keys.groupby("Name")["Stamp"].agg(["max", "size"])
+    return {
+        name: [stamp.isoformat(), int(rows)]
+        for name, stamp, rows in zip(last.index, last["max"], last["size"])
+    }
+
+def rows_after_watermark(df, store, test_type, player_col, date_col, time_col):
+    mark, _ = _marks(df, store, test_type, player_col)
+    return mark.isna() | (_row_stamps(df, date_col, time_col) > mark)
+
+def unprocessed_rows(df, store, test_type, player_col, date_col, time_col):
+    # player -> rows at or before their watermark beyond the rows already processed
+    mark, rows = _marks(df, store, test_type, player_col)
+    at_or_before = ~rows_after_watermark(df, store, test_type, player_col, date_col, time_col)
+    seen = at_or_before.groupby(df[player_col]).sum()
+    missed = seen - rows.groupby(df[player_col]).first()
+    return missed[missed > 0].astype(int).to_dict()
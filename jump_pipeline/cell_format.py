@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from jump_pipeline.class_codes import AVG, BASE_CODE, CLASS_DTYPE, base_codes
+
+# -------------------------------------------------------------
+# CELL FORMATTING (PDF tables, overview site)
+#   Table cells are turned into display text a column at a time: each
+#   column has a format spec and is formatted in one vectorised pass
+#   instead of a try / float() / to_datetime() per cell.
+#     "date"  -> ISO date (YYYY-MM-DD)
+#     "int"   -> whole number (durations in ms, day counts)
+#     "1dp"   -> one decimal place (every other measure)
+#     "2dp"   -> two decimal places (z scores)
+#     "arrow" -> class column as ↓ / → / ↑ (Very Low / Very High
+#                show as Low / High, like their colours)
+#     "text"  -> as is
+#   Missing, NaN or unparseable values (and missing columns) -> "".
+#   Results are object arrays of str, in row order.
+# -------------------------------------------------------------
+SPECS = ["date", "int", "1dp", "2dp", "arrow", "text"]
+
+# by Low/Avg/High code; the last entry is reached by the blank code -1
+ARROWS = np.array(["↓", "→", "↑", ""], dtype=object)
+
+def value_spec(col):
+    # durations and day counts as whole numbers, every other measure to 1 dp
+    return "int" if "[ms]" in str(col) or col == "TTD" else "1dp"
+
+def as_float(values):
+    arr = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+    if arr.dtype.kind in "fiu":
+        return arr.astype(float, copy=False)
+    return np.asarray(pd.to_numeric(arr, errors="coerce"), dtype=float)
+
+def fixed_text(values, decimals):
+    x = as_float(values)
+    if decimals == 0:
+        x = np.rint(x) + 0.0  # round half to even like round(); no "-0"
+    out = np.full(len(x), "", dtype=object)
+    ok = ~np.isnan(x)
+    out[ok] = np.char.mod(f"%.{decimals}f", x[ok]).astype(object)
+    return out
+
+def date_text(values):
+    dates = pd.to_datetime(pd.Series(values, copy=False), errors="coerce")
+    return dates.dt.strftime("%Y-%m-%d").fillna("").to_numpy(dtype=object)
+
+def display_codes(values):
+    # Low/Avg/High code per value; blank / unknown classes show as Avg
+    if isinstance(values, pd.Series) and values.dtype == CLASS_DTYPE:
+        codes = BASE_CODE[values.array.codes]  # already encoded (encode_class_columns)
+    else:
+        codes = base_codes(values)
+    return np.where(codes < 0, AVG, codes)
+
+def format_column(values, spec):
+    if spec == "date":
+        return date_text(values)
+    if spec == "int":
+        return fixed_text(values, 0)
+    if spec == "1dp":
+        return fixed_text(values, 1)
+    if spec == "2dp":
+        return fixed_text(values, 2)
+    if spec == "arrow":
+        return ARROWS[base_codes(values)]
+    if spec == "text":
+        s = pd.Series(values, copy=False).astype(object)
+        return s.where(s.notna(), "").astype(str).to_numpy(dtype=object)
+    raise ValueError(f"Unknown cell format {spec!r}; expected one of {SPECS}.")
+
+def format_frame(df, specs):
+    # column -> spec  =>  frame of display strings (same index and column order)
+    return pd.DataFrame(
+        {
+            col: format_column(df[col], spec) if col in df.columns else np.full(len(df), "", dtype=object)
+            for col, spec in specs.items()
+        },
+        index=df.index,
+    )
+
+def format_value(col, value, spec=None):
+    # single cell through the same formatting (tooltips, one-off labels)
+    return format_column([value], spec or value_spec(col))[0]
@@ -0,0 +1,76 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# -------------------------------------------------------------
+# CLASS ENCODING
+#   Parameter classes (*_class) and phase classes (Generation_Class,
+#   Absorption_Class, *_OVR) are held as a pandas Categorical over
+#   Low/Avg/High, i.e. int8 codes in memory (0/1/2, -1 = blank), so
+#   class comparisons and lookups are integer array operations.
+#   Codes 3/4 are the optional Very Low / Very High z bands (see
+#   z_bands.py); phase rules and colours fold them onto Low / High.
+#   Labels only appear at the edges: CSV output writes them as the
+#   same "Low"/"Avg"/"High" text (a blank phase class is an empty
+#   field, as before), and the PDF / HTML renderers map codes to
+#   colours and arrows.
+# -------------------------------------------------------------
+CLASS_LABELS = ["Low", "Avg", "High", "Very Low", "Very High"]
+LOW, AVG, HIGH, VERY_LOW, VERY_HIGH = 0, 1, 2, 3, 4
+BLANK = -1
+
+# code -> Low/Avg/High code (last entry: blank, reached by code -1)
+BASE_CODE = np.array([LOW, AVG, HIGH, LOW, HIGH, BLANK], dtype=np.int8)
+
+CLASS_INDEX = {label: code for code, label in enumerate(CLASS_LABELS)}
+CLASS_DTYPE = pd.CategoricalDtype(CLASS_LABELS)
+
+CLASS_COL = re.compile(r"_(class|Class)(_[A-Z]+)?$|_OVR$")
+
+def is_class_col(col):
+    return bool(CLASS_COL.search(str(col)))
+
+def as_class(values):
+    # labels -> class Series (unknown / NaN / "" -> blank)
+    s = pd.Series(values, copy=False)
+    if s.dtype == CLASS_DTYPE:
+        return s
+    if s.dtype == object or pd.api.types.is_string_dtype(s.dtype):
+        s = s.str.strip()
+    # unknown labels are blanked first: casting them is deprecated in pandas
+    return s.where(s.isin(CLASS_LABELS)).astype(CLASS_DTYPE)
+
+def from_codes(codes, index=None):
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=CLASS_DTYPE), index=index)
+
+def class_codes(values):
+    return as_class(values).cat.codes.to_numpy(dtype=np.int8)
+
+def base_codes(values):
+    return BASE_CODE[class_codes(values)]
+
+def encode_class_columns(df):
+    for c in df.columns:
+        if is_class_col(c):
+            df[c] = as_class(df[c])
+    return df
+
+# -------------------------------------------------------------
+# SCALAR HELPERS (display edge)
+# -------------------------------------------------------------
+def class_code(v):
+    if isinstance(v, (int, np.integer)) and not isinstance(v, bool):
+        return int(v) if LOW <= v <= VERY_HIGH else BLANK
+    if isinstance(v, str):
+        return CLASS_INDEX.get(v.strip(), BLANK)
+    return BLANK
+
+def class_label(v):
+    code = class_code(v)
+    return "" if code == BLANK else CLASS_LABELS[code]
+
+def base_label(v):
+    # Low/Avg/High (or "" for blank): what colours and arrows are keyed on
+    code = BASE_CODE[class_code(v)]
+    return "" if code == BLANK else CLASS_LABELS[code]
@@ -0,0 +1,101 @@
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from jump_pipeline.file_hash import file_digest
+from jump_pipeline.vald_schema import read_vald_export, schema_dtypes
+
+try:
+    import pyarrow  # noqa: F401  (enables the Parquet cache format)
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+# -------------------------------------------------------------
+# CLEANED VALD EXPORT CACHE
+#   Parsing the raw ForceDecks CSV (header clean-up, typed column
+#   parsing, date parsing) is the same work on every run while the
+#   export is unchanged. The cleaned, typed frame is stored next to the
+#   export in a binary columnar file keyed by a hash of the raw bytes
+#   plus the test type's schema, so unchanged exports load straight
+#   from it.
+#
+#   Format: Parquet when pyarrow is installed, otherwise NPZ (one
+#   array per column + a small JSON dtype manifest).
+# -------------------------------------------------------------
+CACHE_VERSION = 2
+
+# -------------------------------------------------------------
+# NPZ FALLBACK (no pyarrow)
+# -------------------------------------------------------------
+def _write_npz(df, path):
+    arrays = {}
+    manifest = []
+    for i, col in enumerate(df.columns):
+        s = df[col]
+        key = f"c{i}"
+        if s.dtype.kind in "biufM":
+            arrays[key] = s.to_numpy()
+            manifest.append({"name": col, "dtype": str(s.dtype), "kind": "array"})
+        else:
+            mask = s.isna().to_numpy()
+            arrays[key] = np.where(mask, "", s.astype(str).to_numpy(dtype=object)).astype(str)
+            arrays[key + "_na"] = mask
+            manifest.append({"name": col, "dtype": str(s.dtype), "kind": "text"})
+    arrays["__manifest__"] = np.array(json.dumps(manifest))
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+def _read_npz(path):
+    with np.load(path, allow_pickle=False) as data:
+        manifest = json.loads(str(data["__manifest__"]))
+        cols = {}
+        for i, meta in enumerate(manifest):
+            key = f"c{i}"
+            if meta["kind"] == "array":
+                cols[meta["name"]] = pd.Series(data[key])
+            else:
+                values = data[key].astype(object)
+                values[data[key + "_na"]] = np.nan
+                cols[meta["name"]] = pd.Series(values, dtype=object).astype(meta["dtype"])
+    return pd.DataFrame(cols)
+
+def _cache_ext():
+    return "parquet" if HAVE_PYARROW else "npz"
+
+# -------------------------------------------------------------
+# PUBLIC ENTRY POINT
+# -------------------------------------------------------------
+def load_vald_export(path, test_type, cache_dir=None):
+    if cache_dir is None:
+        return read_vald_export(path, test_type)
+
+    options = json.dumps([CACHE_VERSION, test_type, schema_dtypes(test_type)])
+    key = hashlib.sha256((file_digest(path) + options).encode("utf-8")).hexdigest()[:20]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(cache_dir, f"{stem}.{key}.{_cache_ext()}")
+
+    if os.path.exists(cache_path):
+        try:
+            if cache_path.endswith(".parquet"):
+                return pd.read_parquet(cache_path)
+            return _read_npz(cache_path)
+        except Exception as e:
+            print(f"WARNING: could not read export cache {cache_path} ({e}); re-parsing CSV.")
+
+    df = read_vald_export(path, test_type)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for stale in glob.glob(os.path.join(cache_dir, glob.escape(stem) + ".*.*")):
+        os.remove(stale)
+    tmp_path = cache_path + ".tmp"
+    if cache_path.endswith(".parquet"):
+        df.to_parquet(tmp_path, index=False)
+    else:
+        _write_npz(df, tmp_path)
+    os.replace(tmp_path, cache_path)
+    return df
@@ -0,0 +1,109 @@
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+from jump_pipeline.vald_schema import PLAYER_COL, iter_vald_export, resolve_columns
+
+# -------------------------------------------------------------
+# BOUNDED-MEMORY STREAMING OF VALD EXPORTS
+#   Multi-season organisation exports can be larger than memory.
+#   Players are independent in the rolling classification, so the
+#   export is read in chunks and split into on-disk buckets of whole
+#   players (contiguous in name order). Each bucket is small enough
+#   to classify in memory, and handling the buckets one after another
+#   gives the same player-sorted rows as the in-memory path.
+#
+#   Peak memory ~ one export chunk + one bucket, whatever the file size.
+# -------------------------------------------------------------
+STREAM_CHUNK_ROWS  = 50_000
+STREAM_BUCKET_ROWS = 200_000
+
+def count_rows_per_player(path, test_type, chunksize=STREAM_CHUNK_ROWS):
+    name_col = resolve_columns(path, test_type)[PLAYER_COL]
+    counts = pd.Series(dtype="int64")
+    reader = pd.read_csv(path, usecols=[name_col], dtype={name_col: "str"}, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            counts = counts.add(chunk[name_col].value_counts(), fill_value=0)
+    return counts.astype("int64")
+
+def plan_player_buckets(counts, bucket_rows=STREAM_BUCKET_ROWS):
+    # consecutive players (in name order) share a bucket until it holds
+    # bucket_rows rows; a single large player always gets a whole bucket
+    bucket_of = {}
+    bucket, filled = 0, 0
+    for name in sorted(counts.index):
+        if filled and filled + counts[name] > bucket_rows:
+            bucket, filled = bucket + 1, 0
+        bucket_of[name] = bucket
+        filled += counts[name]
+    return bucket_of
+
+def _read_bucket(path):
+    pieces = []
+    with open(path, "rb") as f:
+        while True:
+            try:
+                pieces.append(pickle.load(f))
+            except EOFError:
+                break
+    return pd.concat(pieces)
+
+def iter_player_buckets(path, test_type, chunksize=STREAM_CHUNK_ROWS,
+                        bucket_rows=STREAM_BUCKET_ROWS, work_dir=None):
+    bucket_of = plan_player_buckets(count_rows_per_player(path, test_type, chunksize), bucket_rows)
+    n_buckets = max(bucket_of.values(), default=-1) + 1
+
+    with tempfile.TemporaryDirectory(prefix="vald_stream_", dir=work_dir) as tmp:
+        bucket_paths = [os.path.join(tmp, f"bucket_{b:05d}.pkl") for b in range(n_buckets)]
+
+        # pass 2: route every chunk's rows to their player's bucket (file order kept)
+        for chunk in iter_vald_export(path, test_type, chunksize):
+            chunk = chunk.dropna(subset=[PLAYER_COL])
+            for b, piece in chunk.groupby(chunk[PLAYER_COL].map(bucket_of), sort=False):
+                with open(bucket_paths[b], "ab") as f:
+                    pickle.dump(piece, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        for bucket_path in bucket_paths:
+            if os.path.exists(bucket_path):
+                yield _read_bucket(bucket_path)
+                os.remove(bucket_path)
+
+def iter_player_groups(path, player_col=PLAYER_COL, chunksize=STREAM_CHUNK_ROWS):
+    # yields (player, rows) from a CSV already sorted by player, holding
+    # back the last player of each chunk until its rows are complete
+    carry = None
+    reader = pd.read_csv(path, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            if chunk.empty:
+                continue
+            if carry is not None:
+                chunk = pd.concat([carry, chunk])
+            last = chunk[player_col].iloc[-1]
+            done = chunk[chunk[player_col] != last]
+            carry = chunk[chunk[player_col] == last]
+            for player, rows in done.groupby(player_col, sort=False):
+                yield player, rows
+    if carry is not None and not carry.empty:
+        yield carry[player_col].iloc[0], carry
+
+def iter_joined_player_groups(paths, player_col=PLAYER_COL, chunksize=STREAM_CHUNK_ROWS):
+    # several player-sorted CSVs read side by side: yields (player, {key: rows})
+    # for every player in any of them (empty rows where a file lacks the player)
+    groups = {key: iter_player_groups(path, player_col, chunksize) for key, path in paths.items()}
+    empty = {key: pd.read_csv(path, nrows=0) for key, path in paths.items()}
+    heads = {key: next(it, None) for key, it in groups.items()}
+
+    while any(head is not None for head in heads.values()):
+        player = min(head[0] for head in heads.values() if head is not None)
+        rows = {}
+        for key, head in heads.items():
+            if head is not None and head[0] == player:
+                rows[key] = head[1]
+                heads[key] = next(groups[key], None)
+            else:
+                rows[key] = empty[key]
+        yield player, rows
@@ -0,0 +1,14 @@
+import hashlib
+
+# -------------------------------------------------------------
+# FILE HASHING
+#   sha256 of a file's bytes, read in blocks so a large export never
+#   sits in memory whole. Keys the export cache and the site / PDF
+#   template versions.
+# -------------------------------------------------------------
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
@@ -0,0 +1,332 @@
+import hashlib
+import json
+import os
+import zlib
+from contextlib import contextmanager
+
+# -------------------------------------------------------------
+# TABLE PDFs (player classification pages, team overviews)
+#   The classifiers describe every page as a plain table:
+#     {"title":       page title,
+#      "header":      column labels ("\n" -> several lines),
+#      "rows":        display strings, one list per row,
+#      "colors":      per cell (face, text) colour, None -> white / black,
+#      "fit_columns": size columns to their text (team overviews)}
+#   and one of two renderers draws it:
+#     "native"     -> vector pages written straight as PDF operators with
+#                     the standard Helvetica / Symbol fonts (arrows come
+#                     from Symbol); no figure, no layout pass, compressed
+#                     content streams
+#     "matplotlib" -> a figure with ax.table per page, via PdfPages
+#   The standard fonts only cover cp1252 text; document_renderer() sends
+#   a document with any other text (e.g. a player name in another
+#   script) to matplotlib.
+#
+#   Long tables are split into pages of rows_per_page rows on a fixed
+#   page size; every page repeats the title and header, and tables that
+#   span several pages get "Page i of n" footers. Pages are written out
+#   one at a time, so memory does not grow with the history length.
+#   rows_per_page=None -> one page per table, as tall as it needs to be.
+# -------------------------------------------------------------
+RENDERERS = ["native", "matplotlib"]
+ROWS_PER_PAGE = 30
+
+@contextmanager
+def table_pdf(path, renderer="native", rows_per_page=ROWS_PER_PAGE):
+    if renderer == "matplotlib":
+        plt = _pyplot()
+        from matplotlib.backends.backend_pdf import PdfPages
+        with PdfPages(path) as pages:
+            yield {"renderer": renderer, "pages": pages, "plt": plt, "rows_per_page": rows_per_page}
+        return
+    if renderer != "native":
+        raise ValueError(f"Unknown PDF renderer {renderer!r}; expected one of {RENDERERS}.")
+
+    doc = _native_open(path, rows_per_page)
+    try:
+        yield doc
+    except BaseException:
+        doc["file"].close()
+        os.remove(doc["tmp_path"])
+        raise
+    _native_close(doc)
+
+def add_table(pdf, table):
+    n_rows = len(table["rows"])
+    per_page = pdf["rows_per_page"] or max(1, n_rows)
+    n_pages = max(1, -(-n_rows // per_page))
+    pages = [slice(i * per_page, (i + 1) * per_page) for i in range(n_pages)]
+    if pdf["renderer"] == "matplotlib":
+        _mpl_table_pages(pdf, table, per_page, pages)
+    else:
+        _native_table_pages(pdf, table, per_page, pages)
+
+def document_renderer(path, tables, renderer="native"):
+    # renderer for one document: "native" falls back to "matplotlib" when
+    # a title, header or cell has characters the standard fonts lack
+    if renderer != "native":
+        return renderer
+    for table in tables:
+        for text in [table["title"], *table["header"], *(text for row in table["rows"] for text in row)]:
+            if not native_can_draw(text):
+                print(f"NOTE: {os.path.basename(path)}: {text!r} is outside the native PDF fonts -> drawing it with matplotlib.")
+                return "matplotlib"
+    return renderer
+
+def table_digest(tables):
+    # content hash of table specs: the text and colours that get drawn,
+    # so it does not depend on how the rows were held (dtypes, index)
+    return hashlib.sha256(json.dumps(tables, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def page_label(page_no, n_pages):
+    return f"Page {page_no} of {n_pages}" if n_pages > 1 else ""
+
+# -------------------------------------------------------------
+# MATPLOTLIB RENDERER
+# -------------------------------------------------------------
+def _pyplot():
+    import matplotlib
+    matplotlib.use("Agg")  # files only; also safe in PDF pool workers
+    import matplotlib.pyplot as plt
+    return plt
+
+def _mpl_table_pages(pdf, table, per_page, pages):
+    plt = pdf["plt"]
+    n_cols = len(table["header"])
+
+    # same figure size for every page of the table
+    fig_width  = max(8, n_cols * 1.3)
+    fig_height = max(4, per_page * 0.4 + 2)
+
+    # continued tables hang from the top, so a short last page lines up
+    loc = "center" if len(pages) == 1 else "upper center"
+
+    for page_no, rows in enumerate(pages, start=1):
+        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
+        ax.axis("off")
+
+        mpl_table = ax.table(cellText=table["rows"][rows], colLabels=table["header"], loc=loc)
+        mpl_table.auto_set_font_size(False)
+        mpl_table.set_fontsize(8)
+        mpl_table.scale(1.1, 1.3)
+
+        if table["fit_columns"]:
+            try:
+                mpl_table.auto_set_column_width(col=list(range(n_cols)))
+            except Exception:
+                pass
+
+        for (r, c), cell in mpl_table.get_celld().items():
+            if r == 0:
+                cell.set_facecolor("black")
+                cell.get_text().set_color("white")
+                cell.get_text().set_fontweight("bold")
+
+        for r_idx, row_colors in enumerate(table["colors"][rows], start=1):
+            for c_idx, colors in enumerate(row_colors):
+                if colors is None:
+                    continue
+                cell = mpl_table[r_idx, c_idx]
+                cell.set_facecolor(colors[0])
+                cell.get_text().set_color(colors[1])
+
+        ax.set_title(table["title"], fontsize=12, pad=12)
+        if table["fit_columns"]:
+            plt.tight_layout(rect=[0, 0, 1, 0.95])
+        else:
+            plt.tight_layout()
+        label = page_label(page_no, len(pages))
+        if label:
+            fig.text(0.5, 0.01, label, ha="center", va="bottom", fontsize=8)
+        pdf["pages"].savefig(fig)
+        plt.close(fig)
+
+# -------------------------------------------------------------
+# NATIVE RENDERER
+#   Objects 1-5 are fixed (catalog, page tree, 3 fonts); each table
+#   page adds a content stream + page object and goes to disk right
+#   away. The page tree, xref and trailer are written on close, into
+#   a temp file that replaces the target only when complete.
+# -------------------------------------------------------------
+FONT_SIZE = 8
+TITLE_SIZE = 12
+ROW_HEIGHT = 14
+HEADER_LINE_HEIGHT = 10
+CELL_PAD = 4
+FOOTER_HEIGHT = 16
+MARGIN = 36
+# US Letter landscape, widened / lengthened only when a table needs it
+MIN_PAGE_WIDTH = 11 * 72
+MIN_PAGE_HEIGHT = 8.5 * 72
+
+# Adobe core font advance widths (1/1000 em), characters 32-126
+HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+OTHER_CHAR_WIDTH = 556
+
+# class arrows drawn from the Symbol font: char code, width
+SYMBOL_ARROWS = {"↑": (0xAD, 603), "→": (0xAE, 987), "↓": (0xAF, 603)}
+
+NAMED_COLORS = {"black": (0, 0, 0), "white": (1, 1, 1)}
+
+def text_width(text, size=FONT_SIZE, bold=False):
+    if text in SYMBOL_ARROWS:
+        return SYMBOL_ARROWS[text][1] * size / 1000
+    widths = HELVETICA_BOLD_WIDTHS if bold else HELVETICA_WIDTHS
+    return sum(widths[o - 32] if 32 <= o < 127 else OTHER_CHAR_WIDTH for o in map(ord, text)) * size / 1000
+
+def _rgb(color):
+    if color in NAMED_COLORS:
+        r, g, b = NAMED_COLORS[color]
+    else:
+        r, g, b = (int(color[i:i + 2], 16) / 255 for i in (1, 3, 5))
+    return f"{r:.3g} {g:.3g} {b:.3g}"
+
+def native_can_draw(text):
+    if text in SYMBOL_ARROWS:
+        return True
+    try:
+        text.encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+def _pdf_string(text):
+    # strict: text the fonts cannot show is an error, not a "?"
+    raw = text.encode("cp1252")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+def _write_obj(doc, num, body):
+    doc["offsets"][num] = doc["file"].tell()
+    doc["file"].write(b"%d 0 obj\n" % num + body + b"\nendobj\n")
+
+def _new_obj(doc):
+    doc["next_obj"] += 1
+    return doc["next_obj"] - 1
+
+def _native_open(path, rows_per_page):
+    tmp_path = path + ".tmp"
+    doc = {
+        "renderer": "native", "path": path, "tmp_path": tmp_path, "file": open(tmp_path, "wb"),
+        "rows_per_page": rows_per_page, "offsets": {}, "next_obj": 6, "pages": [],
+    }
+    doc["file"].write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    for num, font in [(3, b"Helvetica"), (4, b"Helvetica-Bold")]:
+        _write_obj(doc, num, b"<< /Type /Font /Subtype /Type1 /BaseFont /" + font + b" /Encoding /WinAnsiEncoding >>")
+    _write_obj(doc, 5, b"<< /Type /Font /Subtype /Type1 /BaseFont /Symbol >>")
+    return doc
+
+def _native_close(doc):
+    kids = b" ".join(b"%d 0 R" % num for num in doc["pages"])
+    _write_obj(doc, 2, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(doc["pages"]))
+    _write_obj(doc, 1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    f = doc["file"]
+    xref_at = f.tell()
+    size = doc["next_obj"]
+    f.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+    for num in range(1, size):
+        f.write(b"%010d 00000 n \n" % doc["offsets"][num])
+    f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_at))
+    f.close()
+    os.replace(doc["tmp_path"], doc["path"])
+
+def _text_op(font, size, color, x, y, text):
+    return b"BT /%s %g Tf %s rg %.2f %.2f Td %s Tj ET\n" % (
+        font.encode(), size, _rgb(color).encode(), x, y, text,
+    )
+
+def _cell_text(text, color, x_right, y):
+    # right-aligned like ax.table cells; class arrows from the Symbol font
+    if text in SYMBOL_ARROWS:
+        code, _ = SYMBOL_ARROWS[text]
+        return _text_op("F3", FONT_SIZE, color, x_right - text_width(text), y, b"(\\%03o)" % code)
+    return _text_op("F1", FONT_SIZE, color, x_right - text_width(text), y, _pdf_string(text))
+
+def _native_table_pages(doc, table, per_page, pages):
+    # column widths over the whole table, so every page lines up
+    header = [label.split("\n") for label in table["header"]]
+    col_widths = []
+    for c, lines in enumerate(header):
+        w = max(text_width(line, bold=True) for line in lines)
+        for row in table["rows"]:
+            w = max(w, text_width(row[c]))
+        col_widths.append(w + 2 * CELL_PAD)
+    table_width = sum(col_widths)
+    header_height = HEADER_LINE_HEIGHT * max(len(lines) for lines in header) + 6
+
+    page_width = max(MIN_PAGE_WIDTH, table_width + 2 * MARGIN)
+    page_height = max(MIN_PAGE_HEIGHT, 2 * MARGIN + 2 * TITLE_SIZE + header_height + per_page * ROW_HEIGHT + FOOTER_HEIGHT)
+    x0 = (page_width - table_width) / 2
+    xs = [x0]
+    for w in col_widths:
+        xs.append(xs[-1] + w)
+
+    for page_no, rows in enumerate(pages, start=1):
+        out = [_text_op(
+            "F1", TITLE_SIZE, "black", (page_width - text_width(table["title"], TITLE_SIZE)) / 2,
+            page_height - MARGIN - TITLE_SIZE, _pdf_string(table["title"]),
+        )]
+
+        # header: black cells, white bold centred lines
+        top = page_height - MARGIN - 2 * TITLE_SIZE
+        y = top - header_height
+        out.append(b"0 0 0 rg %.2f %.2f %.2f %.2f re f\n" % (x0, y, table_width, header_height))
+        for c, lines in enumerate(header):
+            first = y + header_height / 2 + (len(lines) - 1) * HEADER_LINE_HEIGHT / 2 - FONT_SIZE * 0.35
+            for i, line in enumerate(lines):
+                x = xs[c] + (col_widths[c] - text_width(line, bold=True)) / 2
+                out.append(_text_op("F2", FONT_SIZE, "white", x, first - i * HEADER_LINE_HEIGHT, _pdf_string(line)))
+
+        # body: cell faces, then grid, then text
+        page_rows = table["rows"][rows]
+        faces, texts = [], []
+        for row, row_colors in zip(page_rows, table["colors"][rows]):
+            y -= ROW_HEIGHT
+            for c, text in enumerate(row):
+                face, color = row_colors[c] or ("white", "black")
+                if face != "white":
+                    faces.append(b"%s rg %.2f %.2f %.2f %.2f re f\n" % (_rgb(face).encode(), xs[c], y, col_widths[c], ROW_HEIGHT))
+                if text:
+                    texts.append(_cell_text(text, color, xs[c + 1] - CELL_PAD, y + (ROW_HEIGHT - FONT_SIZE * 0.7) / 2))
+        out += faces
+
+        grid = [b"0 0 0 RG 0.5 w\n"]
+        for x in xs:
+            grid.append(b"%.2f %.2f m %.2f %.2f l\n" % (x, y, x, top))
+        for i in range(len(page_rows) + 1):
+            row_y = y + i * ROW_HEIGHT
+            grid.append(b"%.2f %.2f m %.2f %.2f l\n" % (x0, row_y, x0 + table_width, row_y))
+        grid.append(b"%.2f %.2f m %.2f %.2f l S\n" % (x0, top, x0 + table_width, top))
+        out += grid + texts
+
+        label = page_label(page_no, len(pages))
+        if label:
+            out.append(_text_op("F1", FONT_SIZE, "black", (page_width - text_width(label)) / 2, MARGIN, _pdf_string(label)))
+
+        _write_page(doc, b"".join(out), page_width, page_height)
+
+def _write_page(doc, content, page_width, page_height):
+    content = zlib.compress(content)
+    stream_num = _new_obj(doc)
+    _write_obj(doc, stream_num, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content) + content + b"\nendstream")
+    page_num = _new_obj(doc)
+    _write_obj(doc, page_num, (
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+        b"/Resources << /Font << /F1 3 0 R /F2 4 0 R /F3 5 0 R >> >> /Contents %d 0 R >>"
+    ) % (page_width, page_height, stream_num))
+    doc["pages"].append(page_num)
@@ -0,0 +1,170 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from jump_pipeline.class_codes import BLANK, CLASS_INDEX, base_codes, from_codes
+
+# -------------------------------------------------------------
+# DAY-LEVEL PHASE RULES (Generation: PD + DEP + PF,
+#                        Absorption: BD + DEP + BF)
+#   The rules below are the readable source of truth. Each only
+#   depends on three Low/Avg/High parameter classes, so at import
+#   they are compiled into lookup tables indexed by integer class
+#   codes, and whole columns are classified with one array lookup.
+#   The scalar rules take and return class labels.
+# -------------------------------------------------------------
+def classify_generation(pd_class, dep_class, pf_class):
+    if pd.isna(pd_class) or pd.isna(dep_class) or pd.isna(pf_class):
+        return ""
+    PD, DEP, PF = str(pd_class), str(dep_class), str(pf_class)
+
+    # If PD & DEP both HIGH:
+    if PD == "High" and DEP == "High":
+        if PF == "High":
+            return "Avg"
+        if PF in ("Low", "Avg"):
+            return "Low"
+
+    # If PD & DEP both LOW:
+    if PD == "Low" and DEP == "Low":
+        if PF == "Low":
+            return "Avg"
+        if PF in ("High", "Avg"):
+            return "High"
+
+    # If exactly one of PD / DEP is HIGH:
+    if (PD == "High" and DEP == "Avg") or (PD == "Avg" and DEP == "High"):
+        if PD == "High" and DEP == "Avg":
+            # PD High + DEP Avg
+            if PF in ("Avg", "Low"):
+                return "Low"
+            if PF == "High":
+                return "High"
+        else:
+            # DEP High + PD Avg
+            if PF in ("Avg", "High"):
+                return "High"
+            if PF == "Low":
+                return "Low"
+
+    # If exactly one of PD / DEP is LOW:
+    if (PD == "Low" and DEP == "Avg") or (PD == "Avg" and DEP == "Low"):
+        if PD == "Low" and DEP == "Avg":
+            if PF == "Low":
+                return "Low"
+            # PF Avg or High
+            return "High"
+        else:
+            # DEP Low + PD Avg
+            if PF in ("Avg", "Low"):
+                return "Low"
+            if PF == "High":
+                return "High"
+
+    # PD & DEP both NORMAL:
+    if PD == "Avg" and DEP == "Avg":
+        if PF == "High":
+            return "High"
+        if PF == "Low":
+            return "Low"
+        return "Avg"
+
+    # If one HIGH, one LOW (PD vs DEP):
+    if PD == "Low" and DEP == "High":
+        return "High"
+    if PD == "High" and DEP == "Low":
+        return "Low"
+
+    return "Avg"
+
+def classify_absorption(bd_class, dep_class, bf_class):
+    if pd.isna(bd_class) or pd.isna(dep_class) or pd.isna(bf_class):
+        return ""
+    BD, DEP, BF = str(bd_class), str(dep_class), str(bf_class)
+
+    # If BD & DEP both HIGH:
+    if BD == "High" and DEP == "High":
+        if BF == "High":
+            return "Avg"
+        # BF Avg or Low
+        return "High"
+
+    # If BD & DEP both LOW:
+    if BD == "Low" and DEP == "Low":
+        if BF == "Low":
+            return "Avg"
+        # BF Avg or High
+        return "Low"
+
+    # If exactly one of BD/DEP is HIGH:
+    if (BD == "High" and DEP == "Avg") or (BD == "Avg" and DEP == "High"):
+        if BD == "High" and DEP == "Avg":
+            if BF in ("Avg", "Low"):
+                return "Low"
+            if BF == "High":
+                return "High"
+        else:
+            # DEP High + BD Avg
+            if BF in ("Avg", "High"):
+                return "High"
+            if BF == "Low":
+                return "Low"
+
+    # If exactly one of BD/DEP is LOW:
+    if (BD == "Low" and DEP == "Avg") or (BD == "Avg" and DEP == "Low"):
+        if BD == "Low" and DEP == "Avg":
+            if BF == "Low":
+                return "Low"
+            # BF Avg or High
+            return "High"
+        else:
+            # DEP Low + BD Avg
+            if BF in ("Avg", "Low"):
+                return "Low"
+            if BF == "High":
+                return "High"
+
+    # BD & DEP both NORMAL:
+    if BD == "Avg" and DEP == "Avg":
+        if BF == "High":
+            return "High"
+        if BF == "Low":
+            return "Low"
+        return "Avg"
+
+    # If one HIGH, one LOW (BD vs DEP):
+    if BD == "Low" and DEP == "High":
+        return "High"
+    if BD == "High" and DEP == "Low":
+        return "Low"
+
+    return "Avg"
+
+# -------------------------------------------------------------
+# LOOKUP TABLES
+#   Indexed by class code (Low/Avg/High = 0/1/2, see class_codes;
+#   Very Low / Very High inputs are folded onto Low / High first).
+#   The 3x3x3 rule table is padded with one extra slot at index 3,
+#   which a blank input (code -1) reaches through negative indexing;
+#   every cell touching it is blank, so missing inputs need no mask.
+# -------------------------------------------------------------
+def compile_phase_lut(rule):
+    lut = np.full((4, 4, 4), BLANK, dtype=np.int8)
+    for a, b, c in product(["Low", "Avg", "High"], repeat=3):
+        out = rule(a, b, c)
+        lut[CLASS_INDEX[a], CLASS_INDEX[b], CLASS_INDEX[c]] = CLASS_INDEX.get(out, BLANK)
+    return lut
+
+GENERATION_LUT = compile_phase_lut(classify_generation)
+ABSORPTION_LUT = compile_phase_lut(classify_absorption)
+
+def phase_classes(df, lut, class_cols, missing=BLANK):
+    # class Series for every row of df; missing= is the code used for blank inputs
+    idx = []
+    for c in class_cols:
+        codes = base_codes(df[c]) if c in df.columns else np.full(len(df), BLANK, dtype=np.int8)
+        if missing != BLANK:
+            codes = np.where(codes == BLANK, missing, codes)
+        idx.append(codes)
+    return from_codes(lut[idx[0], idx[1], idx[2]], index=df.index)
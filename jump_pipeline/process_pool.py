@@ -0,0 +1,34 @@
+import multiprocessing
+import os
+from itertools import islice
+
+# -------------------------------------------------------------
+# PROCESS POOL FOR PER-PLAYER OUTPUTS (site pages, PDFs)
+#   workers == 1 -> plain loop in this process; N > 1 -> N worker
+#   processes (None -> one per CPU). Results come back in input order.
+#   Items are handed out in batches of a few per worker, so a lazy
+#   input (e.g. streaming-mode player frames) is never fully in memory.
+#
+#   Workers fork where the platform can (they share the parent's data
+#   copy-on-write). Under "spawn" (Windows) each worker re-imports the
+#   main script as __mp_main__: fn must be a top-level function and the
+#   script's own run must sit under `if __name__ == "__main__":`.
+# -------------------------------------------------------------
+BATCH_PER_WORKER = 4
+
+def map_in_pool(fn, items, workers=1):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    items = iter(items)
+    with multiprocessing.get_context(method).Pool(workers) as pool:
+        while True:
+            batch = list(islice(items, workers * BATCH_PER_WORKER))
+            if not batch:
+                break
+            yield from pool.map(fn, batch, chunksize=1)
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+# -------------------------------------------------------------
+# SEGMENTED EXPANDING STATISTICS
+#   For every row and parameter the classifiers need the count, mean
+#   and sample SD of the player's *previous* valid values, i.e.
+#   s.expanding().count/mean/std().shift(1) per player.
+#
+#   The frame is sorted by player, so every player is one contiguous
+#   segment of rows. Instead of a groupby/apply per parameter we walk
+#   all segments in lock-step: step k adds the k-th row of every
+#   segment that is still running, for all parameters at once.
+#
+#   The update is the same Kahan-summed mean / Welford variance
+#   recurrence pandas uses for expanding windows, so the prior mean
+#   and SD are bit-for-bit identical to the groupby/apply results.
+# -------------------------------------------------------------
+STATE_FIELDS = (
+    "count",        # number of valid values seen
+    "sum",          # Kahan-compensated running sum (mean kernel)
+    "sum_comp",     # Kahan compensation for "sum"
+    "neg_count",    # number of negative values seen
+    "mean",         # Welford running mean (variance kernel)
+    "m2",           # Welford sum of squared deviations
+    "mean_comp",    # Kahan compensation for "mean"
+    "run_length",   # length of the current run of identical values
+    "last_value",   # last valid value seen
+)
+
+def new_state(n_segments, n_params):
+    shape = (n_segments, n_params)
+    state = {f: np.zeros(shape, dtype="float64") for f in STATE_FIELDS}
+    state["count"] = np.zeros(shape, dtype="int64")
+    state["neg_count"] = np.zeros(shape, dtype="int64")
+    state["run_length"] = np.zeros(shape, dtype="int64")
+    state["last_value"] = np.full(shape, np.nan)
+    return state
+
+def state_mean(state):
+    count = state["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = state["sum"] / count
+    # same clean-ups pandas applies to a window mean
+    mean = np.where(
+        state["run_length"] >= count, state["last_value"],
+        np.where((state["neg_count"] == 0) & (mean < 0), 0.0,
+                 np.where((state["neg_count"] == count) & (mean > 0), 0.0, mean))
+    )
+    return np.where(count > 0, mean, np.nan)
+
+def state_sd(state):
+    count = state["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = state["m2"] / (count - 1)
+    var = np.where(state["run_length"] >= count, 0.0, var)
+    var = np.where(count >= 2, var, np.nan)
+    return np.sqrt(np.where(var < 0, 0.0, var))
+
+def _add_values(state, x):
+    ok = ~np.isnan(x)
+
+    count = state["count"] + ok
+    state["count"][...] = count
+    state["neg_count"][...] += ok & np.signbit(x)
+
+    # Kahan summation (mean kernel)
+    total, comp = state["sum"], state["sum_comp"]
+    y = x - comp
+    t = total + y
+    state["sum_comp"][...] = np.where(ok, t - total - y, comp)
+    state["sum"][...] = np.where(ok, t, total)
+
+    # Welford with Kahan-compensated mean (variance kernel)
+    mean, mcomp = state["mean"], state["mean_comp"]
+    prev_mean = mean - mcomp
+    y = x - mcomp
+    t = y - mean
+    with np.errstate(invalid="ignore", divide="ignore"):
+        new_mean = mean + t / count
+    state["mean_comp"][...] = np.where(ok, t + mean - y, mcomp)
+    state["m2"][...] = np.where(ok, state["m2"] + (x - prev_mean) * (x - new_mean), state["m2"])
+    state["mean"][...] = np.where(ok, new_mean, mean)
+
+    # runs of identical values (pandas snaps those windows to exact values)
+    same = x == state["last_value"]
+    state["run_length"][...] = np.where(ok, np.where(same, state["run_length"] + 1, 1), state["run_length"])
+    state["last_value"][...] = np.where(ok, x, state["last_value"])
+
+def segment_starts(keys):
+    keys = np.asarray(keys, dtype=object)
+    starts = np.ones(len(keys), dtype=bool)
+    starts[1:] = keys[1:] != keys[:-1]
+    return starts
+
+def expanding_prior_block(values, starts, state=None):
+    """
+    values: (rows, params) float block, rows grouped into contiguous segments
+    starts: bool per row, True where a new segment begins
+    state:  optional per-segment starting state (see new_state)
+
+    Returns (count_prev, mean_prev, sd_prev, final_state).
+    """
+    X = np.asarray(values, dtype="float64")
+    if X.ndim == 1:
+        X = X[:, None]
+    n_rows, n_params = X.shape
+
+    seg_start = np.flatnonzero(starts)
+    seg_len = np.diff(np.append(seg_start, n_rows))
+    n_segments = len(seg_start)
+
+    # longest segments first => the segments still running at step k are a prefix
+    order = np.argsort(-seg_len, kind="stable")
+    start_sorted = seg_start[order]
+    max_len = int(seg_len.max()) if n_segments else 0
+    n_active = n_segments - np.cumsum(np.bincount(seg_len, minlength=max_len + 1))[:max_len]
+
+    if state is None:
+        st = new_state(n_segments, n_params)
+    else:
+        st = {f: np.array(state[f], copy=True)[order] for f in STATE_FIELDS}
+
+    count_prev = np.zeros((n_rows, n_params), dtype="int64")
+    mean_prev = np.full((n_rows, n_params), np.nan)
+    sd_prev = np.full((n_rows, n_params), np.nan)
+
+    for k in range(max_len):
+        m = n_active[k]
+        rows = start_sorted[:m] + k
+        view = {f: st[f][:m] for f in STATE_FIELDS}
+
+        count_prev[rows] = view["count"]
+        mean_prev[rows] = state_mean(view)
+        sd_prev[rows] = state_sd(view)
+
+        _add_values(view, X[rows])
+
+    final_state = {}
+    for f in STATE_FIELDS:
+        final_state[f] = np.empty_like(st[f])
+        final_state[f][order] = st[f]
+
+    return count_prev, mean_prev, sd_prev, final_state
+
+def expanding_prior_stats(df, group_col, params, initial_state=None, return_state=False):
+    """
+    Prior (shifted) expanding count, mean and SD for every column in
+    `params`, per `group_col` (a column or a list of key columns).
+    `df` must already be sorted by the group key(s).
+    Returns three DataFrames aligned with df.index, one column per param.
+
+    initial_state / the returned state are dicts of field -> DataFrame
+    (index = group keys, a MultiIndex for several key columns;
+    columns = params). Groups missing from initial_state start from scratch.
+    """
+    key_cols = [group_col] if isinstance(group_col, str) else list(group_col)
+    starts = np.logical_or.reduce([segment_starts(df[c]) for c in key_cols])
+    first_rows = df[key_cols].iloc[np.flatnonzero(starts)]
+    if len(key_cols) == 1:
+        seg_keys = pd.Index(first_rows[key_cols[0]].to_numpy())
+    else:
+        seg_keys = pd.MultiIndex.from_frame(first_rows)
+    if seg_keys.duplicated().any():
+        raise ValueError(f"Frame must be sorted by {group_col!r} before computing rolling stats.")
+
+    state = None
+    if initial_state is not None:
+        state = new_state(len(seg_keys), len(params))
+        has_prior = initial_state["count"].reindex(index=seg_keys, columns=params).notna().to_numpy()
+        for f in STATE_FIELDS:
+            known = initial_state[f].reindex(index=seg_keys, columns=params)
+            state[f] = np.where(has_prior, known.to_numpy(dtype="float64"), state[f]).astype(state[f].dtype)
+
+    block = df[params].to_numpy(dtype="float64", na_value=np.nan)
+    count_prev, mean_prev, sd_prev, final_state = expanding_prior_block(block, starts, state)
+
+    def wrap(a):
+        return pd.DataFrame(a, index=df.index, columns=params)
+
+    result = (wrap(count_prev), wrap(mean_prev), wrap(sd_prev))
+    if return_state:
+        final_state = {f: pd.DataFrame(a, index=seg_keys, columns=params) for f, a in final_state.items()}
+        result += (final_state,)
+    return result
@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from jump_pipeline.file_hash import file_digest
+
+# -------------------------------------------------------------
+# SITE MANIFEST (incremental HTML builds, incremental classifier PDFs)
+#   page file name -> fingerprint of everything the page is rendered
+#   from (the builder's template version + its input rows). A page is
+#   re-rendered only when its fingerprint changed or the file is gone;
+#   pages and the manifest are written to a temp file and renamed, so
+#   an interrupted build never leaves a half-written page behind.
+#
+#   The template version covers the builder script and every module of
+#   this package, since cell text, classes and bands all come from here.
+# -------------------------------------------------------------
+MANIFEST_VERSION = 1
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def template_version(*scripts, settings=()):
+    modules = sorted(f for f in os.listdir(PACKAGE_DIR) if f.endswith(".py"))
+    return page_fingerprint(
+        *(file_digest(os.path.abspath(path)) for path in scripts),
+        *(f"{name}:{file_digest(os.path.join(PACKAGE_DIR, name))}" for name in modules),
+        *settings,
+    )
+
+def frame_digest(df):
+    # content hash of a frame's columns and values (not its index)
+    h = hashlib.sha256()
+    h.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def page_fingerprint(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        print(f"WARNING: manifest at {path} has version {manifest.get('version')!r}; rebuilding every page.")
+        return {}
+    return manifest["pages"]
+
+def save_manifest(path, pages):
+    write_text_atomic(path, json.dumps({"version": MANIFEST_VERSION, "pages": pages}, indent=1, sort_keys=True))
+
+def page_is_current(pages, out_path, fingerprint):
+    return pages.get(os.path.basename(out_path)) == fingerprint and os.path.exists(out_path)
+
+def write_text_atomic(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,72 @@
+import gzip
+import os
+
+try:
+    import brotli
+    HAVE_BROTLI = True
+except ImportError:
+    HAVE_BROTLI = False
+
+# -------------------------------------------------------------
+# SITE OUTPUT STAGE
+#   The site is served as plain files from a small box. Every page,
+#   asset and data file the builder writes is given precompressed
+#   siblings (page.html.gz / page.html.br) that a static server hands
+#   out as-is (nginx gzip_static / brotli_static, Caddy precompressed)
+#   instead of compressing on each request.
+#
+#   Files are not minified: the pages carry inline scripts with
+#   template literals and CSS strings that a line-based pass mangles,
+#   and on these pages it saved ~1% next to the compressed siblings.
+#   .br siblings need the brotli package; without it only .gz is written.
+# -------------------------------------------------------------
+COMPRESSED_SUFFIXES = [".gz", ".br"]
+
+def _write_bytes_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def finish_site_file(path, precompress=True):
+    # -> (path, bytes as written, .gz, .br); missing sizes are None
+    with open(path, "rb") as f:
+        data = f.read()
+
+    sizes = {".gz": None, ".br": None}
+    if precompress:
+        _write_bytes_atomic(path + ".gz", gzip.compress(data, compresslevel=9, mtime=0))
+        sizes[".gz"] = os.path.getsize(path + ".gz")
+        if HAVE_BROTLI:
+            _write_bytes_atomic(path + ".br", brotli.compress(data, quality=11))
+            sizes[".br"] = os.path.getsize(path + ".br")
+
+    # a sibling left from an earlier build would be served instead of the new file
+    for suffix, size in sizes.items():
+        if size is None and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return path, len(data), sizes[".gz"], sizes[".br"]
+
+def print_size_report(rows):
+    if not rows:
+        return
+
+    def kb(n):
+        return "-" if n is None else f"{n / 1024:.1f}"
+
+    def served(row):
+        # smallest sibling a static server hands out, else the file itself
+        _, size, gz, br = row
+        return br if br is not None else gz if gz is not None else size
+
+    def saved(n, size):
+        return "" if n == size or not size else f" ({100 * (1 - n / size):.0f}% saved)"
+
+    print(f"{'File':<44} {'Built KB':>9} {'Gzip KB':>8} {'Brotli KB':>9}")
+    for row in rows:
+        path, size, gz, br = row
+        print(f"{os.path.basename(path):<44} {kb(size):>9} {kb(gz):>8} {kb(br):>9}{saved(served(row), size)}")
+
+    total_size = sum(r[1] for r in rows)
+    total_served = sum(served(r) for r in rows)
+    print(f"Site output: {len(rows)} file(s), {kb(total_size)} KB built -> {kb(total_served)} KB served{saved(total_served, total_size)}")
@@ -0,0 +1,515 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from jump_pipeline.baseline_store import (
+    load_baseline, save_baseline, new_baseline, baseline_state,
+    update_baseline, latest_watermarks, rows_after_watermark, unprocessed_rows,
+)
+from jump_pipeline.class_codes import encode_class_columns, from_codes
+from jump_pipeline.export_cache import load_vald_export
+from jump_pipeline.export_stream import iter_joined_player_groups, iter_player_buckets
+from jump_pipeline.phase_rules import phase_classes
+from jump_pipeline.rolling_stats import STATE_FIELDS, expanding_prior_stats
+from jump_pipeline.test_specs import TEST_SPECS, phase_column, spec_column, spec_params
+from jump_pipeline.vald_schema import DATE_COL, PLAYER_COL, TIME_COL, resolve_columns
+from jump_pipeline.z_bands import bands_for, z_band_codes
+
+# -------------------------------------------------------------
+# SPEC-DRIVEN CLASSIFICATION ENGINE
+#   Every test / leg in TEST_SPECS goes through the same steps:
+#     - one load per raw export (SLJ-L and SLJ-R share the SLJ file)
+#     - a long frame: one block of rows per spec, parameters under
+#       their leg-less names, segments = (test, player)
+#     - ONE rolling-stats / z / class pass over the whole block,
+#       for every test, leg and parameter at once
+#     - per spec: phase rules, empty-test filter, daily outputs and
+#       the team snapshot, under the spec's export column names
+# -------------------------------------------------------------
+TEST_COL = "Test"
+
+def sort_tests(df):
+    return df.dropna(subset=[PLAYER_COL, DATE_COL]).sort_values([PLAYER_COL, DATE_COL])
+
+def exports_for_tests(tests):
+    return list(dict.fromkeys(TEST_SPECS[t]["export"] for t in tests))
+
+def phase_inputs(test, params):
+    # phase -> the spec's available input columns for that phase
+    spec = TEST_SPECS[test]
+    return {
+        phase: [spec_column(spec, p) for p in inputs if p in params]
+        for phase, (_, inputs) in spec["phases"].items()
+    }
+
+# -------------------------------------------------------------
+# 1. LONG FORMAT (test, player, date) x parameter
+#    derived metrics are built from the raw export values, then
+#    0 is treated as missing for every classified parameter
+# -------------------------------------------------------------
+def long_frame(frames, tests, params_by_test):
+    pieces = []
+    for test in tests:
+        spec = TEST_SPECS[test]
+        df = frames[spec["export"]]
+        piece = pd.DataFrame({TEST_COL: test, PLAYER_COL: df[PLAYER_COL], DATE_COL: df[DATE_COL]})
+        for p in params_by_test[test]:
+            if p in spec["derived"]:
+                num, den = spec["derived"][p]
+                piece[p] = (df[spec_column(spec, num)] / df[spec_column(spec, den)]).round(1)
+            else:
+                piece[p] = df[spec_column(spec, p)]
+        pieces.append(piece)
+
+    long = pd.concat(pieces, ignore_index=True)
+    params = list(dict.fromkeys(p for t in tests for p in params_by_test[t]))
+    long[params] = long[params].mask(long[params] == 0)
+    return long, params
+
+# -------------------------------------------------------------
+# 2. PARAMETER-LEVEL ROLLING CLASSIFICATION (all tests / legs at once)
+#    - ignore missing days
+#    - first 2 valid trials per player+param => z=0 => class Avg
+#    - add "{param}_avg_prev" rounded 1 decimal
+#    Depth is POSITIVE: deeper = bigger value => z>=1 => High
+#    (band cut-offs live in jump_pipeline/z_bands.py)
+# -------------------------------------------------------------
+def add_parameter_classes(long, params, initial_state=None):
+    count_prev, mean_prev, sd_prev, final_state = expanding_prior_stats(
+        long, [TEST_COL, PLAYER_COL], params, initial_state=initial_state, return_state=True
+    )
+
+    x = long[params].to_numpy(dtype="float64", na_value=np.nan)
+    count = count_prev.to_numpy()
+    mean = mean_prev.to_numpy()
+    sd = sd_prev.to_numpy()
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z_raw = (x - mean) / sd
+    has_current = ~np.isnan(x)
+    mask_normal = has_current & (count >= 2) & ~np.isnan(sd) & (sd != 0)
+    # first two valid trials OR sd missing/0 => Avg
+    z = np.where(mask_normal, z_raw, np.where(has_current, 0.0, np.nan))
+
+    # band cut-offs may differ per test / leg column: fill each test's rows
+    codes = np.empty(z.shape, dtype=np.int8)
+    test_of_row = long[TEST_COL].to_numpy()
+    for test in pd.unique(test_of_row):
+        rows = test_of_row == test
+        spec = TEST_SPECS[test]
+        for j, p in enumerate(params):
+            codes[rows, j] = z_band_codes(z[rows, j], **bands_for(spec_column(spec, p)))
+
+    new_cols = {}
+    for j, p in enumerate(params):
+        new_cols[f"{p}_avg_prev"] = mean_prev[p].round(1)
+        new_cols[f"{p}_z"] = pd.Series(z[:, j], index=long.index)
+        new_cols[f"{p}_class"] = from_codes(codes[:, j], index=long.index)
+
+    long = pd.concat([long, pd.DataFrame(new_cols, index=long.index)], axis=1)
+    return long, final_state
+
+# -------------------------------------------------------------
+# 3. PER-SPEC FRAMES (export column names, e.g. "... (L)")
+# -------------------------------------------------------------
+def spec_frame(long, test, params):
+    spec = TEST_SPECS[test]
+    rename = {}
+    for p in params:
+        col = spec_column(spec, p)
+        for suffix in ["", "_avg_prev", "_z", "_class"]:
+            rename[f"{p}{suffix}"] = f"{col}{suffix}"
+
+    rows = long[TEST_COL].to_numpy() == test
+    return long.loc[rows, [PLAYER_COL, DATE_COL] + list(rename)].rename(columns=rename)
+
+# -------------------------------------------------------------
+# 4. DAY-LEVEL PHASE CLASSIFICATION (Generation / Absorption ...)
+#    - if required RAW inputs missing => overall class blank
+#    - rules live in jump_pipeline/phase_rules.py and are applied to
+#      whole columns through 3x3x3 lookup tables
+# -------------------------------------------------------------
+def add_phase_classes(df, test):
+    spec = TEST_SPECS[test]
+    for phase, (lut, inputs) in spec["phases"].items():
+        cols = [spec_column(spec, p) for p in inputs]
+        required_raw = [c for c in cols if c in df.columns]
+
+        # rows missing a required raw input keep a blank overall class
+        mask = df[required_raw].notna().all(axis=1) if required_raw else pd.Series(False, index=df.index)
+        df[phase_column(spec, phase)] = phase_classes(df, lut, [f"{c}_class" for c in cols]).where(mask)
+
+# -------------------------------------------------------------
+# 5. DROP ROWS WITH NO DATA FOR THE TEST / LEG
+#    (a shared column such as body weight alone does not count)
+# -------------------------------------------------------------
+def drop_empty_tests(df, test, params):
+    spec = TEST_SPECS[test]
+    gate_cols = [spec_column(spec, p) for p in params if p not in spec["shared"]]
+    if gate_cols:
+        has_data = df[gate_cols].notna().any(axis=1)
+    else:
+        has_data = pd.Series(True, index=df.index)
+    return df.loc[has_data].copy()
+
+# -------------------------------------------------------------
+# 6. DAILY OUTPUT FRAMES, ONE PER PHASE
+#    (phase inputs + "other" params, their prior averages, z, classes)
+# -------------------------------------------------------------
+def split_outputs(df, test, params):
+    spec = TEST_SPECS[test]
+    other_cols = [spec_column(spec, p) for p in spec["other"] if p in params]
+
+    outputs = {}
+    for phase, input_cols in phase_inputs(test, params).items():
+        value_cols = input_cols + other_cols
+        cols = (
+            [PLAYER_COL, DATE_COL]
+            + value_cols
+            + [f"{c}_avg_prev" for c in value_cols]
+            + [f"{c}_z" for c in value_cols]
+            + [f"{c}_class" for c in value_cols]
+            + [phase_column(spec, phase)]
+        )
+        outputs[phase] = df[[c for c in cols if c in df.columns]].copy()
+    return outputs
+
+# -------------------------------------------------------------
+# 7. TEAM-LEVEL SNAPSHOT (TTD, LTD, latest values / classes)
+#    (rows per player; players never span two streaming buckets)
+#    latest_tests() is also the site builder's latest-test view
+# -------------------------------------------------------------
+def team_columns(test):
+    spec = TEST_SPECS[test]
+    snap = spec["snapshot"]
+    return (
+        [PLAYER_COL, "TTD", "LTD"]
+        + [spec_column(spec, p) for p in snap["params"]]
+        + [phase_column(spec, phase) for phase in snap["phases"]]
+    )
+
+def latest_tests(df):
+    # one row per player: their latest test with every value, z and class
+    # (rows are sorted by player, then date, so it is the player's last row)
+    return df.groupby(PLAYER_COL, sort=False).tail(1)
+
+def team_snapshot_rows(df, test):
+    spec = TEST_SPECS[test]
+    snap = spec["snapshot"]
+
+    agg = (
+        df.groupby(PLAYER_COL)[DATE_COL]
+          .agg(TTD="count", LTD="max")
+          .reset_index()
+    )
+
+    cols_last = [PLAYER_COL, DATE_COL]
+    for p in snap["params"]:
+        col = spec_column(spec, p)
+        cols_last += [col, f"{col}_class"]
+    cols_last += [phase_column(spec, phase) for phase in snap["phases"]]
+    cols_last = [c for c in cols_last if c in df.columns]
+
+    df_last = latest_tests(df)[cols_last].rename(columns={DATE_COL: "LTD"})
+
+    return agg.merge(df_last, on=[PLAYER_COL, "LTD"], how="left")
+
+# -------------------------------------------------------------
+# 8. ROLLING STATE <-> BASELINE STORE
+#    The store keeps one record per (player, export, leg, parameter);
+#    the long pass works on (test, player) segments.
+# -------------------------------------------------------------
+def long_state(store, tests, params_by_test):
+    parts = {f: [] for f in STATE_FIELDS}
+    for test in tests:
+        spec = TEST_SPECS[test]
+        params = params_by_test[test]
+        stored = baseline_state(store, spec["export"], [spec_column(spec, p) for p in params])
+        for f in STATE_FIELDS:
+            part = stored[f].copy()
+            part.columns = params
+            part.index = pd.MultiIndex.from_product([[test], part.index], names=[TEST_COL, PLAYER_COL])
+            parts[f].append(part)
+    return {f: pd.concat(parts[f]) for f in STATE_FIELDS}
+
+def export_state(final_state, tests, params_by_test):
+    parts = {}
+    for test in tests:
+        spec = TEST_SPECS[test]
+        params = params_by_test[test]
+        for f in STATE_FIELDS:
+            rows = final_state[f].index.get_level_values(TEST_COL) == test
+            part = final_state[f].loc[rows, params].droplevel(TEST_COL)
+            part.columns = [spec_column(spec, p) for p in params]
+            parts.setdefault(spec["export"], {}).setdefault(f, []).append(part)
+
+    # shared columns (body weight) appear once per leg with the same state
+    state = {}
+    for export, fields in parts.items():
+        state[export] = {}
+        for f, frames in fields.items():
+            merged = pd.concat(frames, axis=1)
+            state[export][f] = merged.loc[:, ~merged.columns.duplicated()]
+    return state
+
+# -------------------------------------------------------------
+# 9. CLASSIFY (steps 1-6 for any mix of tests)
+# -------------------------------------------------------------
+def classify_tests(frames, tests, baselines=None):
+    """
+    frames:    export name -> typed, player-sorted export rows
+    tests:     TEST_SPECS keys whose export is in `frames`
+    baselines: export name -> stored baseline to continue from (or None)
+
+    Returns (results, state): results[test] has the classified, non-empty
+    rows ("frame"), the daily frame per phase ("outputs") and the
+    parameters used ("params"); state[export] is the rolling state to
+    store, with export column names.
+    """
+    params_by_test = {
+        t: spec_params(TEST_SPECS[t], frames[TEST_SPECS[t]["export"]].columns) for t in tests
+    }
+    baselines = baselines or {}
+    stored_tests = [t for t in tests if baselines.get(TEST_SPECS[t]["export"]) is not None]
+    initial_state = None
+    if stored_tests:
+        parts = [long_state(baselines[TEST_SPECS[t]["export"]], [t], params_by_test) for t in stored_tests]
+        initial_state = {f: pd.concat([part[f] for part in parts]) for f in STATE_FIELDS}
+
+    long, params = long_frame(frames, tests, params_by_test)
+    long, final_state = add_parameter_classes(long, params, initial_state)
+
+    results = {}
+    for test in tests:
+        df = spec_frame(long, test, params_by_test[test])
+        add_phase_classes(df, test)
+        df = drop_empty_tests(df, test, params_by_test[test])
+        results[test] = {
+            "frame": df,
+            "outputs": split_outputs(df, test, params_by_test[test]),
+            "params": params_by_test[test],
+        }
+    return results, export_state(final_state, tests, params_by_test)
+
+# -------------------------------------------------------------
+# 10. RUN: CLASSIFY + SAVE CSVs + BASELINE STATE + TEAM SNAPSHOT
+#     full        -> overwrite the daily CSVs (and reseed the baseline state)
+#     incremental -> classify only tests newer than the stored baseline
+#                    watermark, append them, then reload the full
+#                    history for the snapshot / PDF steps
+#                    (falls back to "full" per export on the first run,
+#                    or when tests dated before the watermark turn up
+#                    that were never classified)
+#     streaming   -> same result as "full", but each export is read in
+#                    chunks and classified in buckets of whole players,
+#                    so memory stays flat for very large exports
+#     The classified frames are also returned in memory, so a caller
+#     (the overview site builder) can use them without re-reading the
+#     CSVs; a "full" run can skip the CSVs / baseline state altogether.
+# -------------------------------------------------------------
+def tidy_daily(out):
+    out[DATE_COL] = pd.to_datetime(out[DATE_COL], errors="coerce")
+    return encode_class_columns(out)
+
+def read_daily_csv(path):
+    return tidy_daily(pd.read_csv(path))
+
+def daily_paths(tests, outputs):
+    return {(t, phase): outputs[t][phase] for t in tests for phase in TEST_SPECS[t]["phases"]}
+
+def join_phases(daily):
+    # phase CSVs of one test are written row for row from the same frame,
+    # so they line up by row; columns shared by the phases are kept once.
+    # A stale or partly appended CSV would pair rows with the wrong
+    # tests, so the (player, date) keys must match row for row.
+    df, first = None, None
+    for phase, out_df in daily.items():
+        if df is None or df.empty:
+            df, first = out_df, phase
+        elif len(out_df):
+            keys = [PLAYER_COL, DATE_COL]
+            if not (df.index.equals(out_df.index) and df[keys].equals(out_df[keys])):
+                raise ValueError(
+                    f"The {first} and {phase} daily rows do not line up by (player, date); "
+                    "rerun the classifier in full mode to rewrite the daily CSVs."
+                )
+            df = df.join(out_df[[c for c in out_df.columns if c not in df.columns]])
+    return df
+
+def team_snapshot(team_df, test, path=None):
+    team_df = team_df.sort_values("LTD", ascending=False)
+    if path is not None:
+        team_df[[c for c in team_columns(test) if c in team_df.columns]].to_csv(path, index=False)
+        print(f"Saved {test} team snapshot CSV to:", path)
+    return team_df
+
+def print_params(test, params):
+    spec = TEST_SPECS[test]
+    print(f"{test} phase parameters:", phase_inputs(test, params))
+    print(f"{test} standalone classified params:", [spec_column(spec, p) for p in spec["other"] if p in params])
+
+def run_tests(inputs, tests, outputs, baseline_files, run_mode="full", cache_dir=None, write_csv=True):
+    """
+    inputs:         export name -> raw VALD export path (one load per export,
+                    shared by every test / leg spec reading it)
+    tests:          TEST_SPECS keys to classify together
+    outputs:        test -> {phase: daily CSV path, ..., "Team": snapshot CSV path}
+    baseline_files: export name -> baseline state JSON path
+    write_csv:      False -> "full" runs keep everything in memory and leave
+                    the CSVs / baseline state untouched
+
+    Returns None when an incremental run finds no new tests, else a dict:
+      "params"  -> test -> phase -> classified phase input columns
+      "team"    -> test -> team snapshot frame (latest test first)
+      "daily"   -> test -> classified daily rows, all phases on one row
+                   (full history; None for streaming runs)
+      "players" -> iterator of (player, {test: {phase: daily rows}}) for
+                   the players whose pages need (re)drawing
+    """
+    if not write_csv and run_mode != "full":
+        raise ValueError(f"A {run_mode!r} run keeps its history in the daily CSVs; use write_csv=True.")
+    if run_mode == "streaming":
+        return _run_streaming(inputs, tests, outputs, baseline_files)
+
+    frames, baselines, run_watermarks = {}, {}, {}
+    for export in exports_for_tests(tests):
+        export_tests = [t for t in tests if TEST_SPECS[t]["export"] == export]
+        baseline = None
+        if run_mode == "incremental":
+            baseline = load_baseline(baseline_files[export])
+            if baseline is None or not all(os.path.exists(p) for p in daily_paths(export_tests, outputs).values()):
+                print(f"No {export} baseline state / daily CSVs yet -> running a full rebuild.")
+                baseline = None
+
+        df = sort_tests(load_vald_export(inputs[export], export, cache_dir=cache_dir))
+        run_watermarks[export] = latest_watermarks(df, PLAYER_COL, DATE_COL, TIME_COL)
+        if baseline is not None:
+            missed = unprocessed_rows(df, baseline, export, PLAYER_COL, DATE_COL, TIME_COL)
+            if missed:
+                print(
+                    f"WARNING: {sum(missed.values())} {export} test(s) dated at or before the last run "
+                    f"were never classified ({', '.join(sorted(missed))}) -> running a full rebuild."
+                )
+                baseline = None
+        if baseline is not None:
+            df = df.loc[rows_after_watermark(df, baseline, export, PLAYER_COL, DATE_COL, TIME_COL)]
+            if df.empty:
+                print(f"No new {export} tests since the last run.")
+                continue
+            print(f"Incremental run: {len(df)} new {export} test(s) for {df[PLAYER_COL].nunique()} player(s).")
+        frames[export] = df
+        baselines[export] = baseline
+
+    if not frames:
+        return None
+    tests = [t for t in tests if TEST_SPECS[t]["export"] in frames]
+
+    results, state = classify_tests(frames, tests, baselines)
+    for test in tests:
+        print_params(test, results[test]["params"])
+    updated_players = np.unique(np.concatenate(
+        [results[t]["frame"][PLAYER_COL].dropna().to_numpy(dtype=object) for t in tests]
+    ))
+
+    for test in tests:
+        if not write_csv:
+            continue
+        if baselines[TEST_SPECS[test]["export"]] is None:
+            for phase, out_df in results[test]["outputs"].items():
+                out_df.to_csv(outputs[test][phase], index=False)
+                print(f"Saved {test} {phase} CSV to:", outputs[test][phase])
+            continue
+
+        for phase, out_df in results[test]["outputs"].items():
+            out_path = outputs[test][phase]
+            header = pd.read_csv(out_path, nrows=0).columns
+            out_df.reindex(columns=header).to_csv(out_path, mode="a", header=False, index=False)
+            print(f"Appended {len(out_df)} row(s) to:", out_path)
+
+        daily = {phase: read_daily_csv(outputs[test][phase]) for phase in results[test]["outputs"]}
+        results[test]["outputs"] = daily
+        results[test]["frame"] = join_phases(daily)
+
+    # the baseline state belongs with the daily CSVs it was built alongside
+    if write_csv:
+        for export in frames:
+            baseline = baselines[export] or new_baseline()
+            update_baseline(baseline, export, state[export], run_watermarks[export])
+            save_baseline(baseline_files[export], baseline)
+            print("Saved baseline state to:", baseline_files[export])
+
+    team = {
+        t: team_snapshot(
+            team_snapshot_rows(results[t]["frame"], t), t, outputs[t]["Team"] if write_csv else None
+        )
+        for t in tests
+    }
+
+    def player_frames():
+        for player in updated_players:
+            yield player, {
+                t: {phase: out[out[PLAYER_COL] == player] for phase, out in results[t]["outputs"].items()}
+                for t in tests
+            }
+
+    return {
+        "params": {t: phase_inputs(t, results[t]["params"]) for t in tests},
+        "team": team,
+        "daily": {t: results[t]["frame"] for t in tests},
+        "players": player_frames(),
+    }
+
+def _run_streaming(inputs, tests, outputs, baseline_files):
+    # header check for every export before any rows are read
+    export_cols = {export: list(resolve_columns(inputs[export], export)) for export in exports_for_tests(tests)}
+    params = {t: spec_params(TEST_SPECS[t], export_cols[TEST_SPECS[t]["export"]]) for t in tests}
+    for test in tests:
+        print_params(test, params[test])
+
+    team_parts = {t: [] for t in tests}
+    for export in export_cols:
+        export_tests = [t for t in tests if TEST_SPECS[t]["export"] == export]
+        state_parts, run_watermarks = [], {}
+        for i, bucket in enumerate(iter_player_buckets(inputs[export], export)):
+            bucket = sort_tests(bucket)
+            results, state = classify_tests({export: bucket}, export_tests)
+            for test in export_tests:
+                for phase, out_df in results[test]["outputs"].items():
+                    out_df.to_csv(outputs[test][phase], mode="w" if i == 0 else "a", header=(i == 0), index=False)
+                team_parts[test].append(team_snapshot_rows(results[test]["frame"], test))
+            state_parts.append(state[export])
+            run_watermarks.update(latest_watermarks(bucket, PLAYER_COL, DATE_COL, TIME_COL))
+            print(f"Classified {export} bucket {i + 1}: {bucket[PLAYER_COL].nunique()} player(s), {len(bucket)} test(s).")
+
+        if not state_parts:
+            raise ValueError(f"No {export} tests found in {inputs[export]}.")
+        for test in export_tests:
+            for phase in TEST_SPECS[test]["phases"]:
+                print(f"Saved {test} {phase} CSV to:", outputs[test][phase])
+
+        final_state = {f: pd.concat([part[f] for part in state_parts]) for f in STATE_FIELDS}
+        baseline = new_baseline()
+        update_baseline(baseline, export, final_state, run_watermarks)
+        save_baseline(baseline_files[export], baseline)
+        print("Saved baseline state to:", baseline_files[export])
+
+    team = {
+        t: team_snapshot(pd.concat(team_parts[t], ignore_index=True), t, outputs[t]["Team"])
+        for t in tests
+    }
+
+    def player_frames():
+        # read back one player at a time from the player-sorted daily CSVs
+        for player, rows in iter_joined_player_groups(daily_paths(tests, outputs)):
+            frames = {t: {} for t in tests}
+            for (test, phase), out in rows.items():
+                frames[test][phase] = tidy_daily(out)
+            yield player, frames
+
+    return {
+        "params": {t: phase_inputs(t, params[t]) for t in tests},
+        "team": team,
+        "daily": {t: None for t in tests},
+        "players": player_frames(),
+    }
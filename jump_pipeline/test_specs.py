@@ -0,0 +1,80 @@
+import re
+
+from jump_pipeline.phase_rules import ABSORPTION_LUT, GENERATION_LUT
+
+# -------------------------------------------------------------
+# TEST SPECS
+#   Every classified test / leg combination is one entry. Parameters
+#   are named without a leg suffix; a spec's leg ("L" / "R") maps them
+#   to its export columns ("Concentric Duration [ms] (L)"), except for
+#   the "shared" columns the export only has once (body weight).
+#
+#   export   -> VALD_SCHEMAS key of the raw export the rows come from
+#   derived  -> new parameter: (numerator, denominator), rounded 1 dp
+#   phases   -> phase name: (lookup table, its 3 input parameters);
+#               each phase gets its own daily CSV and a
+#               "{phase}_Class[_{leg}]" overall class
+#   other    -> classified parameters written to every phase CSV
+#   snapshot -> parameters / phases on the team snapshot
+#
+#   Adding a test type (e.g. drop jump) = one more entry here plus
+#   its columns in vald_schema.VALD_SCHEMAS.
+# -------------------------------------------------------------
+BODY_WEIGHT      = "BW [KG]"
+JUMP_HEIGHT      = "Jump Height (Imp-Mom) [cm]"
+BRAKING_DURATION = "Braking Phase Duration [ms]"
+DEPTH            = "Countermovement Depth [cm]"
+ECC_DECEL_FORCE  = "Eccentric Deceleration Mean Force [N]"
+CONC_DURATION    = "Concentric Duration [ms]"
+CONC_FORCE_BM    = "Concentric Mean Force / BM [N/kg]"
+ECC_FORCE_BM     = "Eccentric Mean Force / BM [N/kg]"
+
+def jump_spec(export, leg=""):
+    # NOTE: depth is included in both the generation and absorption outputs
+    return {
+        "export": export,
+        "leg": leg,
+        "shared": [BODY_WEIGHT],
+        "derived": {ECC_FORCE_BM: (ECC_DECEL_FORCE, BODY_WEIGHT)},
+        "phases": {
+            "Generation": (GENERATION_LUT, [CONC_DURATION, DEPTH, CONC_FORCE_BM]),   # PD, DEP, PF
+            "Absorption": (ABSORPTION_LUT, [BRAKING_DURATION, DEPTH, ECC_FORCE_BM]), # BD, DEP, BF
+        },
+        "other": [BODY_WEIGHT, JUMP_HEIGHT],
+        "snapshot": {"params": [BODY_WEIGHT, JUMP_HEIGHT], "phases": ["Absorption", "Generation"]},
+    }
+
+TEST_SPECS = {
+    "CMJ":   jump_spec("CMJ"),
+    "SLJ_L": jump_spec("SLJ", "L"),
+    "SLJ_R": jump_spec("SLJ", "R"),
+}
+
+LEG_SUFFIX = re.compile(r"^(.*) \((L|R)\)$")
+
+def split_leg(col):
+    # "Concentric Duration [ms] (L)" -> ("Concentric Duration [ms]", "L")
+    m = LEG_SUFFIX.match(col)
+    if m:
+        return m.group(1), m.group(2)
+    return col, ""
+
+def join_leg(param, leg):
+    return f"{param} ({leg})" if leg else param
+
+def spec_column(spec, param):
+    if param in spec["shared"]:
+        return param
+    return join_leg(param, spec["leg"])
+
+def phase_column(spec, phase):
+    return f"{phase}_Class_{spec['leg']}" if spec["leg"] else f"{phase}_Class"
+
+def spec_params(spec, export_cols):
+    # classified parameters (leg-less names) this export can provide:
+    # phase inputs first, then "other", in spec order
+    params = [p for _, inputs in spec["phases"].values() for p in inputs] + spec["other"]
+    return [
+        p for p in dict.fromkeys(params)
+        if p in spec["derived"] or spec_column(spec, p) in export_cols
+    ]
@@ -0,0 +1,134 @@
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (multi-threaded CSV parser)
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# -------------------------------------------------------------
+# VALD FORCEDECKS EXPORT SCHEMA
+#   The raw exports carry many columns the classifiers never use
+#   (Reps, Tags, ExternalId, Asym(%) and, for SLJ, the bilateral
+#   totals). Each test type declares the columns it needs and their
+#   dtypes; only those are parsed. Required columns are checked
+#   against the header before any data row is read.
+# -------------------------------------------------------------
+PLAYER_COL = "Name"
+DATE_COL   = "Date"
+TIME_COL   = "Time"
+
+CMJ_METRICS = [
+    "BW [KG]",
+    "Jump Height (Imp-Mom) [cm]",
+    "Braking Phase Duration [ms]",
+    "Countermovement Depth [cm]",
+    "Eccentric Deceleration Mean Force [N]",
+    "Concentric Duration [ms]",
+    "Concentric Mean Force / BM [N/kg]",
+]
+
+SLJ_LEG_METRICS = [
+    "Jump Height (Imp-Mom) [cm]",
+    "Braking Phase Duration [ms]",
+    "Countermovement Depth [cm]",
+    "Eccentric Deceleration Mean Force [N]",
+    "Concentric Duration [ms]",
+    "Concentric Mean Force / BM [N/kg]",
+]
+
+KEY_DTYPES = {PLAYER_COL: "str", DATE_COL: "str"}
+
+VALD_SCHEMAS = {
+    "CMJ": {
+        "required": {
+            **KEY_DTYPES,
+            "BW [KG]": "float64",
+            "Eccentric Deceleration Mean Force [N]": "float64",
+        },
+        "optional": {
+            TIME_COL: "str",
+            **{c: "float64" for c in CMJ_METRICS},
+        },
+    },
+    "SLJ": {
+        "required": {
+            **KEY_DTYPES,
+            "BW [KG]": "float64",
+            "Eccentric Deceleration Mean Force [N] (L)": "float64",
+            "Eccentric Deceleration Mean Force [N] (R)": "float64",
+        },
+        "optional": {
+            TIME_COL: "str",
+            **{f"{c} ({leg})": "float64" for leg in ["L", "R"] for c in SLJ_LEG_METRICS},
+        },
+    },
+}
+
+class MissingColumnsError(ValueError):
+    pass
+
+def clean_header(name):
+    return (
+        str(name)
+        .replace('\ufeff', '')   # BOM
+        .replace('\xa0', ' ')     # non-breaking space
+        .strip()
+    )
+
+def clean_headers(df):
+    df.columns = [clean_header(c) for c in df.columns]
+    return df
+
+def schema_dtypes(test_type):
+    schema = VALD_SCHEMAS[test_type]
+    return {**schema["required"], **schema["optional"]}
+
+def resolve_columns(path, test_type):
+    # header only: map cleaned column names -> raw header names
+    raw_header = pd.read_csv(path, nrows=0).columns
+    raw_by_clean = {clean_header(c): c for c in raw_header}
+
+    missing = [c for c in VALD_SCHEMAS[test_type]["required"] if c not in raw_by_clean]
+    if missing:
+        raise MissingColumnsError(
+            f"Required {test_type} column(s) {missing} not found in {path}.\n"
+            f"Available columns: {list(raw_by_clean)}"
+        )
+
+    return {c: raw_by_clean[c] for c in schema_dtypes(test_type) if c in raw_by_clean}
+
+def _finish_frame(df, dtypes):
+    df = clean_headers(df)
+    for c, dtype in dtypes.items():
+        if dtype == "float64" and c in df.columns and df[c].dtype != "float64":
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype("float64")
+    df = df[[c for c in dtypes if c in df.columns]]
+    df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="coerce")
+    return df
+
+def read_vald_export(path, test_type):
+    cols = resolve_columns(path, test_type)
+    dtypes = schema_dtypes(test_type)
+    raw_dtypes = {raw: dtypes[clean] for clean, raw in cols.items()}
+
+    try:
+        df = pd.read_csv(path, usecols=list(cols.values()), dtype=raw_dtypes, engine=CSV_ENGINE)
+    except ValueError:
+        # non-numeric junk in a metric column: parse as text, coerce like before
+        text_dtypes = {raw: "str" for raw in raw_dtypes}
+        df = pd.read_csv(path, usecols=list(cols.values()), dtype=text_dtypes, engine=CSV_ENGINE)
+
+    return _finish_frame(df, dtypes)
+
+def iter_vald_export(path, test_type, chunksize):
+    # same typed, pruned frame as read_vald_export, chunksize rows at a time
+    # (metrics are coerced per chunk, so junk text in one chunk is harmless)
+    cols = resolve_columns(path, test_type)
+    dtypes = schema_dtypes(test_type)
+    text_dtypes = {raw: "str" for clean, raw in cols.items() if dtypes[clean] == "str"}
+
+    reader = pd.read_csv(path, usecols=list(cols.values()), dtype=text_dtypes, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            yield _finish_frame(chunk, dtypes)
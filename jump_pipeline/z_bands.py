@@ -0,0 +1,43 @@
+import numpy as np
+
+from jump_pipeline.class_codes import AVG, HIGH, LOW, VERY_HIGH, VERY_LOW, from_codes
+from jump_pipeline.test_specs import split_leg
+
+# -------------------------------------------------------------
+# Z-SCORE BANDS (single place to configure classification cut-offs)
+#   z >= high -> High, z <= low -> Low, otherwise (or NaN z) -> Avg.
+#   Setting very_high / very_low splits off the outer Very High /
+#   Very Low bands; None leaves them off.
+#
+#   PARAM_BANDS overrides the defaults per parameter. Keys are the
+#   parameter name without a leg suffix (so one entry covers the CMJ
+#   column and both SLJ legs) or an exact column name.
+# -------------------------------------------------------------
+DEFAULT_BANDS = {"low": -1.0, "high": 1.0, "very_low": None, "very_high": None}
+
+PARAM_BANDS = {
+    # "Jump Height (Imp-Mom) [cm]": {"very_low": -2.0, "very_high": 2.0},
+}
+
+def bands_for(param=None):
+    bands = dict(DEFAULT_BANDS)
+    if param is not None:
+        bands.update(PARAM_BANDS.get(split_leg(param)[0], {}))
+        bands.update(PARAM_BANDS.get(param, {}))
+    return bands
+
+def z_band_codes(z, low=-1.0, high=1.0, very_low=None, very_high=None):
+    z = np.asarray(z, dtype="float64")
+    codes = np.full(z.shape, AVG, dtype=np.int8)
+    # NaN compares False everywhere, so it stays Avg; High wins a tie with Low
+    codes[z <= low] = LOW
+    codes[z >= high] = HIGH
+    if very_low is not None:
+        codes[z <= very_low] = VERY_LOW
+    if very_high is not None:
+        codes[z >= very_high] = VERY_HIGH
+    return codes
+
+def z_classes(z, param=None):
+    # z Series -> class Series with the bands configured for param
+    return from_codes(z_band_codes(z, **bands_for(param)), index=z.index)
@@ -0,0 +1,53 @@
+import os
+
+import pandas as pd
+
+from jump_pipeline.test_engine import run_tests
+from jump_pipeline.test_specs import TEST_SPECS
+
+# -------------------------------------------------------------
+# CLASSIFIER RUNS ON THE SAMPLE EXPORTS (shared by the tests)
+#   every output of a run goes to its own directory, named as the
+#   test / phase it belongs to
+# -------------------------------------------------------------
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_EXPORTS = {
+    "CMJ": os.path.join(REPO_ROOT, "Historical CMJ", "raw_VALD_cmj.csv"),
+    "SLJ": os.path.join(REPO_ROOT, "Historical SLJ", "raw_VALD_slj.csv"),
+}
+
+def export_tests(export):
+    return [t for t, spec in TEST_SPECS.items() if spec["export"] == export]
+
+def sample_export(export):
+    return pd.read_csv(SAMPLE_EXPORTS[export])
+
+def run_paths(out_dir, export):
+    os.makedirs(out_dir, exist_ok=True)
+    return {
+        "export": export,
+        "input": os.path.join(out_dir, f"raw_{export}.csv"),
+        "baseline": os.path.join(out_dir, f"{export}_Baseline_State.json"),
+        "outputs": {
+            t: {
+                **{phase: os.path.join(out_dir, f"{t}_{phase}.csv") for phase in TEST_SPECS[t]["phases"]},
+                "Team": os.path.join(out_dir, f"{t}_Team.csv"),
+            }
+            for t in export_tests(export)
+        },
+    }
+
+def run_sample(paths, export_df, run_mode):
+    # writes export_df as the run's raw export, then classifies it
+    export = paths["export"]
+    export_df.to_csv(paths["input"], index=False)
+    return run_tests(
+        {export: paths["input"]}, export_tests(export), paths["outputs"], {export: paths["baseline"]}, run_mode
+    )
+
+def daily_files(paths):
+    return [p for outputs in paths["outputs"].values() for phase, p in outputs.items() if phase != "Team"]
+
+def team_files(paths):
+    return [outputs["Team"] for outputs in paths["outputs"].values()]
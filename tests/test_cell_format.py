@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jump_pipeline.cell_format import format_frame, format_value, value_spec
+from jump_pipeline.test_specs import TEST_SPECS, spec_column
+
+# -------------------------------------------------------------
+# format_frame must give exactly the strings the original per-cell
+# formatters gave (copied below from the classifier scripts and the
+# overview builder), including .5 ties, negative values and blanks.
+# -------------------------------------------------------------
+DURATION_COLS = {
+    "Concentric Duration [ms]",
+    "Braking Phase Duration [ms]",
+    "Concentric Duration [ms] (L)",
+    "Braking Phase Duration [ms] (L)",
+    "Concentric Duration [ms] (R)",
+    "Braking Phase Duration [ms] (R)",
+}
+
+def old_format_value(col, val):
+    # PDF tables
+    if pd.isna(val) or val == "":
+        return ""
+    if col in ("Date", "LTD"):
+        return pd.to_datetime(val).strftime("%Y-%m-%d")
+    if col == "TTD":
+        return f"{int(val)}"
+    if col in ["Concentric Duration [ms]", "Braking Phase Duration [ms]"]:
+        return f"{int(round(float(val)))}"
+    return f"{float(val):.1f}"
+
+def old_format_number(col, val):
+    # overview site
+    x = float(val)
+    if pd.isna(x):
+        return ""
+    if col in DURATION_COLS:
+        return f"{round(x):.0f}"
+    return f"{x:.1f}"
+
+def old_format_z(z):
+    x = float(z)
+    if pd.isna(x):
+        return ""
+    return f"{x:.2f}"
+
+def old_class_to_arrow(text):
+    if text == "High":
+        return "↑"
+    if text == "Low":
+        return "↓"
+    if text == "Avg":
+        return "→"
+    return ""
+
+def sample_values(step, seed=0):
+    # every tie at this step (x.5, x.x5, x.xx5) around zero, plus random
+    # values and blanks
+    rng = np.random.default_rng(seed)
+    ties = np.arange(-2001, 2002) * step / 2
+    noise = rng.normal(0, 300, 2000) * rng.choice([1e-3, 1, 10], 2000)
+    return np.concatenate([ties, noise, [0.0, -0.0, 1e6 + 0.5, 0.49999999999999994, np.nan, np.nan]])
+
+@pytest.mark.parametrize("col", ["Concentric Duration [ms]", "Braking Phase Duration [ms] (L)"])
+def test_durations_match_old_whole_numbers(col):
+    values = sample_values(1)
+    got = format_frame(pd.DataFrame({col: values}), {col: value_spec(col)})[col].tolist()
+    assert got == [old_format_number(col, v) for v in values]
+    if col in ("Concentric Duration [ms]", "Braking Phase Duration [ms]"):
+        assert got == [old_format_value(col, v) for v in values]
+
+@pytest.mark.parametrize("col", ["Countermovement Depth [cm]", "BW [KG]", "Eccentric Mean Force / BM [N/kg] (R)"])
+def test_measures_match_old_one_decimal(col):
+    values = sample_values(0.1)
+    got = format_frame(pd.DataFrame({col: values}), {col: value_spec(col)})[col].tolist()
+    assert got == [old_format_value(col, v) for v in values]
+    assert got == [old_format_number(col, v) for v in values]
+
+def test_z_scores_match_old_two_decimals():
+    values = sample_values(0.01)
+    got = format_frame(pd.DataFrame({"z": values}), {"z": "2dp"})["z"].tolist()
+    assert got == [old_format_z(v) for v in values]
+
+def test_day_counts_and_dates_match_old_cells():
+    df = pd.DataFrame({
+        "TTD": [0, 1, 12, 365, np.nan],
+        "LTD": ["2025-01-02", "2024-12-31", "2025-03-04", None, "2025-11-30"],
+        "Date": [pd.Timestamp("2025-01-02 09:05"), pd.Timestamp("2024-12-31"), pd.NaT, pd.Timestamp("2025-03-04"),
+                 pd.Timestamp("2025-11-30 23:59:59")],
+    })
+    specs = {"TTD": value_spec("TTD"), "LTD": "date", "Date": "date"}
+    got = format_frame(df, specs)
+    for col in specs:
+        assert got[col].tolist() == [old_format_value(col, v) for v in df[col]]
+
+def test_arrows_match_old_cells():
+    classes = pd.Series(["High", "Low", "Avg", "", None, np.nan, "High", "Avg"])
+    got = format_frame(pd.DataFrame({"c": classes}), {"c": "arrow"})["c"].tolist()
+    assert got == [old_class_to_arrow(v) for v in classes]
+
+def test_whole_number_columns_are_the_old_duration_columns():
+    cols = {spec_column(spec, p) for spec in TEST_SPECS.values() for _, params in spec["phases"].values() for p in params}
+    cols |= {spec_column(spec, p) for spec in TEST_SPECS.values() for p in spec["other"]}
+    for col in cols:
+        assert (value_spec(col) == "int") == (col in DURATION_COLS), col
+
+def test_single_cells_match_the_column_pass():
+    for col, value in [("Concentric Duration [ms]", 212.5), ("BW [KG]", 80.25), ("BW [KG]", np.nan), ("TTD", 3)]:
+        assert format_value(col, value) == old_format_value(col, value)
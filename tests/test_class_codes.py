@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jump_pipeline.class_codes import (
+    BLANK, CLASS_LABELS, as_class, base_codes, class_codes, encode_class_columns, from_codes, is_class_col,
+)
+
+# -------------------------------------------------------------
+# Coded classes must round-trip to the string labels the classifiers
+# used to hold: Low / Avg / High (plus the Very Low / Very High z
+# bands), with blank, NaN and unknown labels as code -1, written back
+# to CSV as an empty field.
+# -------------------------------------------------------------
+LABELS = ["Low", "Avg", "High", "Very Low", "Very High"]
+
+def old_labels(values):
+    # the string columns as the classifiers wrote them ("" for blank)
+    return ["" if pd.isna(v) or str(v).strip() not in LABELS else str(v).strip() for v in values]
+
+SAMPLE = ["High", "Low", "Avg", "", None, np.nan, " High ", "Very Low", "Very High", "n/a", "avg"]
+
+def test_codes_round_trip_to_labels():
+    classes = as_class(pd.Series(SAMPLE, dtype=object))
+    codes = class_codes(classes)
+    assert codes.dtype == np.int8
+    assert codes.tolist() == [2, 0, 1, BLANK, BLANK, BLANK, 2, 3, 4, BLANK, BLANK]
+
+    back = from_codes(codes)
+    assert back.dtype == classes.dtype
+    assert back.astype(object).where(back.notna(), "").tolist() == old_labels(SAMPLE)
+    assert class_codes(back).tolist() == codes.tolist()
+
+def test_base_codes_fold_the_z_bands():
+    assert base_codes(pd.Series(SAMPLE, dtype=object)).tolist() == [2, 0, 1, -1, -1, -1, 2, 0, 2, -1, -1]
+    assert base_codes(from_codes(np.array([BLANK, 0, 1, 2, 3, 4], dtype=np.int8))).tolist() == [-1, 0, 1, 2, 0, 2]
+
+@pytest.mark.parametrize("values", [
+    pd.Series([np.nan, np.nan]),                 # an all-blank column read from CSV
+    pd.Series(["", ""], dtype="str"),
+    pd.Series([], dtype=object),
+])
+def test_blank_columns_are_all_blank_codes(values):
+    assert class_codes(values).tolist() == [BLANK] * len(values)
+
+def test_encoded_columns_write_the_old_csv_text(tmp_path):
+    df = pd.DataFrame({
+        "Name": ["A", "B", "C"],
+        "BW [KG]": [80.0, np.nan, 75.5],
+        "BW [KG]_class": ["High", "Avg", np.nan],
+        "Generation_Class": ["Low", "", "High"],
+    })
+    old_path, new_path = tmp_path / "old.csv", tmp_path / "new.csv"
+    df.to_csv(old_path, index=False)
+    encode_class_columns(df.copy()).to_csv(new_path, index=False)
+    assert new_path.read_text() == old_path.read_text()
+
+@pytest.mark.parametrize("col, expected", [
+    ("Jump Height (Imp-Mom) [cm]_class", True),
+    ("Concentric Duration [ms] (L)_class", True),
+    ("Generation_Class", True),
+    ("Absorption_Class_L", True),
+    ("Absorption_Class_R", True),
+    ("CMJ_GEN_OVR", True),
+    ("SLJ_L_ABS_OVR", True),
+    ("BW [KG]", False),
+    ("BW [KG]_z", False),
+    ("BW [KG]_class_avg", False),
+    ("Generation_Class_left", False),
+    ("Class", False),
+    ("OVR", False),
+])
+def test_class_column_names(col, expected):
+    assert is_class_col(col) is expected
+
+def test_labels_are_the_codes_order():
+    assert list(as_class(pd.Series(LABELS)).cat.codes) == list(range(len(CLASS_LABELS)))
@@ -0,0 +1,113 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jump_pipeline import export_cache
+from jump_pipeline.export_cache import _read_npz, _write_npz, load_vald_export
+from jump_pipeline.vald_schema import read_vald_export
+from sample_runs import SAMPLE_EXPORTS
+
+# -------------------------------------------------------------
+# The export cache must give back exactly the frame a fresh parse
+# gives, skip the parse while the export and schema are unchanged,
+# re-parse when either changes, and keep one cache file per export.
+# The NPZ fallback (no pyarrow) must keep dtypes and missing values.
+# -------------------------------------------------------------
+@pytest.fixture
+def npz_cache(monkeypatch):
+    monkeypatch.setattr(export_cache, "HAVE_PYARROW", False)
+
+@pytest.fixture
+def parses(monkeypatch):
+    # counts the CSV parses behind load_vald_export
+    calls = []
+    def counting_read(path, test_type):
+        calls.append(path)
+        return read_vald_export(path, test_type)
+    monkeypatch.setattr(export_cache, "read_vald_export", counting_read)
+    return calls
+
+@pytest.fixture
+def export_copy(tmp_path):
+    path = tmp_path / "raw_VALD_cmj.csv"
+    shutil.copy(SAMPLE_EXPORTS["CMJ"], path)
+    return str(path)
+
+def cache_files(cache_dir):
+    return sorted(os.listdir(cache_dir))
+
+def test_npz_round_trip_keeps_dtypes_and_missing_values(tmp_path):
+    df = pd.DataFrame({
+        "float": [1.5, np.nan, -0.0],
+        "int": np.array([1, 2, 3], dtype="int64"),
+        "bool": [True, False, True],
+        "date": [pd.Timestamp("2025-01-01"), pd.NaT, pd.Timestamp("2025-01-03 10:00")],
+        "str": pd.Series(["a", None, "c"], dtype="str"),
+        "object": pd.Series(["x", np.nan, ""], dtype=object),
+        "category": pd.Series(["Low", None, "High"], dtype="category"),
+    })
+    path = tmp_path / "frame.npz"
+    _write_npz(df, path)
+    pd.testing.assert_frame_equal(_read_npz(path), df)
+
+def test_unchanged_export_is_a_cache_hit(tmp_path, npz_cache, parses, export_copy):
+    cache_dir = tmp_path / "cache"
+    first = load_vald_export(export_copy, "CMJ", cache_dir)
+    second = load_vald_export(export_copy, "CMJ", cache_dir)
+
+    assert len(parses) == 1
+    assert [os.path.splitext(f)[1] for f in cache_files(cache_dir)] == [".npz"]
+    pd.testing.assert_frame_equal(second, first)
+    pd.testing.assert_frame_equal(second, read_vald_export(export_copy, "CMJ"))
+
+def test_changed_export_is_a_cache_miss(tmp_path, npz_cache, parses, export_copy):
+    cache_dir = tmp_path / "cache"
+    load_vald_export(export_copy, "CMJ", cache_dir)
+    old_files = cache_files(cache_dir)
+
+    df = pd.read_csv(export_copy)
+    df.iloc[:-1].to_csv(export_copy, index=False)
+    got = load_vald_export(export_copy, "CMJ", cache_dir)
+
+    assert len(parses) == 2
+    assert len(got) == len(df) - 1
+    assert len(cache_files(cache_dir)) == 1 and cache_files(cache_dir) != old_files
+
+def test_changed_schema_is_a_cache_miss(tmp_path, npz_cache, parses, export_copy, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    load_vald_export(export_copy, "CMJ", cache_dir)
+
+    schema_dtypes = export_cache.schema_dtypes
+    monkeypatch.setattr(export_cache, "schema_dtypes", lambda t: {**schema_dtypes(t), "Extra Metric [N]": "float64"})
+    load_vald_export(export_copy, "CMJ", cache_dir)
+    assert len(parses) == 2
+
+    monkeypatch.setattr(export_cache, "CACHE_VERSION", export_cache.CACHE_VERSION + 1)
+    load_vald_export(export_copy, "CMJ", cache_dir)
+    assert len(parses) == 3
+    assert len(cache_files(cache_dir)) == 1
+
+def test_stale_siblings_are_removed(tmp_path, npz_cache, export_copy):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    for name in ["raw_VALD_cmj.0123456789abcdef0123.npz", "raw_VALD_cmj.0123456789abcdef0123.parquet.tmp",
+                 "raw_VALD_slj.0123456789abcdef0123.npz"]:
+        (cache_dir / name).write_bytes(b"old")
+    load_vald_export(export_copy, "CMJ", cache_dir)
+
+    files = cache_files(cache_dir)
+    assert len(files) == 2
+    assert "raw_VALD_slj.0123456789abcdef0123.npz" in files   # another export's cache is kept
+
+def test_unreadable_cache_is_parsed_again(tmp_path, npz_cache, parses, export_copy, capsys):
+    cache_dir = tmp_path / "cache"
+    load_vald_export(export_copy, "CMJ", cache_dir)
+    (cache_dir / cache_files(cache_dir)[0]).write_bytes(b"not an npz file")
+
+    got = load_vald_export(export_copy, "CMJ", cache_dir)
+    assert len(parses) == 2
+    assert "could not read export cache" in capsys.readouterr().out
+    pd.testing.assert_frame_equal(got, read_vald_export(export_copy, "CMJ"))
@@ -0,0 +1,130 @@
+import filecmp
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jump_pipeline.baseline_store import (
+    baseline_state, latest_watermarks, load_baseline, new_baseline, rows_after_watermark, save_baseline,
+    unprocessed_rows, update_baseline,
+)
+from jump_pipeline.rolling_stats import expanding_prior_stats
+from sample_runs import SAMPLE_EXPORTS, daily_files, run_paths, run_sample, sample_export, team_files
+
+# -------------------------------------------------------------
+# Continuing from a saved baseline state must give the same prior
+# stats as one pass over every row, and the watermarks must pick
+# out exactly the rows the first run had not seen.
+# -------------------------------------------------------------
+PARAMS = ["Jump Height [cm]", "Peak Force (L) [N]", "Peak Force (R) [N]"]
+
+def sample_tests(seed=0):
+    rng = np.random.default_rng(seed)
+    pieces = []
+    for i, n in enumerate([1, 2, 9, 25, 40]):
+        values = np.round(rng.normal(50, 15, size=(n, len(PARAMS))), 1)
+        values[rng.random(values.shape) < 0.2] = np.nan
+        piece = pd.DataFrame(values, columns=PARAMS)
+        piece.insert(0, "Date", pd.date_range("2025-01-01", periods=n, freq="D"))
+        piece.insert(0, "Name", f"P{i:02d}")
+        pieces.append(piece)
+    return pd.concat(pieces, ignore_index=True)
+
+def seen_rows(df):
+    # first half of every player's tests (none for a one-test player)
+    pos = df.groupby("Name").cumcount()
+    return pos < df.groupby("Name")["Name"].transform("size") // 2
+
+def test_continuing_from_saved_baseline_matches_one_pass(tmp_path):
+    df = sample_tests()
+    seen = seen_rows(df)
+    full = expanding_prior_stats(df, "Name", PARAMS)
+
+    *_, state = expanding_prior_stats(df[seen], "Name", PARAMS, return_state=True)
+    path = str(tmp_path / "CMJ_Baseline_State.json")
+    save_baseline(path, update_baseline(new_baseline(), "CMJ", state, {}))
+
+    initial_state = baseline_state(load_baseline(path), "CMJ", PARAMS)
+    rest = expanding_prior_stats(df[~seen], "Name", PARAMS, initial_state=initial_state)
+    for got, expected in zip(rest, full):
+        np.testing.assert_array_equal(got.to_numpy(), expected.loc[~seen].to_numpy())
+
+def test_rows_after_watermark_are_the_unseen_rows():
+    df = sample_tests()
+    seen = seen_rows(df)
+    store = new_baseline()
+    store["watermarks"]["CMJ"] = latest_watermarks(df[seen], "Name", "Date", "Time")
+
+    assert rows_after_watermark(df, store, "CMJ", "Name", "Date", "Time").tolist() == (~seen).tolist()
+
+# -------------------------------------------------------------
+# An incremental run on top of an earlier run must leave the same
+# daily rows, team snapshot and baseline state as one full run over
+# the whole export.
+# -------------------------------------------------------------
+def older_part(export_df, quantile=0.8):
+    dates = pd.to_datetime(export_df["Date"])
+    return export_df[dates <= dates.quantile(quantile)]
+
+def read_sorted(path):
+    # appended rows sit at the end of the daily CSVs
+    df = pd.read_csv(path).sort_values(["Name", "Date"], kind="stable")
+    return df.reset_index(drop=True)
+
+def baseline_stats(path):
+    return pd.DataFrame(load_baseline(path)["stats"]).sort_values(["Name", "Test", "Leg", "Parameter"]).reset_index(drop=True)
+
+@pytest.mark.parametrize("export", list(SAMPLE_EXPORTS))
+def test_incremental_run_matches_full_run(tmp_path, export):
+    full_df = sample_export(export)
+    full = run_paths(tmp_path / "full", export)
+    run_sample(full, full_df, "full")
+
+    inc = run_paths(tmp_path / "inc", export)
+    run_sample(inc, older_part(full_df), "full")
+    assert run_sample(inc, full_df, "incremental") is not None
+
+    for got, expected in zip(daily_files(inc), daily_files(full)):
+        pd.testing.assert_frame_equal(read_sorted(got), read_sorted(expected))
+    for got, expected in zip(team_files(inc), team_files(full)):
+        assert filecmp.cmp(got, expected, shallow=False)
+    pd.testing.assert_frame_equal(baseline_stats(inc["baseline"]), baseline_stats(full["baseline"]))
+    assert load_baseline(inc["baseline"])["watermarks"] == load_baseline(full["baseline"])["watermarks"]
+
+    # nothing new -> nothing to do
+    assert run_sample(inc, full_df, "incremental") is None
+
+def test_back_dated_test_falls_back_to_full_rebuild(tmp_path):
+    full_df = sample_export("CMJ")
+    full = run_paths(tmp_path / "full", "CMJ")
+    run_sample(full, full_df, "full")
+
+    # one old test is only imported after the first run
+    inc = run_paths(tmp_path / "inc", "CMJ")
+    first = older_part(full_df)
+    run_sample(inc, first.drop(first.index[3]), "full")
+    run_sample(inc, full_df, "incremental")
+
+    for got, expected in zip(daily_files(inc) + team_files(inc), daily_files(full) + team_files(full)):
+        assert filecmp.cmp(got, expected, shallow=False)
+
+def test_same_day_test_without_time_is_not_skipped():
+    day = pd.to_datetime(["2025-01-01", "2025-01-02"])
+    seen = pd.DataFrame({"Name": ["A", "A"], "Date": day})
+    store = new_baseline()
+    store["watermarks"]["CMJ"] = latest_watermarks(seen, "Name", "Date", "Time")
+
+    # a second test on the watermark's day (no Time column), and a new player
+    now = pd.concat([seen, pd.DataFrame({"Name": ["A", "B"], "Date": day[[1, 0]]})], ignore_index=True)
+    assert rows_after_watermark(now, store, "CMJ", "Name", "Date", "Time").tolist() == [False, False, False, True]
+    assert unprocessed_rows(now, store, "CMJ", "Name", "Date", "Time") == {"A": 1}
+
+def test_watermark_compares_parsed_times():
+    seen = pd.DataFrame({"Name": ["A"], "Date": pd.to_datetime(["2025-01-02"]), "Time": ["9:05:00"]})
+    store = new_baseline()
+    store["watermarks"]["CMJ"] = latest_watermarks(seen, "Name", "Date", "Time")
+
+    # "10:00:00" < "9:05:00" as text, but it is the later test
+    now = pd.concat([seen, seen.assign(Time="10:00:00")], ignore_index=True)
+    assert rows_after_watermark(now, store, "CMJ", "Name", "Date", "Time").tolist() == [False, True]
+    assert unprocessed_rows(now, store, "CMJ", "Name", "Date", "Time") == {}
@@ -0,0 +1,131 @@
+import re
+import zlib
+
+import pytest
+
+from jump_pipeline.pdf_tables import add_table, document_renderer, table_digest, table_pdf
+
+# -------------------------------------------------------------
+# The native renderer writes the PDF by hand, so the tests read it
+# back by hand: every xref offset must point at its object, the
+# stream lengths must match, and the page tree must list the pages.
+# Text the standard fonts cannot show must never turn into "?".
+# -------------------------------------------------------------
+def sample_table(n_rows=3, title="Alice - CMJ history", name="Alice"):
+    return {
+        "title": title,
+        "header": ["Name", "Date", "Jump Height\n[cm]", "Class"],
+        "rows": [[name, f"2025-01-{i % 28 + 1:02d}", f"{30 + i / 10:.1f}", ["↑", "→", "↓", ""][i % 4]] for i in range(n_rows)],
+        "colors": [[None, None, ("#FF7276", "#840000"), None] for _ in range(n_rows)],
+        "fit_columns": False,
+    }
+
+def write_native(path, tables, rows_per_page=30):
+    with table_pdf(str(path), "native", rows_per_page) as pdf:
+        for table in tables:
+            add_table(pdf, table)
+
+def _unescape(text):
+    return re.sub(rb"\\(.)", rb"\1", text).decode("cp1252")
+
+def read_pdf(path):
+    # -> one list of shown strings per page, after checking the file structure
+    data = path.read_bytes()
+    assert data.startswith(b"%PDF-1.4\n")
+    xref_at = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", data).group(1))
+    head = re.match(rb"xref\n0 (\d+)\n", data[xref_at:])
+    size = int(head.group(1))
+    entries = data[xref_at + head.end():xref_at + head.end() + 20 * size]
+    assert entries[:20] == b"0000000000 65535 f \n"
+
+    objects = {}
+    for num in range(1, size):
+        entry = entries[20 * num:20 * (num + 1)]
+        assert entry.endswith(b" 00000 n \n")
+        offset = int(entry[:10])
+        assert data[offset:].startswith(b"%d 0 obj\n" % num), num
+        start = offset + len(b"%d 0 obj\n" % num)
+        objects[num] = data[start:data.index(b"\nendobj\n", start)]
+    trailer = data[xref_at + head.end() + 20 * size:]
+    assert trailer.startswith(b"trailer\n<< /Size %d /Root 1 0 R >>" % size)
+    assert objects[1] == b"<< /Type /Catalog /Pages 2 0 R >>"
+
+    kids = [int(k) for k in re.findall(rb"(\d+) 0 R", re.search(rb"/Kids \[(.*?)\]", objects[2]).group(1))]
+    assert b"/Count %d" % len(kids) in objects[2]
+    pages = []
+    for kid in kids:
+        assert objects[kid].startswith(b"<< /Type /Page /Parent 2 0 R")
+        stream = objects[int(re.search(rb"/Contents (\d+) 0 R", objects[kid]).group(1))]
+        length = int(re.search(rb"/Length (\d+)", stream).group(1))
+        body = stream[stream.index(b"stream\n") + 7:]
+        assert body[length:] == b"\nendstream"
+        content = zlib.decompress(body[:length])
+        pages.append([_unescape(t) for t in re.findall(rb"\(((?:\\.|[^\\)])*)\) Tj", content)])
+    return pages
+
+def test_native_pdf_is_well_formed(tmp_path):
+    path = tmp_path / "player.pdf"
+    write_native(path, [sample_table(), sample_table(title="Team overview")])
+
+    pages = read_pdf(path)
+    assert len(pages) == 2
+    assert pages[0][0] == "Alice - CMJ history"
+    assert pages[1][0] == "Team overview"
+    assert not (tmp_path / "player.pdf.tmp").exists()
+
+def test_native_pdf_is_reproducible(tmp_path):
+    write_native(tmp_path / "a.pdf", [sample_table(40)])
+    write_native(tmp_path / "b.pdf", [sample_table(40)])
+    assert (tmp_path / "a.pdf").read_bytes() == (tmp_path / "b.pdf").read_bytes()
+
+def test_table_digest_is_stable():
+    # pinned: the digest keys the PDF manifest across runs
+    assert table_digest([sample_table()]) == table_digest([sample_table()])
+    assert table_digest([sample_table()]) == "1d033e37d86425c991c97718ecfb874ed0b7b2c618f5334add6ef8feb3d78374"
+    assert table_digest([sample_table(name="Bob")]) != table_digest([sample_table()])
+
+def test_text_outside_cp1252_goes_to_matplotlib(tmp_path):
+    path = str(tmp_path / "player.pdf")
+    assert document_renderer(path, [sample_table(name="Chloé Müller")]) == "native"
+    assert document_renderer(path, [sample_table(name="Łukasz")]) == "matplotlib"
+    assert document_renderer(path, [sample_table(title="Łukasz - CMJ history")]) == "matplotlib"
+    assert document_renderer(path, [sample_table(name="Łukasz")], "matplotlib") == "matplotlib"
+
+def test_native_renderer_rejects_text_outside_cp1252(tmp_path):
+    path = tmp_path / "player.pdf"
+    with pytest.raises(UnicodeEncodeError):
+        write_native(path, [sample_table(name="Łukasz")])
+    assert not path.exists()
+    assert not (tmp_path / "player.pdf.tmp").exists()
+
+# -------------------------------------------------------------
+# Pagination: a table of n rows takes ceil(n / rows_per_page) pages
+# (at least one), every page repeats the title and header and holds
+# its own slice of the rows, and multi-page tables get footers.
+# -------------------------------------------------------------
+@pytest.mark.parametrize("n_rows, rows_per_page, n_pages", [
+    (0, 30, 1), (1, 30, 1), (30, 30, 1), (31, 30, 2), (95, 30, 4), (95, 10, 10), (95, None, 1),
+])
+def test_page_count_follows_rows_per_page(tmp_path, n_rows, rows_per_page, n_pages):
+    path = tmp_path / "player.pdf"
+    write_native(path, [sample_table(n_rows)], rows_per_page)
+
+    pages = read_pdf(path)
+    assert len(pages) == n_pages
+    footers = [page[-1] for page in pages]
+    if n_pages > 1:
+        assert footers == [f"Page {i} of {n_pages}" for i in range(1, n_pages + 1)]
+    else:
+        assert not footers[0].startswith("Page ")
+
+def test_title_and_header_repeat_on_every_page(tmp_path):
+    table = sample_table(25)
+    path = tmp_path / "player.pdf"
+    write_native(path, [table], rows_per_page=10)
+
+    header = ["Name", "Date", "Jump Height", "[cm]", "Class"]
+    for i, page in enumerate(read_pdf(path)):
+        assert page[:1 + len(header)] == [table["title"]] + header
+        # rows of this page only (arrow cells are drawn from the Symbol font)
+        dates = [text for text in page if text.startswith("2025-")]
+        assert dates == [row[1] for row in table["rows"][10 * i:10 * (i + 1)]]
@@ -0,0 +1,60 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jump_pipeline.phase_rules import (
+    ABSORPTION_LUT, GENERATION_LUT, classify_absorption, classify_generation, phase_classes,
+)
+
+# -------------------------------------------------------------
+# The lookup tables must give what the original if/else classifiers
+# gave for every Low/Avg/High combination, and a blank class when any
+# input is missing (4 x 4 x 4 cases). EXPECTED pins the original
+# outputs, in product(Low, Avg, High) order (L/A/H), so a change to
+# the readable rules is caught as well.
+# -------------------------------------------------------------
+LABELS = ["Low", "Avg", "High"]
+SHORT = {"L": "Low", "A": "Avg", "H": "High"}
+
+EXPECTED = {
+    "generation": "AHHLHHHHHLLHLAHLHHLLLLLHLLA",
+    "absorption": "ALLLHHHHHLLHLAHLHHLLLLLHHHA",
+}
+RULES = {
+    "generation": (classify_generation, GENERATION_LUT),
+    "absorption": (classify_absorption, ABSORPTION_LUT),
+}
+
+def class_frame(combos):
+    return pd.DataFrame(list(combos), columns=["a", "b", "c"])
+
+@pytest.mark.parametrize("phase", list(RULES))
+def test_scalar_rules_match_original_classifier(phase):
+    rule, _ = RULES[phase]
+    got = [rule(*combo) for combo in product(LABELS, repeat=3)]
+    assert got == [SHORT[c] for c in EXPECTED[phase]]
+
+def labels(classes):
+    # classes -> labels, "" for blank
+    return ["" if pd.isna(c) else str(c) for c in classes]
+
+@pytest.mark.parametrize("phase", list(RULES))
+def test_lookup_matches_rules_with_missing_inputs(phase):
+    rule, lut = RULES[phase]
+    combos = list(product(LABELS + [np.nan], repeat=3))
+    assert len(combos) == 64
+
+    got = labels(phase_classes(class_frame(combos), lut, ["a", "b", "c"]))
+    assert got == [rule(*combo) for combo in combos]
+
+@pytest.mark.parametrize("phase", list(RULES))
+def test_very_low_and_very_high_fold_onto_low_and_high(phase):
+    _, lut = RULES[phase]
+    fold = {"Very Low": "Low", "Very High": "High"}
+    combos = list(product(LABELS + list(fold), repeat=3))
+    folded = [tuple(fold.get(c, c) for c in combo) for combo in combos]
+
+    got = labels(phase_classes(class_frame(combos), lut, ["a", "b", "c"]))
+    assert got == labels(phase_classes(class_frame(folded), lut, ["a", "b", "c"]))
@@ -0,0 +1,35 @@
+import filecmp
+import os
+
+import pytest
+
+from sample_runs import REPO_ROOT, SAMPLE_EXPORTS, run_paths, run_sample, sample_export
+
+# -------------------------------------------------------------
+# A full run over the sample exports must reproduce the daily CSVs
+# and team snapshots shipped in the repo byte for byte (they were
+# written by the original per-row classifiers).
+# -------------------------------------------------------------
+SHIPPED = {
+    "CMJ": {
+        ("CMJ", "Generation"): "Historical CMJ/Generation_Daily_Classes.csv",
+        ("CMJ", "Absorption"): "Historical CMJ/Absorption_Daily_Classes.csv",
+        ("CMJ", "Team"): "Historical CMJ/Team_CMJ_Snapshot.csv",
+    },
+    "SLJ": {
+        ("SLJ_L", "Generation"): "Historical SLJ/L_Generation_Daily_Classes.csv",
+        ("SLJ_L", "Absorption"): "Historical SLJ/L_Absorption_Daily_Classes.csv",
+        ("SLJ_L", "Team"): "Historical SLJ/Team_LSLJ_Snapshot.csv",
+        ("SLJ_R", "Generation"): "Historical SLJ/R_Generation_Daily_Classes.csv",
+        ("SLJ_R", "Absorption"): "Historical SLJ/R_Absorption_Daily_Classes.csv",
+        ("SLJ_R", "Team"): "Historical SLJ/Team_RSLJ_Snapshot.csv",
+    },
+}
+
+@pytest.mark.parametrize("export", list(SAMPLE_EXPORTS))
+def test_full_run_reproduces_shipped_outputs(tmp_path, export):
+    paths = run_paths(tmp_path, export)
+    run_sample(paths, sample_export(export), "full")
+
+    for (test, output), shipped in SHIPPED[export].items():
+        assert filecmp.cmp(paths["outputs"][test][output], os.path.join(REPO_ROOT, shipped), shallow=False), shipped
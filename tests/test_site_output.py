@@ -0,0 +1,46 @@
+import gzip
+
+import pytest
+
+from jump_pipeline.site_output import finish_site_file
+
+# -------------------------------------------------------------
+# The output stage must serve exactly the bytes the builder wrote:
+# scripts with template literals holding "//" and indentation, and
+# CSS strings with ": " in them, come back unchanged, and so do their
+# precompressed siblings.
+# -------------------------------------------------------------
+SOURCES = {
+    "chart.js": (
+        "function row(name, url) {\n"
+        "  // one table row\n"
+        "  return `<tr>\n"
+        "    <td>${name}</td>\n"
+        "    <td><a href=\"https://example.org//${url}\">link</a></td>\n"
+        "  </tr>`\n"
+        "}\n"
+    ),
+    "team.css": '.note::before { content: "Avg:  see notes"; }\n/* kept */\n',
+    "page.html": "<pre>\n  indented: text\n</pre>\n<script>\nconst s = `a //  b\n    c`\n</script>\n",
+}
+
+@pytest.mark.parametrize("name", list(SOURCES))
+def test_files_are_served_as_written(tmp_path, name):
+    path = tmp_path / name
+    data = SOURCES[name].encode("utf-8")
+    path.write_bytes(data)
+
+    _, size, gz, _ = finish_site_file(str(path))
+    assert path.read_bytes() == data
+    assert size == len(data)
+    assert gzip.decompress((tmp_path / f"{name}.gz").read_bytes()) == data
+    assert gz == (tmp_path / f"{name}.gz").stat().st_size
+
+def test_stale_siblings_are_removed_without_precompression(tmp_path):
+    path = tmp_path / "chart.js"
+    path.write_text(SOURCES["chart.js"], encoding="utf-8")
+    finish_site_file(str(path))
+
+    assert finish_site_file(str(path), precompress=False)[2:] == (None, None)
+    assert not (tmp_path / "chart.js.gz").exists()
+    assert not (tmp_path / "chart.js.br").exists()
@@ -0,0 +1,70 @@
+import filecmp
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from jump_pipeline import export_stream, test_engine
+from jump_pipeline.vald_schema import PLAYER_COL, read_vald_export
+from sample_runs import SAMPLE_EXPORTS, daily_files, run_paths, run_sample, sample_export, team_files
+
+# -------------------------------------------------------------
+# Streaming must hand the classifier every player's rows exactly
+# once, whole and in file order, with players in name order, however
+# the export is cut into chunks and player buckets.
+# -------------------------------------------------------------
+CUTS = [(37, 100), (1000, 1), (50_000, 200_000)]
+
+def by_player(df):
+    return df.sort_values(PLAYER_COL, kind="stable").reset_index(drop=True)
+
+@pytest.mark.parametrize("test_type", list(SAMPLE_EXPORTS))
+@pytest.mark.parametrize("chunksize, bucket_rows", CUTS)
+def test_buckets_hold_whole_players_in_name_order(test_type, chunksize, bucket_rows):
+    path = SAMPLE_EXPORTS[test_type]
+    export = read_vald_export(path, test_type).dropna(subset=[PLAYER_COL])
+    buckets = list(export_stream.iter_player_buckets(path, test_type, chunksize=chunksize, bucket_rows=bucket_rows))
+
+    players = [p for bucket in buckets for p in sorted(bucket[PLAYER_COL].unique())]
+    assert players == sorted(export[PLAYER_COL].unique())
+    for bucket in buckets:
+        assert len(bucket) <= bucket_rows or bucket[PLAYER_COL].nunique() == 1
+    pd.testing.assert_frame_equal(by_player(pd.concat(buckets)), by_player(export))
+
+@pytest.mark.parametrize("chunksize", [1, 7, 50_000])
+def test_player_groups_come_back_whole(tmp_path, chunksize):
+    export = by_player(read_vald_export(SAMPLE_EXPORTS["CMJ"], "CMJ").dropna(subset=[PLAYER_COL]))
+    path = tmp_path / "daily.csv"
+    export.to_csv(path, index=False)
+
+    groups = list(export_stream.iter_player_groups(path, chunksize=chunksize))
+    assert [player for player, _ in groups] == sorted(export[PLAYER_COL].unique())
+    assert [len(rows) for _, rows in groups] == export.groupby(PLAYER_COL).size().tolist()
+
+# -------------------------------------------------------------
+# A streaming run must write byte-identical daily CSVs, team
+# snapshots and baseline state to a full in-memory run, however
+# the export is cut into chunks and player buckets.
+# -------------------------------------------------------------
+@pytest.mark.parametrize("export", list(SAMPLE_EXPORTS))
+@pytest.mark.parametrize("chunksize, bucket_rows", CUTS)
+def test_streaming_run_matches_full_run(tmp_path, monkeypatch, export, chunksize, bucket_rows):
+    monkeypatch.setattr(
+        test_engine, "iter_player_buckets",
+        partial(export_stream.iter_player_buckets, chunksize=chunksize, bucket_rows=bucket_rows),
+    )
+    export_df = sample_export(export)
+    full = run_paths(tmp_path / "full", export)
+    run_sample(full, export_df, "full")
+    stream = run_paths(tmp_path / "stream", export)
+    run = run_sample(stream, export_df, "streaming")
+
+    for got, expected in zip(
+        daily_files(stream) + team_files(stream) + [stream["baseline"]],
+        daily_files(full) + team_files(full) + [full["baseline"]],
+    ):
+        assert filecmp.cmp(got, expected, shallow=False), got
+
+    # every player comes back once, in name order, for the PDF step
+    players = [player for player, _ in run["players"]]
+    assert players == sorted(export_df["Name"].dropna().unique())
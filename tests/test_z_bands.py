@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jump_pipeline import z_bands
+from jump_pipeline.class_codes import AVG, HIGH, LOW, VERY_HIGH, VERY_LOW
+from jump_pipeline.z_bands import bands_for, z_band_codes, z_classes
+
+# -------------------------------------------------------------
+# The default bands must classify like the original per-row
+# classify_z (z >= 1 High, z <= -1 Low, NaN Avg) right at the
+# cut-offs, and PARAM_BANDS overrides must reach the CMJ column and
+# both SLJ legs of a parameter.
+# -------------------------------------------------------------
+def classify_z(z):
+    # the original classifier
+    if pd.isna(z):
+        return "Avg"
+    if z >= 1:
+        return "High"
+    if z <= -1:
+        return "Low"
+    return "Avg"
+
+EDGES = [-np.inf, -2.0, -1.0 - 1e-12, -1.0, -1.0 + 1e-12, 0.0, 1.0 - 1e-12, 1.0, 1.0 + 1e-12, 2.0, np.inf, np.nan]
+
+def test_default_bands_match_original_classifier_at_the_edges():
+    got = z_classes(pd.Series(EDGES))
+    assert got.astype(str).tolist() == [classify_z(z) for z in EDGES]
+
+def test_very_bands_include_their_edges():
+    codes = z_band_codes(EDGES, very_low=-2.0, very_high=2.0)
+    assert codes.tolist() == [
+        VERY_LOW, VERY_LOW, LOW, LOW, AVG, AVG, AVG, HIGH, HIGH, VERY_HIGH, VERY_HIGH, AVG,
+    ]
+
+def test_high_wins_when_the_bands_overlap():
+    assert z_band_codes([0.0, 0.5, -0.5], low=0.0, high=0.0).tolist() == [HIGH, HIGH, LOW]
+
+@pytest.fixture
+def jump_height_bands(monkeypatch):
+    monkeypatch.setattr(z_bands, "PARAM_BANDS", {
+        "Jump Height (Imp-Mom) [cm]": {"very_low": -2.0, "very_high": 2.0},
+        "BW [KG]": {"low": -1.5, "high": 1.5},
+        "Concentric Duration [ms] (R)": {"high": 0.5},
+    })
+
+@pytest.mark.parametrize("col", [
+    "Jump Height (Imp-Mom) [cm]", "Jump Height (Imp-Mom) [cm] (L)", "Jump Height (Imp-Mom) [cm] (R)",
+])
+def test_param_bands_override_every_leg(jump_height_bands, col):
+    assert bands_for(col) == {"low": -1.0, "high": 1.0, "very_low": -2.0, "very_high": 2.0}
+    assert z_classes(pd.Series([-2.5, -1.5, 2.5]), col).astype(str).tolist() == ["Very Low", "Low", "Very High"]
+
+def test_param_bands_by_exact_column(jump_height_bands):
+    assert bands_for("Concentric Duration [ms] (R)")["high"] == 0.5
+    assert bands_for("Concentric Duration [ms] (L)")["high"] == 1.0
+    assert bands_for("BW [KG]") == {"low": -1.5, "high": 1.5, "very_low": None, "very_high": None}
+    assert bands_for("Countermovement Depth [cm]") == z_bands.DEFAULT_BANDS
+    assert bands_for() == z_bands.DEFAULT_BANDS